@@ -0,0 +1,74 @@
+"""Synthetic specs and configs of any size and nesting depth for benchmarks."""
+
+import json
+import os
+
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+
+PARAMETER_TEMPLATES = [
+    {"parameter_type": "int", "default": 1, "p1": 0, "p2": 10},
+    {"parameter_type": "float", "default": 0.5, "p1": 0.0, "p2": 1.0},
+    {"parameter_type": "bool", "default": True, "is_constant": False},
+    {"parameter_type": "categorical", "default": "a", "options": ["a", "b"]},
+    {"parameter_type": "list", "default": [1, 2], "value_type": "int"},
+    {"parameter_type": "str", "default": "text"},
+]
+CONFIG_VALUES = {
+    "int": 7,
+    "float": 0.25,
+    "bool": False,
+    "categorical": "b",
+    "list": [3, 4, 5],
+    "str": "value",
+}
+
+
+def get_flat_name(index, depth):
+    """Return the dotted name of parameter 'index', nested in 'depth' - 1 sections.
+
+    Each section level splits the parameters in two, so names share prefixes the
+    way real nested configs do.
+    """
+    sections = [
+        "level%d_%d" % (level, (index >> level) & 1) for level in range(depth - 1)
+    ]
+    return ".".join(sections + ["parameter_%d" % (index)])
+
+
+def generate_flat_spec(num_parameters, depth=1):
+    """Return a flattened spec cycling through every parameter type."""
+    flat_spec = {}
+    for index in range(num_parameters):
+        flat_name = get_flat_name(index, depth)
+        flat_spec[flat_name] = dict(
+            name=flat_name.split(".")[-1],
+            help="",
+            required=True,
+            **PARAMETER_TEMPLATES[index % len(PARAMETER_TEMPLATES)]
+        )
+    return flat_spec
+
+
+def generate_flat_config(flat_spec):
+    """Return flattened config values differing from the spec defaults."""
+    return {
+        name: CONFIG_VALUES[parameter_dict["parameter_type"]]
+        for name, parameter_dict in flat_spec.items()
+    }
+
+
+def write_spec_and_config(directory, num_parameters, depth=1):
+    """Write nested spec and config JSON files and return their filenames."""
+    flat_spec = generate_flat_spec(num_parameters, depth)
+    spec_filename = os.path.join(directory, "spec_%d_%d.json" % (num_parameters, depth))
+    config_filename = os.path.join(
+        directory, "config_%d_%d.json" % (num_parameters, depth)
+    )
+    with open(spec_filename, "w") as fd:
+        json.dump(ConfigurationFileParser.expand_flat_spec(flat_spec), fd)
+    with open(config_filename, "w") as fd:
+        json.dump(
+            ConfigurationFileParser.expand_flat_config(generate_flat_config(flat_spec)),
+            fd,
+        )
+    return spec_filename, config_filename
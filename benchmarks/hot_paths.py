@@ -0,0 +1,189 @@
+"""Time and peak memory of the load, flatten, expand, validate, sample and argparse paths.
+
+Usage: python -m benchmarks.hot_paths [--sizes 10 1000 100000] [--depths 1 5 20]
+    [--scenarios load_spec ...] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.generators import write_spec_and_config
+from dynaparse.dynamic_configuration import DynamicConfiguration
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.parsers.dynamic_argument_parser import DynamicArgumentParser
+
+
+class Case:
+    """Files and objects of one (size, depth) combination, built once."""
+
+    def __init__(self, directory, size, depth):
+        self.spec, self.config = write_spec_and_config(directory, size, depth)
+        with open(self.config) as fd:
+            self.nested_config = json.load(fd)
+        self.flat_config = ConfigurationFileParser.load_flat_config(self.config)
+        self.dynamic_config = DynamicConfiguration(
+            spec=self.spec, config=self.config, use_cache=False
+        )
+
+
+def parse_args_round_trip(case, lazy_dynamic_args=False):
+    """Parse the command line of a script given only '--spec' and '--config'."""
+    argv = ["benchmark.py", "--spec", case.spec, "--config", case.config]
+    with patch.object(sys, "argv", argv):
+        DynamicArgumentParser(lazy_dynamic_args=lazy_dynamic_args).parse_args()
+
+
+SCENARIOS = {
+    "load_spec": lambda case: DynamicConfiguration(spec=case.spec, use_cache=False),
+    "load_config": lambda case: DynamicConfiguration(
+        spec=case.spec, config=case.config, use_cache=False
+    ),
+    "flatten": lambda case: ConfigurationFileParser._flatten_nested_structure(
+        case.nested_config
+    ),
+    "expand": lambda case: ConfigurationFileParser.expand_flat_config(case.flat_config),
+    "validate": lambda case: case.dynamic_config.validate_many([case.nested_config]),
+    "sample": lambda case: case.dynamic_config.get_values(random=True),
+    "sample_batch_100": lambda case: case.dynamic_config.sample_batch(100, seed=0),
+    "argparse": parse_args_round_trip,
+    "argparse_lazy": lambda case: parse_args_round_trip(case, lazy_dynamic_args=True),
+}
+
+
+def measure(function, case, repeat):
+    """Return the best wall time (s) of several runs and the peak traced memory (MB)."""
+    function(case)  # Warm up lazy imports and caches
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(case)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function(case)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak_bytes / 2**20
+
+
+def get_metadata():
+    """Return the commit and environment the results were measured in."""
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+    }
+
+
+def run(sizes, depths, scenarios, repeat, max_seconds):
+    """Return results keyed by 'scenario/size=N/depth=D'.
+
+    Once a scenario takes more than 'max_seconds' at some depth, larger sizes at
+    that depth are skipped and recorded as None.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        too_slow = set()
+        for size in sorted(sizes):
+            for depth in depths:
+                case = Case(directory, size, depth)
+                for name in scenarios:
+                    key = "%s/size=%d/depth=%d" % (name, size, depth)
+                    if (name, depth) in too_slow:
+                        results[key] = None
+                        print("%-40s skipped (over %.0f s)" % (key, max_seconds))
+                        continue
+                    time_s, peak_mb = measure(SCENARIOS[name], case, repeat)
+                    results[key] = {"time_s": time_s, "peak_mb": peak_mb}
+                    print("%-40s %10.5f s %9.2f MB" % (key, time_s, peak_mb))
+                    if time_s > max_seconds:
+                        too_slow.add((name, depth))
+    return results
+
+
+def compare(baseline, results, threshold):
+    """Print time ratios against a baseline and return the keys slower than 'threshold'."""
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if result is None or old is None:
+            continue
+        ratio = result["time_s"] / max(old["time_s"], 1e-9)
+        flag = ""
+        if ratio > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            "%-40s %10.5f s -> %10.5f s (%.2fx)%s"
+            % (key, old["time_s"], result["time_s"], ratio, flag)
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000]
+    )
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument(
+        "--scenarios",
+        type=str,
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max_seconds",
+        type=float,
+        default=10.0,
+        help="Skip larger sizes of a scenario once a run takes longer than this.",
+    )
+    parser.add_argument("--output", type=str, default=None)
+    parser.add_argument(
+        "--compare", type=str, default=None, help="Baseline results file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Time ratio over the baseline reported as a regression.",
+    )
+    args = parser.parse_args()
+
+    results = run(
+        args.sizes, args.depths, args.scenarios, args.repeat, args.max_seconds
+    )
+    if args.output is not None:
+        with open(args.output, "w") as fd:
+            json.dump({"metadata": get_metadata(), "results": results}, fd, indent=4)
+    if args.compare is not None:
+        with open(args.compare) as fd:
+            baseline = json.load(fd)
+        print("\nCompared to %s:" % (baseline["metadata"]["commit"]))
+        regressions = compare(baseline["results"], results, args.threshold)
+        if regressions:
+            print("%d regression(s) over %.2fx" % (len(regressions), args.threshold))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Track 'python -X importtime' totals for common dynaparse entry points.
+
+Usage: python -m benchmarks.import_time [--repeat N] [--output results.json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import_dynaparse": "import dynaparse",
+    "import_argument_parser": "from dynaparse import DynamicArgumentParser",
+    "load_json_spec": (
+        "from dynaparse import DynamicConfiguration\n"
+        "DynamicConfiguration(spec='tests/data/spec_example.json', use_cache=False)"
+    ),
+}
+
+HEAVY_MODULES = ["numpy", "pydantic", "typeguard", "yaml"]
+
+
+def measure(statement):
+    """Return total import time (us) and loaded heavy modules for a statement."""
+    code = statement + "\nimport sys\nprint(','.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        total_us += int(line.split("|")[0].split(":")[1])
+    modules = set(result.stdout.strip().split(","))
+    return total_us, [name for name in HEAVY_MODULES if name in modules]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        results[name] = {
+            "min_total_us": min(total_us for total_us, _ in runs),
+            "heavy_modules": runs[0][1],
+        }
+        print(
+            "%-24s %8.1f ms  heavy modules: %s"
+            % (
+                name,
+                results[name]["min_total_us"] / 1000.0,
+                ", ".join(results[name]["heavy_modules"]) or "none",
+            )
+        )
+    if args.output is not None:
+        with open(args.output, "w") as fd:
+            json.dump(results, fd, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare strict (typeguard) and trusted spec construction.
+
+Usage: python -m benchmarks.schema_construction [--sizes 100 1000 10000] [--output results.json]
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.generators import generate_flat_spec
+from dynaparse.dynamic_configuration import DynamicConfiguration
+from dynaparse.util.schema_validator import SchemaValidator
+
+
+def build_strict(flat_spec):
+    dynamic_config = DynamicConfiguration()
+    for parameter_name, parameter_dict in flat_spec.items():
+        dynamic_config._append_parameter_from_dict(parameter_name, parameter_dict)
+    return dynamic_config._schema
+
+
+def build_trusted(flat_spec):
+    return SchemaValidator.build_schema(flat_spec)
+
+
+def measure(function, flat_spec, repeat):
+    """Return the best wall time (s) of several runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(flat_spec)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for size in args.sizes:
+        flat_spec = generate_flat_spec(size, depth=2)
+        strict_s = measure(build_strict, flat_spec, args.repeat)
+        trusted_s = measure(build_trusted, flat_spec, args.repeat)
+        results[size] = {"strict_s": strict_s, "trusted_s": trusted_s}
+        print(
+            "%7d parameters: strict %8.4f s  trusted %8.4f s  (%.1fx)"
+            % (size, strict_s, trusted_s, strict_s / trusted_s)
+        )
+    if args.output is not None:
+        with open(args.output, "w") as fd:
+            json.dump(results, fd, indent=4)
+
+
+if __name__ == "__main__":
+    main()
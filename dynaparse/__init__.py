@@ -1,2 +1,37 @@
-from dynaparse.dynamic_configuration import DynamicConfiguration
-from dynaparse.parsers.dynamic_argument_parser import DynamicArgumentParser
+import importlib
+import sys
+
+from dynaparse.version import __version__
+
+_LAZY_ATTRIBUTES = {
+    "ConfigWatcher": "dynaparse.config_watcher",
+    "DynamicConfiguration": "dynaparse.dynamic_configuration",
+    "DynamicArgumentParser": "dynaparse.parsers.dynamic_argument_parser",
+    "LayeredConfiguration": "dynaparse.layered_configuration",
+    "SharedSchema": "dynaparse.shared_schema",
+    "SweepRunner": "dynaparse.sweep_runner",
+    "TrialArchive": "dynaparse.trial_archive",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if sys.version_info < (3, 7):  # Module-level __getattr__ requires PEP 562
+    from dynaparse.config_watcher import ConfigWatcher
+    from dynaparse.dynamic_configuration import DynamicConfiguration
+    from dynaparse.layered_configuration import LayeredConfiguration
+    from dynaparse.parsers.dynamic_argument_parser import DynamicArgumentParser
+    from dynaparse.shared_schema import SharedSchema
+    from dynaparse.sweep_runner import SweepRunner
+    from dynaparse.trial_archive import TrialArchive
+else:
+
+    def __getattr__(name):
+        """Import public classes on first access to keep 'import dynaparse' cheap."""
+        if name not in _LAZY_ATTRIBUTES:
+            raise AttributeError("module 'dynaparse' has no attribute '%s'" % (name))
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(list(globals()) + __all__)
@@ -0,0 +1,280 @@
+from dataclasses import dataclass, field
+import logging
+import os
+import threading
+from types import MappingProxyType
+
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.util.bulk_caster import BulkCaster
+from dynaparse.util.parse_cache import get_file_version
+from dynaparse.util.schema_builder import SchemaBuilder
+from dynaparse.util.schema_validator import SchemaValidator
+from dynaparse.util.validation_report import ValidationReport
+
+DEFAULT_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable values of a watched configuration at one version.
+
+    'values' are flat, with defaults filled in, as 'get_values' returns them.
+    """
+
+    values: MappingProxyType
+    version: int = 0
+
+    def get_values(self, expand=False):
+        """Return a copy of the values, optionally expanded into nested dictionaries."""
+        values = dict(self.values)
+        return (
+            values if not expand else ConfigurationFileParser.expand_flat_config(values)
+        )
+
+
+@dataclass
+class ConfigDelta:
+    """Values that changed between two snapshots, keyed by flat name."""
+
+    added: dict = field(default_factory=dict)
+    changed: dict = field(default_factory=dict)  # name -> (old, new)
+    removed: dict = field(default_factory=dict)
+    version: int = 0
+    spec_changed: bool = False
+
+    def is_empty(self):
+        """Return whether no value changed."""
+        return not (self.added or self.changed or self.removed)
+
+    def get_names(self):
+        """Return the sorted names of every added, changed or removed value."""
+        return sorted({*self.added, *self.changed, *self.removed})
+
+
+class ConfigWatcher:
+    """Reload the config and spec files of a dynamic configuration when they change.
+
+    Files are polled by modification time and size. Only changed files are
+    re-parsed, and only the config values whose raw value differs are validated
+    against the schema (all of them when the spec changed). A reload is applied
+    as a whole or, if any value is invalid, not at all. Readers get consistent
+    values through 'snapshot', an immutable 'ConfigSnapshot' replaced in a single
+    assignment, so reading takes no lock.
+    """
+
+    def __init__(self, dynamic_config, interval=DEFAULT_INTERVAL, on_error=None):
+        """Instantiate a watcher of a configuration loaded from a config file.
+
+        'on_error' is called with the 'ValidationReport' of every rejected reload.
+        """
+        if not (
+            isinstance(dynamic_config.config, str)
+            and os.path.isfile(dynamic_config.config)
+        ):
+            raise Exception("Only configurations loaded from a file can be watched")
+        self.dynamic_config = dynamic_config
+        self.interval = interval
+        self.on_error = on_error
+        self.last_report = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._config_version = get_file_version(dynamic_config.config)
+        self._spec_version = (
+            get_file_version(dynamic_config.spec)
+            if dynamic_config.spec is not None
+            else None
+        )
+        # Versions of the last poll that reloaded, so rejected files aren't retried
+        self._polled_versions = (self._config_version, self._spec_version)
+        self._raw_values = ConfigurationFileParser.load_flat_config(
+            dynamic_config.config
+        )
+        self.snapshot = ConfigSnapshot(
+            MappingProxyType(dynamic_config.get_values(fill_defaults=True))
+        )
+
+    def add_callback(self, callback):
+        """Call 'callback' with the 'ConfigDelta' of every applied reload.
+
+        Exceptions raised by a callback are logged and don't affect the reload or
+        the other callbacks.
+        """
+        self._callbacks.append(callback)
+
+    def start(self):
+        """Poll the files every 'interval' seconds in a daemon thread."""
+        if self._thread is not None:
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop polling and wait for the polling thread to exit."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        """Start polling."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stop polling."""
+        self.stop()
+
+    def poll(self):
+        """Reload the files that changed since the last poll; return the applied delta, if any.
+
+        Files are compared with the versions of the last applied reload, so after a
+        rejected edit of one file, a change of the other re-reads both.
+        """
+        with self._lock:
+            dynamic_config = self.dynamic_config
+            config_version = get_file_version(dynamic_config.config)
+            spec_version = (
+                get_file_version(dynamic_config.spec)
+                if dynamic_config.spec is not None
+                else None
+            )
+            if config_version is None or (
+                dynamic_config.spec is not None and spec_version is None
+            ):  # Being replaced; check again on the next poll
+                return None
+            if (config_version, spec_version) == self._polled_versions:
+                return None
+            self._polled_versions = (config_version, spec_version)
+            spec_changed = spec_version != self._spec_version
+            config_changed = config_version != self._config_version
+            if not (spec_changed or config_changed):
+                return None
+            try:
+                delta = self._reload(config_changed, spec_changed)
+            except Exception as e:  # Malformed or partially written file
+                report = ValidationReport()
+                report.add_issue(None, None, "%s: %s" % (type(e).__name__, str(e)))
+                self._reject(report)
+                return None
+            if delta is None:
+                return None
+            self._config_version = config_version
+            self._spec_version = spec_version
+            self._notify(delta)
+            return delta
+
+    def _run(self):
+        """Poll until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def _reload(self, config_changed, spec_changed):
+        """Re-parse changed files, validate changed values and swap in the new state."""
+        dynamic_config = self.dynamic_config
+        raw_values = (
+            ConfigurationFileParser.load_flat_config(dynamic_config.config)
+            if config_changed
+            else self._raw_values
+        )
+        raw_schema, schema = dynamic_config._raw_schema, dynamic_config._schema
+        if spec_changed:
+            spec_config = type(dynamic_config)(
+                spec=dynamic_config.spec,
+                use_cache=dynamic_config.use_cache,
+                cache_dir=dynamic_config.cache_dir,
+                trusted=dynamic_config.trusted,
+            )
+            raw_schema = dict(spec_config._raw_schema)
+            schema = dict(spec_config._schema)
+            changed_names = list(raw_values)
+            removed_names = []
+            values = {}
+        else:
+            changed_names = [
+                name
+                for name, value in raw_values.items()
+                if name not in self._raw_values or self._raw_values[name] != value
+            ]
+            removed_names = [
+                name for name in self._raw_values if name not in raw_values
+            ]
+            values = dict(dynamic_config._values)
+            for name in removed_names:
+                values.pop(name, None)
+            if dynamic_config.spec is None and removed_names:  # Inferred schema
+                raw_schema, schema = dict(raw_schema), dict(schema)
+                for name in removed_names:
+                    raw_schema.pop(name, None)
+                    schema.pop(name, None)
+        new_names = [name for name in changed_names if name not in schema]
+        if dynamic_config.spec is None and new_names:  # Infer their schema
+            if schema is dynamic_config._schema:
+                raw_schema, schema = dict(raw_schema), dict(schema)
+            for name in new_names:
+                raw_schema[name] = SchemaBuilder.infer_from_flat_item(
+                    name, raw_values[name]
+                )
+                schema[name] = SchemaValidator.build_parameter(raw_schema[name])
+        casted_columns, report = BulkCaster.cast_columns(
+            schema, {name: [raw_values[name]] for name in changed_names}
+        )
+        if not report.is_valid():
+            self._reject(report)
+            return None
+        for name, (casted,) in casted_columns.items():
+            values[name] = casted
+        self.last_report = report
+        self._raw_values = raw_values
+        if schema is dynamic_config._schema:
+            dynamic_config._swap_state(values)
+        else:
+            dynamic_config._swap_state(values, raw_schema, schema)
+        new_values = dynamic_config.get_values(fill_defaults=True)
+        old_values = self.snapshot.values
+        if spec_changed:
+            names = set(old_values) | set(new_values)
+        else:
+            names = set(changed_names) | set(removed_names)
+        delta = self._get_delta(old_values, new_values, names, spec_changed)
+        self.snapshot = ConfigSnapshot(
+            MappingProxyType(new_values), self.snapshot.version + 1
+        )
+        delta.version = self.snapshot.version
+        return delta
+
+    def _notify(self, delta):
+        """Call every callback with an applied delta, logging the ones that raise."""
+        for callback in self._callbacks:
+            try:
+                callback(delta)
+            except Exception:  # The reload is applied; don't skip other callbacks
+                logger.exception(
+                    "Callback %r failed on configuration version %d",
+                    callback,
+                    delta.version,
+                )
+
+    def _reject(self, report):
+        """Keep the current snapshot and report why a reload was rejected."""
+        self.last_report = report
+        if self.on_error is not None:
+            self.on_error(report)
+
+    @staticmethod
+    def _get_delta(old_values, new_values, names, spec_changed):
+        """Return the delta of 'names' between two flat value dictionaries."""
+        delta = ConfigDelta(spec_changed=spec_changed)
+        for name in names:
+            if name not in old_values:
+                delta.added[name] = new_values[name]
+            elif name not in new_values:
+                delta.removed[name] = old_values[name]
+            elif old_values[name] != new_values[name]:
+                delta.changed[name] = (old_values[name], new_values[name])
+        return delta
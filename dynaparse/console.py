@@ -1,22 +1,108 @@
+import argparse
 import sys
 import warnings
 
-from dynaparse.dynamic_configuration import DynamicConfiguration
-
 HELP_STR = "usage: dynaparse init <filespec or importspec>\n"
+HELP_STR += "       dynaparse sweep --spec <spec> --target <target> [options]\n"
 HELP_STR += "\n"
-HELP_STR += "Autogenerate dynaparse config and spec from either\n"
+HELP_STR += "init: autogenerate dynaparse config and spec from either\n"
 HELP_STR += "a filespec or importspec.\n"
+HELP_STR += "\n"
+HELP_STR += "sweep: run a callable ('module:callable') or script ('script.py')\n"
+HELP_STR += "on random configurations from a spec across a process pool.\n"
+HELP_STR += "Run 'dynaparse sweep --help' for options.\n"
 
 
 warnings.filterwarnings("ignore")
 
 
+def get_sweep_arg_parser():
+    """Return the argument parser of the 'sweep' subcommand."""
+    arg_parser = argparse.ArgumentParser(
+        prog="dynaparse sweep",
+        description="Run a target on random configurations sampled from a spec.",
+    )
+    arg_parser.add_argument("--spec", type=str, required=True, help="Spec file.")
+    arg_parser.add_argument(
+        "--target",
+        type=str,
+        required=True,
+        help="'module:callable' receiving a config dictionary, or a script path.",
+    )
+    arg_parser.add_argument(
+        "--num_samples",
+        type=int,
+        default=None,
+        help="Number of configurations (default: 10, or the full grid).",
+    )
+    arg_parser.add_argument(
+        "--output",
+        type=str,
+        default="sweep.jsonl",
+        help="JSONL results file, or Parquet if it ends with '.parquet'.",
+    )
+    arg_parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)."
+    )
+    arg_parser.add_argument("--seed", type=int, default=None, help="Sampling seed.")
+    arg_parser.add_argument(
+        "--sampler",
+        type=str,
+        choices=["grid", "lhs", "random", "sobol"],
+        default="random",
+        help="Seeded random trials, a space-filling design or the full grid.",
+    )
+    arg_parser.add_argument(
+        "--shard_index", type=int, default=0, help="Shard of the sweep to run."
+    )
+    arg_parser.add_argument(
+        "--num_shards", type=int, default=1, help="Number of shards of the sweep."
+    )
+    return arg_parser
+
+
+def run_sweep(argv):
+    """Run the 'sweep' subcommand; arguments after '--' are passed to scripts."""
+    from dynaparse.sweep_runner import SweepRunner
+
+    script_args = []
+    if "--" in argv:
+        script_args = argv[argv.index("--") + 1 :]
+        argv = argv[: argv.index("--")]
+    args = get_sweep_arg_parser().parse_args(argv)
+    runner = SweepRunner(
+        spec=args.spec,
+        target=args.target,
+        num_samples=(
+            10
+            if args.num_samples is None and args.sampler != "grid"
+            else args.num_samples
+        ),
+        output=args.output,
+        max_workers=args.workers,
+        seed=args.seed,
+        script_args=script_args,
+        sampler=args.sampler,
+        shard_index=args.shard_index,
+        num_shards=args.num_shards,
+    )
+    summary = runner.run()
+    print(
+        "Ran %d trials (%d failed) with seed %d, results written to '%s'"
+        % (summary["num_trials"], summary["num_failed"], summary["seed"], args.output)
+    )
+    return summary["num_failed"]
+
+
 def main():
-    if "-h" in sys.argv or "--help" in sys.argv:
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        exit(1 if run_sweep(sys.argv[2:]) > 0 else 0)
+    elif "-h" in sys.argv or "--help" in sys.argv:
         print(HELP_STR)
         exit(0)
     elif sys.argv[1] == "init" and len(sys.argv) == 3:
+        from dynaparse.dynamic_configuration import DynamicConfiguration
+
         sys.path.append("")
         dc = DynamicConfiguration(sys.argv[2])
         config_name = "_config_auto.json"
@@ -2,22 +2,48 @@ import json
 import os
 import sys
 
+from dynaparse.parsers.binary_parser import BinaryParser
 from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
-from dynaparse.parsers.class_model_parser import ClassModelParser
 from dynaparse.parameters.boolean_parameter import BooleanParameter
 from dynaparse.parameters.categorical_parameter import CategoricalParameter
 from dynaparse.parameters.float_parameter import FloatParameter
 from dynaparse.parameters.int_parameter import IntParameter
 from dynaparse.parameters.list_parameter import ListParameter
 from dynaparse.parameters.string_parameter import StringParameter
+from dynaparse.util.bulk_caster import BulkCaster, INVALID
+from dynaparse.util.parse_cache import PARSE_CACHE, copy_mutable
 from dynaparse.util.schema_builder import SchemaBuilder
+from dynaparse.util.schema_validator import SchemaValidator
+from dynaparse.util.spec_cache import SpecCache
+
+DEFAULT_MAX_CONCURRENCY = 16
 
 
 class DynamicConfiguration:
-    def __init__(self, config=None, spec=None):
-        """Instantiate new dynamic configuration object."""
+    def __init__(
+        self,
+        config=None,
+        spec=None,
+        use_cache=True,
+        cache_dir=None,
+        streaming=False,
+        trusted=False,
+    ):
+        """Instantiate new dynamic configuration object.
+
+        Unless 'use_cache' is False, parsed spec and config files are memoized in
+        process (see 'invalidate_cache'), and compiled specs are cached on disk in
+        'cache_dir' (or $DYNAPARSE_CACHE_DIR) if one is given.
+        If 'streaming' is True, config and spec files are consumed as a stream of
+        flattened values instead of being loaded as a whole. If 'trusted' is True,
+        the spec is validated with precomputed per-type checks instead of typeguard.
+        """
         self.config = config
         self.spec = spec
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.streaming = streaming
+        self.trusted = trusted
         self._raw_schema = {}
         self._schema = {}
         self._values = {}
@@ -26,6 +52,90 @@ class DynamicConfiguration:
         if self.config is not None:
             self._load_config(self.config)
 
+    @staticmethod
+    def invalidate_cache(filename=None):
+        """Drop the in-process memoized parse of a file, or of every file."""
+        PARSE_CACHE.invalidate(filename)
+
+    @classmethod
+    async def aload(cls, config=None, spec=None, executor=None, **kwargs):
+        """Return a configuration built without blocking the running event loop.
+
+        Reading, parsing and flattening run in 'executor' (the loop's default
+        thread pool if None). With the in-process cache enabled, the spec and config
+        files are read and parsed concurrently before the values are cast. Other
+        keyword arguments are passed to the constructor.
+        """
+        import asyncio
+        import functools
+
+        loop = asyncio.get_event_loop()
+        if (
+            kwargs.get("use_cache", True)
+            and not kwargs.get("streaming", False)
+            and isinstance(spec, str)
+            and isinstance(config, str)
+            and os.path.isfile(config)
+        ):
+            await asyncio.gather(
+                loop.run_in_executor(
+                    executor, functools.partial(cls, spec=spec, **kwargs)
+                ),
+                loop.run_in_executor(executor, cls._get_memoized_flat_config, config),
+            )
+        return await loop.run_in_executor(
+            executor, functools.partial(cls, config=config, spec=spec, **kwargs)
+        )
+
+    @classmethod
+    async def aload_many(
+        cls,
+        pairs,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        executor=None,
+        return_exceptions=False,
+        **kwargs
+    ):
+        """Return a configuration per (config, spec) pair, loading at most 'max_concurrency' at once.
+
+        Results keep the order of 'pairs'. If 'return_exceptions' is True, failed
+        loads return their exception instead of the first one being raised.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load(config, spec):
+            async with semaphore:
+                return await cls.aload(config, spec, executor=executor, **kwargs)
+
+        return await asyncio.gather(
+            *[load(config, spec) for config, spec in pairs],
+            return_exceptions=return_exceptions
+        )
+
+    def watch(self, callback=None, interval=1.0, on_error=None, start=True):
+        """Return a 'ConfigWatcher' reloading this configuration's files when they change.
+
+        'callback' is called with a 'ConfigDelta' after every applied reload, and the
+        watcher's 'snapshot' always holds a consistent set of current values.
+        """
+        from dynaparse.config_watcher import ConfigWatcher
+
+        watcher = ConfigWatcher(self, interval=interval, on_error=on_error)
+        if callback is not None:
+            watcher.add_callback(callback)
+        return watcher.start() if start else watcher
+
+    def share(self, filename=None):
+        """Return a read-only 'SharedSchema' of this configuration for worker processes.
+
+        Workers attach to it by unpickling it, or with 'SharedSchema(filename)'.
+        """
+        from dynaparse.shared_schema import SharedSchema
+
+        return SharedSchema.create(self, filename)
+
     def has_spec(self):
         """Return whether schema are loaded."""
         return self.spec is not None and self._schema
@@ -37,17 +147,77 @@ class DynamicConfiguration:
             if not self._schema[name].required and name not in self._values:
                 continue
             if random:
-                to_return[name] = self._schema[name].sample()
+                to_return[name] = copy_mutable(self._schema[name].sample())
             elif name in self._values:
                 to_return[name] = self._values[name]
-            elif fill_defaults:
-                to_return[name] = self._schema[name].get_default()
+            elif fill_defaults:  # Parameters may be shared: copy their defaults
+                to_return[name] = copy_mutable(self._schema[name].get_default())
         return (
             to_return
             if expand is False
             else ConfigurationFileParser.expand_flat_config(to_return)
         )
 
+    def sample_batch(self, n, seed=None, as_records=False):
+        """Sample 'n' random configurations with one vectorized draw per parameter.
+
+        Returns a dictionary mapping each parameter name to an array of 'n' values, or
+        a list of 'n' value dictionaries (as 'get_values(random=True)' would return)
+        if 'as_records' is True.
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        columns = {
+            name: parameter.sample_batch(n, rng)
+            for name, parameter in self._get_sampled_schema().items()
+        }
+        return self._columns_to_records(columns, n) if as_records else columns
+
+    def sample_design(self, n, sampler="lhs", seed=None, as_records=False):
+        """Sample 'n' configurations with a named sampler.
+
+        'sampler' is 'lhs' (Latin hypercube) or 'sobol' (scrambled Sobol, requires
+        scipy) for designs that jointly fill the space of sampled parameters, or
+        'random' for independent trials (see 'sample_trial'). Returns columns or
+        records, as 'sample_batch' does.
+        """
+        from dynaparse.samplers.sampler_factory import SamplerFactory
+
+        columns = SamplerFactory.get_sampler(sampler, seed).sample(
+            self._get_sampled_schema(), n
+        )
+        return self._columns_to_records(columns, n) if as_records else columns
+
+    def sample_trial(self, index, seed=0):
+        """Return the values of random trial 'index', the same in any process."""
+        from dynaparse.samplers.trial_sampler import TrialSampler
+
+        return TrialSampler(seed).sample_trial(self._get_sampled_schema(), index)
+
+    def get_grid(self):
+        """Return a lazy 'GridSampler' over the categorical, boolean and quantized parameters."""
+        from dynaparse.samplers.grid_sampler import GridSampler
+
+        return GridSampler(self._get_sampled_schema())
+
+    def _get_sampled_schema(self):
+        """Return the parameters that 'get_values' would include."""
+        return {
+            name: parameter
+            for name, parameter in self._schema.items()
+            if parameter.required or name in self._values
+        }
+
+    @staticmethod
+    def _columns_to_records(columns, n):
+        """Convert a dictionary of 'n'-long arrays to a list of 'n' value dictionaries."""
+        if len(columns) == 0:
+            return [{} for _ in range(n)]
+        names = list(columns)
+        rows = zip(*[columns[name].tolist() for name in names])
+        return [dict(zip(names, row)) for row in rows]
+
     def get_values_as_str(self, random=False, fill_defaults=True):
         """Cast values as strings."""
         to_return = self.get_values(random, fill_defaults)
@@ -65,26 +235,68 @@ class DynamicConfiguration:
         else:
             raise Exception("Parameter name '%s' not recognized in schema" % (name))
 
-    def save_config(self, filename):
-        """Save configuration values to a file."""
+    def set_values(self, mapping):
+        """Set many parameter values at once, casting them one pass per parameter type.
+
+        Values that cast are set; the rest are left unchanged and listed in the
+        returned 'ValidationReport'.
+        """
+        casted_columns, report = BulkCaster.cast_columns(
+            self._schema, {name: [value] for name, value in mapping.items()}
+        )
+        for name, (casted,) in casted_columns.items():
+            if casted is not INVALID:
+                self._values[name] = casted
+        return report
+
+    def validate_many(self, configs):
+        """Validate many configs against the schema without setting any values.
+
+        Each config may be a nested dictionary or a config filename. Returns a
+        'ValidationReport' whose issue indices refer to positions in 'configs'.
+        """
+        columns = {}
+        indices = {}
+        for index, config in enumerate(configs):
+            if isinstance(config, dict):
+                flat_config = ConfigurationFileParser._flatten_nested_structure(config)
+            else:
+                flat_config = ConfigurationFileParser.load_flat_config(config)
+            for name, value in flat_config.items():
+                columns.setdefault(name, []).append(value)
+                indices.setdefault(name, []).append(index)
+        return BulkCaster.validate_columns(self._schema, columns, indices=indices)
+
+    def save_config(self, filename, format="json"):
+        """Save configuration values to a file, as JSON or in the compact "binary" format."""
+        raw_values_dict = self.get_values(random=False)
+        if format == "binary":
+            BinaryParser.dump_records(filename, [raw_values_dict])
+            return
+        if format != "json":
+            raise Exception("Unrecognized config format '%s'" % (format))
         with open(filename, "w") as fd:
-            raw_values_dict = self.get_values(random=False)
             json.dump(
                 ConfigurationFileParser.expand_flat_config(raw_values_dict),
                 fd,
                 indent=4,
             )
 
-    def save_spec(self, filename):
-        """Save schema to a directory."""
+    def save_spec(self, filename, format="json"):
+        """Save schema to a file, as JSON or in the compact "binary" format."""
+        if format not in ("json", "binary"):
+            raise Exception("Unrecognized spec format '%s'" % (format))
         self.spec = filename
+        if format == "binary":
+            BinaryParser.dump_spec(filename, self._raw_schema)
+            return
         expanded = ConfigurationFileParser.expand_flat_spec(self._raw_schema)
         with open(filename, "w") as fd:
             json.dump(expanded, fd, indent=4)
 
     def merge_with(self, other_dynamic_config, inplace=False):
         """Merge another dynamic config with this one.
-        
+
         If names are duplicated, the new dynamic config will overwrite this one.
         """
         if inplace:
@@ -105,36 +317,113 @@ class DynamicConfiguration:
         }
         return new_dynamic_config
 
+    def _swap_state(self, values, raw_schema=None, schema=None):
+        """Replace the values, and optionally the schema, each in a single assignment."""
+        if schema is not None:
+            self._raw_schema, self._schema = raw_schema, schema
+        self._values = values
+
     def _load_config(self, spec):
         """Load values and schema from a given spec."""
-        is_file = False
+        inferred_key = None
         if isinstance(spec, str) and os.path.isfile(spec):
-            is_file = True
-            raw_data = ConfigurationFileParser.load_flat_config(spec)
+            if self.streaming:
+                raw_items = ConfigurationFileParser.iter_flat_config(spec)
+            elif self.use_cache:
+                raw_items = self._get_memoized_flat_config(spec)
+                inferred_key = PARSE_CACHE.get_key("inferred_spec", spec)
+            else:
+                raw_items = ConfigurationFileParser.load_flat_config(spec).items()
         elif isinstance(spec, dict):
-            raw_data = ConfigurationFileParser._flatten_nested_structure(spec)
+            raw_items = ConfigurationFileParser._flatten_nested_structure(spec).items()
         else:
+            from dynaparse.parsers.class_model_parser import ClassModelParser
+
             nested_data = ClassModelParser(spec).to_dict()
-            raw_data = ConfigurationFileParser._flatten_nested_structure(nested_data)
-        if self.spec is None:
-            if is_file:
-                self._raw_schema = SchemaBuilder.infer_from_config_file(spec)
-            else:
-                self._raw_schema = SchemaBuilder.infer_from_flat_config(raw_data)
-            for parameter_name, parameter_dict in self._raw_schema.items():
-                self._append_parameter_from_dict(parameter_name, parameter_dict)
-        for value_name, value in raw_data.items():
+            raw_items = ConfigurationFileParser._flatten_nested_structure(
+                nested_data
+            ).items()
+        infer_schema = self.spec is None
+        if infer_schema and inferred_key is not None:
+            inferred = PARSE_CACHE.get(inferred_key)
+            if inferred is not None:
+                self._raw_schema.update(inferred[0])
+                self._schema.update(inferred[1])
+                infer_schema = False
+        inferred_raw_schema = {}
+        inferred_schema = {}
+        for value_name, value in raw_items:
+            if infer_schema:
+                parameter_dict = SchemaBuilder.infer_from_flat_item(value_name, value)
+                self._raw_schema[value_name] = parameter_dict
+                self._append_parameter_from_dict(
+                    value_name, parameter_dict, trusted=True
+                )
+                inferred_raw_schema[value_name] = parameter_dict
+                inferred_schema[value_name] = self._schema[value_name]
             self.set_value(value_name, value)
+        if infer_schema and inferred_key is not None:
+            PARSE_CACHE.put(inferred_key, (inferred_raw_schema, inferred_schema))
+
+    @staticmethod
+    def _get_memoized_flat_config(filename):
+        """Return the flattened items of a config file, parsed once per file version.
+
+        Values are copied, so that callers never share them.
+        """
+        key = PARSE_CACHE.get_key("config", filename)
+        raw_items = PARSE_CACHE.get(key)
+        if raw_items is None:
+            raw_items = tuple(
+                ConfigurationFileParser.load_flat_config(filename).items()
+            )
+            PARSE_CACHE.put(key, raw_items)
+        return [(name, copy_mutable(value)) for name, value in raw_items]
 
     def _load_spec(self, filename):
         """Load schema from a directory."""
         self.spec = filename
-        self._raw_schema = ConfigurationFileParser.load_flat_spec(filename)
-        for parameter_name, parameter_dict in self._raw_schema.items():
-            self._append_parameter_from_dict(parameter_name, parameter_dict)
+        memo_key = None
+        if self.use_cache:
+            memo_key = PARSE_CACHE.get_key("spec", filename, self.trusted)
+            compiled = PARSE_CACHE.get(memo_key)
+            if compiled is not None:
+                # Share the parameter objects, not the dictionaries holding them
+                self._raw_schema, self._schema = dict(compiled[0]), dict(compiled[1])
+                return
+        cache = None
+        if self.use_cache and SpecCache.is_enabled(self.cache_dir):
+            cache = SpecCache(self.cache_dir)
+            cache_key = cache.get_key(filename, self.trusted)
+            compiled = cache.load(cache_key)
+            if compiled is not None:
+                self._raw_schema, self._schema = compiled
+                PARSE_CACHE.put(memo_key, (dict(self._raw_schema), dict(self._schema)))
+                return
+        if self.streaming:
+            raw_items = ConfigurationFileParser.iter_flat_spec(filename)
+        else:
+            raw_items = ConfigurationFileParser.load_flat_spec(filename).items()
+        self._raw_schema = {}
+        for parameter_name, parameter_dict in raw_items:
+            self._raw_schema[parameter_name] = parameter_dict
+            self._append_parameter_from_dict(
+                parameter_name, parameter_dict, trusted=self.trusted
+            )
+        if cache is not None:
+            cache.save(cache_key, self._raw_schema, self._schema)
+        if memo_key is not None:
+            PARSE_CACHE.put(memo_key, (dict(self._raw_schema), dict(self._schema)))
 
-    def _append_parameter_from_dict(self, parameter_name, parameter_dict):
+    def _append_parameter_from_dict(
+        self, parameter_name, parameter_dict, trusted=False
+    ):
         """Append a parameter to the schema dictionary."""
+        if trusted:
+            self._schema[parameter_name] = SchemaValidator.build_parameter(
+                parameter_dict
+            )
+            return
         if parameter_dict["parameter_type"] == "int":
             initializer = IntParameter
         elif parameter_dict["parameter_type"] == "float":
@@ -153,41 +442,67 @@ class DynamicConfiguration:
             )
         self._schema[parameter_name] = initializer(**parameter_dict)
 
-    def append_to_arg_parser(self, arg_parser):
-        """Append arguments to an existing argparser."""
-        existing_arguments = [arg.dest for arg in arg_parser._get_optional_actions()]
-        for schema_name, schema_obj in self._schema.items():
+    @staticmethod
+    def get_command_line_names(argv=None):
+        """Return the set of option names given in 'argv' (default 'sys.argv'), in one pass."""
+        return {
+            token[2:].split("=", 1)[0]
+            for token in (sys.argv if argv is None else argv)
+            if token.startswith("--")
+        }
+
+    def append_to_arg_parser(self, arg_parser, names=None, defaults_from_values=False):
+        """Append arguments to an existing argparser, only for 'names' if given.
+
+        If 'defaults_from_values' is True, arguments default to the configured values
+        and are not required, so 'sys.argv' does not need patching.
+        """
+        existing_arguments = {arg.dest for arg in arg_parser._get_optional_actions()}
+        values = self.get_values(random=False) if defaults_from_values else None
+        for schema_name in self._schema if names is None else names:
             if schema_name in existing_arguments:
                 raise Exception(
-                    "Can't add dynamic config '%s', argument already exists" % (k)
+                    "Can't add dynamic config '%s', argument already exists"
+                    % (schema_name)
                 )
-            arg_parser.add_argument(
-                "--" + schema_name, **schema_obj.get_argparse_args()
-            )
+            argparse_args = self._schema[schema_name].get_argparse_args()
+            if defaults_from_values:
+                argparse_args["required"] = False
+                if schema_name in values:
+                    argparse_args["default"] = values[schema_name]
+            arg_parser.add_argument("--" + schema_name, **argparse_args)
 
-    def patch_sys_argv(self):
-        """Patch sys to include any values that might have been required."""
+    def get_patched_argv(self, argv):
+        """Return a copy of 'argv' including any values that might have been required."""
+        patched_argv = list(argv)
+        given_names = self.get_command_line_names(argv)
         for name, value_str in self.get_values_as_str(
             random=False, fill_defaults=True
         ).items():
-            if self._schema[name].required and "--" + name not in sys.argv:
-                sys.argv.append("--" + name)
+            if self._schema[name].required and name not in given_names:
+                patched_argv.append("--" + name)
                 if isinstance(value_str, list):
-                    for v in value_str:
-                        sys.argv.append(v)
+                    patched_argv.extend(value_str)
                 else:
-                    sys.argv.append(value_str)
+                    patched_argv.append(value_str)
+        return patched_argv
+
+    def patch_sys_argv(self):
+        """Patch sys to include any values that might have been required."""
+        sys.argv[:] = self.get_patched_argv(sys.argv)
 
     def validate_args(self, args):
         """Validate arg types for previously parsed args."""
-
-        for nested_argname in self._schema:
-            try:
-                obj = getattr(args, nested_argname)
-                self._schema[nested_argname].cast(obj)
-            except Exception as e:
-                if self._schema[nested_argname].required:
-                    raise Exception(e)
+        columns = {}
+        for name, parameter in self._schema.items():
+            if hasattr(args, name):
+                columns[name] = [getattr(args, name)]
+            elif parameter.required:
+                raise Exception("Required argument '%s' not found" % (name))
+        report = BulkCaster.validate_columns(self._schema, columns)
+        for issue in report.issues:
+            if self._schema[issue.name].required:
+                raise Exception(issue.message)
 
     def overwrite_args_with_random(self, args):
         """Overwrite args with randomly sampled values."""
@@ -195,9 +510,23 @@ class DynamicConfiguration:
         for name, value in values.items():
             setattr(args, name, value)
 
-    def overwrite_args_with_contents(self, args):
-        """Overwrite args with contents of this class."""
+    def overwrite_args_with_design(self, args, sampler, n, index, seed=0):
+        """Overwrite args with row 'index' of an 'n'-point design, random trial or grid point."""
+        if sampler == "random":
+            values = self.sample_trial(index, seed)
+        elif sampler == "grid":
+            values = self.get_grid()[index]
+        elif 0 <= index < n:
+            values = self.sample_design(n, sampler, seed, as_records=True)[index]
+        else:
+            raise Exception("Sample index %d out of range for %d samples" % (index, n))
+        for name, value in values.items():
+            setattr(args, name, value)
+
+    def overwrite_args_with_contents(self, args, argv=None):
+        """Overwrite args with contents of this class, except those given in 'argv' (default 'sys.argv')."""
         values = self.get_values(random=False)
+        given_names = self.get_command_line_names(argv)
         for name, value in values.items():
-            if "--" + name not in sys.argv:
+            if name not in given_names:
                 setattr(args, name, value)
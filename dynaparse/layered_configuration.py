@@ -0,0 +1,151 @@
+from collections import ChainMap
+
+from dynaparse.dynamic_configuration import DynamicConfiguration
+
+LAYERED_ATTRIBUTES = ("_raw_schema", "_schema", "_values")
+
+
+class LayeredMap(ChainMap):
+    """ChainMap whose merged view is materialized on the first read after a merge.
+
+    Merging layers costs O(layers); the next read merges them once in O(total
+    size), after which lookups cost a single dict probe. Writes go to the first
+    map only, so the other layers can be shared.
+    """
+
+    def __init__(self, *maps):
+        """Instantiate a map over 'maps', the first one receiving writes."""
+        super().__init__(*maps)
+        self._merged = None
+
+    def __getitem__(self, key):
+        return self._get_merged()[key]
+
+    def __contains__(self, key):
+        return key in self._get_merged()
+
+    def __iter__(self):
+        return iter(self._get_merged())
+
+    def __len__(self):
+        return len(self._get_merged())
+
+    def __bool__(self):
+        return any(self.maps)
+
+    def get(self, key, default=None):
+        return self._get_merged().get(key, default)
+
+    def __setitem__(self, key, value):
+        self.maps[0][key] = value
+        if self._merged is not None:
+            self._merged[key] = value
+
+    def __delitem__(self, key):
+        del self.maps[0][key]
+        self._merged = None
+
+    def freeze_top(self):
+        """Push a fresh writable map unless the current one is still empty."""
+        if len(self.maps[0]) > 0:
+            self.maps.insert(0, {})
+
+    def get_shared_layers(self):
+        """Freeze the writable map and return the maps that are never written to."""
+        self.freeze_top()
+        return self.maps[1:]
+
+    def insert_layers(self, layers):
+        """Insert layers right below the writable map, overriding older layers."""
+        self.freeze_top()
+        self.maps[1:1] = layers
+        self._merged = None
+
+    def _get_merged(self):
+        """Return the merged dictionary, materializing it if layers changed."""
+        if self._merged is None:
+            merged = {}
+            for mapping in reversed(self.maps):
+                merged.update(mapping)
+            self._merged = merged
+        return self._merged
+
+
+class LayeredConfiguration(DynamicConfiguration):
+    """Dynamic configuration that stacks merged configurations as copy-on-write layers.
+
+    The raw schema, schema and values are each a 'LayeredMap' whose first map
+    holds this configuration's own writes. Merging another layered configuration
+    pushes its maps as layers instead of copying them (plain configurations are
+    copied once), so 'merge_with' costs O(layers) and
+    the merged view is only built once, on the next read. Layers are shared and
+    never written to; call 'flatten' to materialize a plain configuration.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Instantiate a configuration, as 'DynamicConfiguration' would, as a single layer."""
+        super().__init__(*args, **kwargs)
+        for attribute in LAYERED_ATTRIBUTES:
+            setattr(self, attribute, LayeredMap({}, getattr(self, attribute)))
+
+    def get_num_layers(self):
+        """Return the number of value layers, including the writable top one."""
+        return len(self._values.maps)
+
+    def merge_with(self, other_dynamic_config, inplace=False):
+        """Merge another dynamic config on top of this one, without copying either.
+
+        If names are duplicated, the new dynamic config will overwrite this one.
+        """
+        merged = self if inplace else self._branch()
+        for attribute in LAYERED_ATTRIBUTES:
+            getattr(merged, attribute).insert_layers(
+                self._get_shared_layers(other_dynamic_config, attribute)
+            )
+        return merged
+
+    def flatten(self, inplace=False):
+        """Materialize the layers into a plain 'DynamicConfiguration', or into one layer."""
+        if inplace:
+            for attribute in LAYERED_ATTRIBUTES:
+                setattr(self, attribute, LayeredMap({}, dict(getattr(self, attribute))))
+            return self
+        flat = DynamicConfiguration(
+            use_cache=self.use_cache,
+            cache_dir=self.cache_dir,
+            streaming=self.streaming,
+            trusted=self.trusted,
+        )
+        flat.spec = self.spec
+        flat.config = self.config
+        for attribute in LAYERED_ATTRIBUTES:
+            setattr(flat, attribute, dict(getattr(self, attribute)))
+        return flat
+
+    def _swap_state(self, values, raw_schema=None, schema=None):
+        """Replace the values, and optionally the schema, each with a single layer."""
+        if schema is not None:
+            self._raw_schema = LayeredMap({}, raw_schema)
+            self._schema = LayeredMap({}, schema)
+        self._values = LayeredMap({}, values)
+
+    def _branch(self):
+        """Return a new layered configuration sharing this one's layers."""
+        branch = LayeredConfiguration()
+        for attribute in LAYERED_ATTRIBUTES:
+            layers = getattr(self, attribute).get_shared_layers()
+            setattr(branch, attribute, LayeredMap({}, *layers))
+        return branch
+
+    @staticmethod
+    def _get_shared_layers(dynamic_config, attribute):
+        """Return the maps of a configuration that can be shared as read-only layers.
+
+        Only a layered configuration's frozen layers are shared; the live
+        dictionaries of a plain configuration are copied, since it keeps writing
+        to them.
+        """
+        mapping = getattr(dynamic_config, attribute)
+        if isinstance(mapping, LayeredMap):
+            return mapping.get_shared_layers()
+        return [dict(mapping)]
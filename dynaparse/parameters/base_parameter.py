@@ -1,9 +1,67 @@
-from dataclasses import asdict, dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+import sys
+import threading
 
-from typeguard import check_type
+from dynaparse.util.parse_cache import copy_mutable
 
+_construction_state = threading.local()
 
-@dataclass
+
+@contextmanager
+def trusted_construction():
+    """Skip per-field type checks for parameters constructed within this context."""
+    was_trusted = getattr(_construction_state, "is_trusted", False)
+    _construction_state.is_trusted = True
+    try:
+        yield
+    finally:
+        _construction_state.is_trusted = was_trusted
+
+
+def get_init_fields(parameter):
+    """Return the fields of a parameter class or instance, without derived fields."""
+    return [
+        parameter_field for parameter_field in fields(parameter) if parameter_field.init
+    ]
+
+
+def derived_field():
+    """Return a field for an attribute that '_build_casters' derives from the others."""
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+def parameter_dataclass(cls):
+    """Make 'cls' a frozen dataclass, with __slots__ where dataclasses support them (3.10+).
+
+    Parameters are frozen so that configurations can share them: attributes
+    derived at construction time are 'derived_field's, set with
+    'object.__setattr__'. Slotted dataclasses are rebuilt by 'dataclass', so
+    methods call their base class explicitly instead of with zero-argument super().
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(frozen=True, slots=True)(cls)
+    return dataclass(frozen=True)(cls)
+
+
+def constant_batch(value, n):
+    """Return an object array repeating a single value 'n' times.
+
+    Lists and dictionaries are copied into each row, so that rows (and the
+    parameter's default) can be modified independently.
+    """
+    import numpy as np
+
+    batch = np.empty(n, dtype=object)
+    if isinstance(value, (list, dict)):
+        for index in range(n):
+            batch[index] = copy_mutable(value)
+    else:
+        batch.fill(value)
+    return batch
+
+
+@parameter_dataclass
 class BaseParameter:
     name: str
     help: str
@@ -11,19 +69,36 @@ class BaseParameter:
 
     def __post_init__(self):
         """Validate the input."""
-        for parameter, field in self.__dataclass_fields__.items():
+        if not getattr(_construction_state, "is_trusted", False):
+            self._check_field_types()
+        self._build_casters()
+
+    def _build_casters(self):
+        """Precompute any attributes derived from the fields."""
+        pass
+
+    def _check_field_types(self):
+        """Check every field against its annotation with typeguard."""
+        from typeguard import check_type
+
+        for parameter_field in get_init_fields(self):
+            parameter = parameter_field.name
             try:
-                check_type(parameter, getattr(self, parameter), field.type)
+                check_type(parameter, getattr(self, parameter), parameter_field.type)
             except TypeError:
                 if getattr(self, parameter) is not None:
                     raise TypeError(
                         "Parameter '%s' (value: '%s') type invalid, should be '%s'"
-                        % (parameter, str(getattr(self, parameter)), str(field.type))
+                        % (
+                            parameter,
+                            str(getattr(self, parameter)),
+                            str(parameter_field.type),
+                        )
                     )
 
     def cast(self, value):
         """Cast a value type 'int'."""
-        if value in [None, "None"]:
+        if value is None or (isinstance(value, str) and value == "None"):
             return None
         try:
             return self.get_typefunc()(value)
@@ -33,6 +108,22 @@ class BaseParameter:
                 % (self.name, str(value))
             )
 
+    def sample_batch(self, n, rng):
+        """Sample 'n' values at once; without a distribution, repeat the default."""
+        return constant_batch(self.get_default(), n)
+
+    def is_sampled(self):
+        """Return whether sampling can yield more than one value."""
+        return False
+
+    def get_grid_axis(self):
+        """Return the sequence of values to enumerate in a grid, or None to keep the default."""
+        return None
+
+    def from_unit(self, u):
+        """Map uniform [0, 1) values through the distribution; without one, repeat the default."""
+        return constant_batch(self.get_default(), len(u))
+
     def get_default(self):
         """Return the default value."""
         return self.default
@@ -47,7 +138,10 @@ class BaseParameter:
 
     def to_dict(self):
         """Return a dictionary representation of this class."""
-        return asdict(self)
+        return {
+            parameter_field.name: copy_mutable(getattr(self, parameter_field.name))
+            for parameter_field in get_init_fields(self)
+        }
 
     def is_list(self):
         """Default base class to 'not a list'."""
@@ -57,7 +151,7 @@ class BaseParameter:
         """Return a dictionary of argparse args."""
         args = {
             "type": self.get_argparse_type(),
-            "default": self.get_default(),
+            "default": copy_mutable(self.get_default()),
             "help": self.get_help(),
             "required": self.required,
         }
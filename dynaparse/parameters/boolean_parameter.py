@@ -1,8 +1,11 @@
 import argparse
 import random
-from dataclasses import dataclass
 
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import (
+    BaseParameter,
+    constant_batch,
+    parameter_dataclass,
+)
 
 
 def str2bool(v):
@@ -19,7 +22,7 @@ def str2bool(v):
         raise argparse.ArgumentTypeError("Boolean value expected")
 
 
-@dataclass
+@parameter_dataclass
 class BooleanParameter(BaseParameter):
     default: bool
     parameter_type: str = "bool"
@@ -29,6 +32,26 @@ class BooleanParameter(BaseParameter):
         """Sample a value from the pre-configured distribution."""
         return self.default if self.is_constant else random.choice([False, True])
 
+    def sample_batch(self, n, rng):
+        """Sample 'n' values from the pre-configured distribution in one draw."""
+        if self.is_constant:
+            return constant_batch(self.default, n)
+        return rng.integers(0, 2, size=n).astype(bool)
+
+    def is_sampled(self):
+        """Return whether the value is sampled rather than constant."""
+        return not self.is_constant
+
+    def from_unit(self, u):
+        """Map uniform [0, 1) values to booleans, or repeat a constant default."""
+        if self.is_constant:
+            return constant_batch(self.default, len(u))
+        return u >= 0.5
+
+    def get_grid_axis(self):
+        """Return [False, True], or None if the value is constant."""
+        return None if self.is_constant else [False, True]
+
     def get_typefunc(self):
         """Return bool."""
         return bool
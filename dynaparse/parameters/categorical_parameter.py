@@ -1,19 +1,23 @@
 import random
-from dataclasses import dataclass
 
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import (
+    BaseParameter,
+    derived_field,
+    parameter_dataclass,
+)
 from dynaparse.parameters.string_parameter import str_with_none
 
 
-@dataclass
+@parameter_dataclass
 class CategoricalParameter(BaseParameter):
     default: str
     options: list
     parameter_type: str = "categorical"
+    _option_set: frozenset = derived_field()
 
     def __post_init__(self):
         """Post-initialization validation method."""
-        super().__post_init__()
+        BaseParameter.__post_init__(self)
         if self.default not in self.options:
             raise Exception(
                 "Default value '%s' not in options list '%s'"
@@ -24,18 +28,57 @@ class CategoricalParameter(BaseParameter):
         """Sample a value from the pre-configured distribution."""
         return random.choice(self.options)
 
+    def sample_batch(self, n, rng):
+        """Sample 'n' values from the pre-configured distribution in one draw."""
+        return self._get_options_array()[rng.integers(0, len(self.options), size=n)]
+
+    def is_sampled(self):
+        """Return True."""
+        return True
+
+    def from_unit(self, u):
+        """Map uniform [0, 1) values to options, splitting [0, 1) into equal bins."""
+        import numpy as np
+
+        indices = np.minimum(
+            (u * len(self.options)).astype(np.int64), len(self.options) - 1
+        )
+        return self._get_options_array()[indices]
+
+    def _get_options_array(self):
+        """Return the options as a NumPy object array."""
+        import numpy as np
+
+        options = np.empty(len(self.options), dtype=object)
+        options[:] = self.options
+        return options
+
+    def get_grid_axis(self):
+        """Return the options."""
+        return self.options
+
     def get_typefunc(self):
-        """Return str."""
+        """Return str, restricted to the options list."""
+        return self._cast_option
 
-        def cast_type(x):
-            casted = str(x)
-            if casted not in self.options:
-                raise Exception(
-                    "Value '%s' not in options list '%s'" % (casted, self.options)
-                )
-            return casted
+    def _build_casters(self):
+        """Precompute the options set."""
+        try:
+            option_set = frozenset(self.options)
+        except TypeError:  # Unhashable or invalid options
+            option_set = None
+        object.__setattr__(self, "_option_set", option_set)
 
-        return cast_type
+    def _cast_option(self, x):
+        """Cast a value to str and check it against the options list."""
+        casted = str(x)
+        if casted not in (
+            self.options if self._option_set is None else self._option_set
+        ):
+            raise Exception(
+                "Value '%s' not in options list '%s'" % (casted, self.options)
+            )
+        return casted
 
     def get_argparse_type(self):
         """Return str."""
@@ -1,30 +1,70 @@
-import random
-from dataclasses import dataclass
+import math
 
-import numpy as np
-
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import BaseParameter, parameter_dataclass
+from dynaparse.util.distributions import normal_ppf
 
 float_with_none = lambda x: None if x == "None" else float(x)
 
 
-@dataclass
+@parameter_dataclass
 class FloatParameter(BaseParameter):
     default: float = None
     distribution: str = "uniform"
     p1: float = None
     p2: float = None
     parameter_type: str = "float"
+    step: float = None
 
     def sample(self):
         """Sample a value from the pre-configured distribution."""
+        import numpy as np
+
         if self.distribution == "uniform":
             return np.random.uniform(low=self.p1, high=self.p2, size=1)[0]
         elif self.distribution == "normal":
             return np.random.normal(loc=self.p1, scale=self.p2, size=1)[0]
+        elif self.distribution == "quantized_uniform":
+            return self.p1 + self.step * np.random.randint(0, self._get_num_steps() + 1)
 
         raise Exception("Unsupported distribution '%s'" % (self.distribution))
 
+    def sample_batch(self, n, rng):
+        """Sample 'n' values from the pre-configured distribution in one draw."""
+        if self.distribution == "uniform":
+            return rng.uniform(low=self.p1, high=self.p2, size=n)
+        elif self.distribution == "normal":
+            return rng.normal(loc=self.p1, scale=self.p2, size=n)
+        elif self.distribution == "quantized_uniform":
+            steps = rng.integers(0, self._get_num_steps(), size=n, endpoint=True)
+            return self.p1 + self.step * steps
+
+        raise Exception("Unsupported distribution '%s'" % (self.distribution))
+
+    def is_sampled(self):
+        """Return True."""
+        return True
+
+    def from_unit(self, u):
+        """Map uniform [0, 1) values through the pre-configured distribution."""
+        if self.distribution == "uniform":
+            return self.p1 + u * (self.p2 - self.p1)
+        elif self.distribution == "normal":
+            return self.p1 + self.p2 * normal_ppf(u)
+        elif self.distribution == "quantized_uniform":
+            import numpy as np
+
+            num_steps = self._get_num_steps()
+            steps = np.minimum(np.floor(u * (num_steps + 1)), num_steps)
+            return self.p1 + self.step * steps
+
+        raise Exception("Unsupported distribution '%s'" % (self.distribution))
+
+    def get_grid_axis(self):
+        """Return the quantized values for "quantized_uniform", else None."""
+        if self.distribution != "quantized_uniform":
+            return None
+        return [self.p1 + self.step * k for k in range(self._get_num_steps() + 1)]
+
     def get_typefunc(self):
         """Return float."""
         return float_with_none
@@ -32,3 +72,17 @@ class FloatParameter(BaseParameter):
     def get_argparse_type(self):
         """Return float."""
         return float_with_none
+
+    def to_dict(self):
+        """Return a dictionary representation, omitting 'step' when it is the default."""
+        parameter_dict = BaseParameter.to_dict(self)
+        if self.step == self.__dataclass_fields__["step"].default:
+            del parameter_dict["step"]
+        return parameter_dict
+
+    def _get_num_steps(self):
+        """Return the number of whole steps between p1 and p2."""
+        if self.step is None or self.step <= 0:
+            raise Exception("Step must be positive (got '%s')" % (self.step))
+        # Tolerate rounding so that e.g. p1=0, p2=1, step=0.1 reaches p2
+        return int(math.floor((self.p2 - self.p1) / self.step + 1e-9))
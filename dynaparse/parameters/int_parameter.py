@@ -1,26 +1,100 @@
+import math
 import random
-from dataclasses import dataclass
 
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import BaseParameter, parameter_dataclass
+from dynaparse.util.distributions import normal_ppf
 
 int_with_none = lambda x: None if x == "None" else int(x)
 
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
 
-@dataclass
+
+@parameter_dataclass
 class IntParameter(BaseParameter):
     default: int = None
     distribution: str = "uniform"
     parameter_type: str = "int"
     p1: int = None
     p2: int = None
+    step: int = 1
 
     def sample(self):
         """Sample a value from the pre-configured distribution."""
         if self.distribution == "uniform":
-            return random.sample(list(range(self.p1, self.p2 + 1)), k=1)[0]
+            return random.randint(self.p1, self.p2)
+        elif self.distribution == "log_uniform":
+            low, high = self._get_log_bounds()
+            sample = int(math.exp(random.uniform(low, high)))
+            return min(max(sample, self.p1), self.p2)  # exp(log(p1)) may round down
+        elif self.distribution == "quantized_uniform":
+            return self.p1 + self.step * random.randint(0, self._get_num_steps())
+        elif self.distribution == "normal":
+            return int(round(random.gauss(self.p1, self.p2)))
 
         raise Exception("Unsupported distribution '%s'" % (self.distribution))
 
+    def sample_batch(self, n, rng):
+        """Sample 'n' values from the pre-configured distribution in one draw."""
+        import numpy as np
+
+        if self.distribution == "uniform":
+            if not self._is_int64_range():  # Draw Python ints, seeded from 'rng'
+                scalar_random = random.Random(int(rng.integers(2**63)))
+                samples = np.empty(n, dtype=object)
+                samples[:] = [scalar_random.randint(self.p1, self.p2) for _ in range(n)]
+                return samples
+            return rng.integers(self.p1, self.p2, size=n, endpoint=True)
+        elif self.distribution == "log_uniform":
+            low, high = self._get_log_bounds()
+            samples = np.exp(rng.uniform(low, high, size=n)).astype(np.int64)
+            return np.clip(samples, self.p1, self.p2)
+        elif self.distribution == "quantized_uniform":
+            steps = rng.integers(0, self._get_num_steps(), size=n, endpoint=True)
+            return self.p1 + self.step * steps
+        elif self.distribution == "normal":
+            return np.rint(rng.normal(self.p1, self.p2, size=n)).astype(np.int64)
+
+        raise Exception("Unsupported distribution '%s'" % (self.distribution))
+
+    def is_sampled(self):
+        """Return True."""
+        return True
+
+    def from_unit(self, u):
+        """Map uniform [0, 1) values through the pre-configured distribution."""
+        import numpy as np
+
+        if self.distribution == "uniform":
+            if not self._is_int64_range():  # Map to Python ints
+                span = self.p2 - self.p1 + 1
+                samples = np.empty(len(u), dtype=object)
+                samples[:] = [self.p1 + min(int(x * span), span - 1) for x in u]
+                return samples
+            samples = self.p1 + np.floor(u * (self.p2 - self.p1 + 1)).astype(np.int64)
+            return np.minimum(samples, self.p2)
+        elif self.distribution == "log_uniform":
+            low, high = self._get_log_bounds()
+            samples = np.exp(low + u * (high - low)).astype(np.int64)
+            return np.clip(samples, self.p1, self.p2)
+        elif self.distribution == "quantized_uniform":
+            num_steps = self._get_num_steps()
+            steps = np.minimum(
+                np.floor(u * (num_steps + 1)).astype(np.int64), num_steps
+            )
+            return self.p1 + self.step * steps
+        elif self.distribution == "normal":
+            return np.rint(self.p1 + self.p2 * normal_ppf(u)).astype(np.int64)
+
+        raise Exception("Unsupported distribution '%s'" % (self.distribution))
+
+    def get_grid_axis(self):
+        """Return the quantized values for "quantized_uniform", else None."""
+        if self.distribution != "quantized_uniform":
+            return None
+        return range(
+            self.p1, self.p1 + self.step * self._get_num_steps() + 1, self.step
+        )
+
     def get_typefunc(self):
         """Return int."""
         return int_with_none
@@ -28,3 +102,32 @@ class IntParameter(BaseParameter):
     def get_argparse_type(self):
         """Return int."""
         return int_with_none
+
+    def to_dict(self):
+        """Return a dictionary representation, omitting 'step' when it is the default."""
+        parameter_dict = BaseParameter.to_dict(self)
+        if self.step == self.__dataclass_fields__["step"].default:
+            del parameter_dict["step"]
+        return parameter_dict
+
+    def _get_log_bounds(self):
+        """Return the log-space bounds so that every int in [p1, p2] is reachable."""
+        if self.p1 < 1:
+            raise Exception(
+                "Log-uniform distribution requires p1 >= 1 (got '%s')" % (self.p1)
+            )
+        return math.log(self.p1), math.log(self.p2 + 1)
+
+    def _is_int64_range(self):
+        """Return whether p1 and p2, and the span between them, fit in int64."""
+        return (
+            INT64_MIN <= self.p1
+            and self.p2 <= INT64_MAX
+            and self.p2 - self.p1 < INT64_MAX
+        )
+
+    def _get_num_steps(self):
+        """Return the number of whole steps between p1 and p2."""
+        if self.step < 1:
+            raise Exception("Step must be a positive integer (got '%s')" % (self.step))
+        return (self.p2 - self.p1) // self.step
@@ -1,36 +1,47 @@
 import json
 import random
-from dataclasses import dataclass
 
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import (
+    BaseParameter,
+    derived_field,
+    parameter_dataclass,
+)
+from dynaparse.util.parse_cache import copy_mutable
 
 
-@dataclass
+def cast_dict(raw):
+    if isinstance(raw, str):
+        return json.loads(raw.replace("'", '"'))
+    return raw
+
+
+@parameter_dataclass
 class ListParameter(BaseParameter):
     default: list
     value_type: str
     parameter_type: str = "list"
-
-    def __post_init__(self):
-        """Post-initialization validation method."""
-
-        def cast_dict(raw):
-            if isinstance(raw, str):
-                return json.loads(raw.replace("'", '"'))
-            return raw
-
-        super().__post_init__()
-        self.value_typefunc = (
-            cast_dict if self.value_type == "dict" else eval(self.value_type)
+    value_typefunc: object = derived_field()
+
+    def _build_casters(self):
+        """Precompute the element caster."""
+        object.__setattr__(
+            self,
+            "value_typefunc",
+            cast_dict if self.value_type == "dict" else eval(self.value_type),
         )
 
     def sample(self):
-        """Sample at random, but since there's no notion of this, return the default."""
-        return self.default
+        """Sample at random, but since there's no notion of this, return a copy of the default."""
+        return copy_mutable(self.default)
 
     def get_typefunc(self):
         """Return typefunc for list."""
-        return lambda x: [self.value_typefunc(v) for v in x]
+        return self._cast_list
+
+    def _cast_list(self, x):
+        """Cast every element of a list."""
+        value_typefunc = self.value_typefunc
+        return [value_typefunc(v) for v in x]
 
     def get_argparse_type(self):
         """Return list."""
@@ -1,14 +1,9 @@
-import random
-from dataclasses import dataclass
-
-import numpy as np
-
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import BaseParameter, parameter_dataclass
 
 str_with_none = lambda x: None if x == "None" else str(x)
 
 
-@dataclass
+@parameter_dataclass
 class StringParameter(BaseParameter):
     default: str = None
     parameter_type: str = "str"
@@ -0,0 +1,213 @@
+from array import array
+from itertools import accumulate
+import json
+import struct
+import sys
+
+MAGIC = b"DYNB"
+FORMAT_VERSION = 1
+# Magic, format version and header length, followed by the JSON header
+PREAMBLE = struct.Struct("<4sBI")
+
+# Column type -> array typecode of its fixed-width values
+ARRAY_TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+MIN_INT = -(1 << 63)
+MAX_INT = (1 << 63) - 1
+
+
+class BinaryParser:
+    """Compact binary format for flat configs and specs.
+
+    A file starts with a JSON header holding the flat names once, grouped by
+    column type, followed by one packed block per group with its columns laid end
+    to end: little-endian int64, float64 and bool arrays, strings as character
+    lengths plus a single UTF-8 blob, and JSON for anything else (lists, None or
+    mixed types). Specs are stored as their flat raw schema in the header. Loading
+    costs a few block conversions, and never builds the nested structure.
+    """
+
+    @classmethod
+    def is_binary(cls, filename):
+        """Return whether a file is in this format."""
+        with open(filename, "rb") as fd:
+            return fd.read(len(MAGIC)) == MAGIC
+
+    @classmethod
+    def dump_records(cls, filename, records):
+        """Write a list of flat value dictionaries, which must all have the same names."""
+        names = list(records[0]) if len(records) > 0 else []
+        for index, record in enumerate(records):
+            if len(record) != len(names) or any(name not in record for name in names):
+                raise Exception(
+                    "Config %d does not have the same names as config 0" % (index)
+                )
+        columns = {name: [record[name] for record in records] for name in names}
+        cls.dump_columns(filename, columns, len(records))
+
+    @classmethod
+    def dump_columns(cls, filename, columns, num_rows):
+        """Write columns of 'num_rows' flat values each, keyed by name."""
+        groups = {}
+        for name, values in columns.items():
+            if len(values) != num_rows:
+                raise Exception(
+                    "Column '%s' has %d values instead of %d"
+                    % (name, len(values), num_rows)
+                )
+            groups.setdefault(cls._get_column_type(values), []).append(name)
+        header_groups = []
+        payloads = []
+        for column_type, names in groups.items():
+            values = []
+            for name in names:
+                values.extend(columns[name])
+            payload = cls._pack_block(column_type, values)
+            header_groups.append([column_type, names, len(payload)])
+            payloads.append(payload)
+        header = {"kind": "config", "num_rows": num_rows, "groups": header_groups}
+        cls._write(filename, header, payloads)
+
+    @classmethod
+    def dump_spec(cls, filename, raw_schema):
+        """Write a flat raw schema."""
+        cls._write(filename, {"kind": "spec", "schema": raw_schema}, [])
+
+    @classmethod
+    def load_columns(cls, filename):
+        """Return (columns, num_rows) of a config file."""
+        header, blocks = cls._read_blocks(filename)
+        num_rows = header["num_rows"]
+        columns = {}
+        for (_, names, _), values in zip(header["groups"], blocks):
+            for position, name in enumerate(names):
+                columns[name] = values[position * num_rows : (position + 1) * num_rows]
+        return columns, num_rows
+
+    @classmethod
+    def load_records(cls, filename):
+        """Return the list of flat value dictionaries of a config file."""
+        columns, num_rows = cls.load_columns(filename)
+        if len(columns) == 0:
+            return [{} for _ in range(num_rows)]
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    @classmethod
+    def load_flat_config(cls, filename):
+        """Return the flat value dictionary of a file holding a single config."""
+        header, blocks = cls._read_blocks(filename)
+        if header["num_rows"] != 1:
+            raise Exception(
+                "File '%s' holds %d configs; use 'load_records'"
+                % (filename, header["num_rows"])
+            )
+        flat_config = {}
+        for (_, names, _), values in zip(header["groups"], blocks):
+            flat_config.update(zip(names, values))
+        return flat_config
+
+    @classmethod
+    def load_flat_spec(cls, filename):
+        """Return the flat raw schema of a spec file."""
+        return cls._read(filename, "spec")[0]["schema"]
+
+    @classmethod
+    def _read_blocks(cls, filename):
+        """Return the header of a config file and the values of each of its groups."""
+        header, data = cls._read(filename, "config")
+        blocks = []
+        offset = 0
+        for column_type, names, size in header["groups"]:
+            blocks.append(
+                cls._unpack_block(
+                    column_type,
+                    data[offset : offset + size],
+                    len(names) * header["num_rows"],
+                )
+            )
+            offset += size
+        return header, blocks
+
+    @staticmethod
+    def _pack_block(column_type, values):
+        """Return the packed bytes of the values of a group."""
+        if column_type in ARRAY_TYPECODES:
+            packed = array(ARRAY_TYPECODES[column_type], values)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            return packed.tobytes()
+        if column_type == "str":
+            lengths = array("q", [len(value) for value in values])
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            return lengths.tobytes() + "".join(values).encode("utf-8")
+        return json.dumps(values).encode("utf-8")
+
+    @staticmethod
+    def _unpack_block(column_type, data, num_values):
+        """Return the list of 'num_values' values of a packed group."""
+        if column_type in ARRAY_TYPECODES:
+            unpacked = array(ARRAY_TYPECODES[column_type])
+            unpacked.frombytes(data)
+            if sys.byteorder == "big":
+                unpacked.byteswap()
+            if column_type == "bool":
+                return [value != 0 for value in unpacked]
+            return unpacked.tolist()
+        if column_type == "str":
+            lengths = array("q")
+            lengths.frombytes(data[: 8 * num_values])
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            text = str(data[8 * num_values :], "utf-8")
+            ends = accumulate(lengths)
+            return [text[end - length : end] for end, length in zip(ends, lengths)]
+        if column_type == "json":
+            return json.loads(str(data, "utf-8"))
+        raise Exception("Unrecognized column type '%s'" % (column_type))
+
+    @staticmethod
+    def _get_column_type(values):
+        """Return the narrowest column type holding every value."""
+        value_types = {type(value) for value in values}
+        if value_types == {bool}:
+            return "bool"
+        if value_types == {int} and all(
+            MIN_INT <= value <= MAX_INT for value in values
+        ):
+            return "int"
+        if value_types == {float}:
+            return "float"
+        if value_types == {str}:
+            return "str"
+        return "json"
+
+    @staticmethod
+    def _write(filename, header, payloads):
+        """Write the preamble, header and column payloads of a file."""
+        encoded_header = json.dumps(header).encode("utf-8")
+        with open(filename, "wb") as fd:
+            fd.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded_header)))
+            fd.write(encoded_header)
+            for payload in payloads:
+                fd.write(payload)
+
+    @staticmethod
+    def _read(filename, kind):
+        """Return the header and a view of the column data of a file of some kind."""
+        with open(filename, "rb") as fd:
+            data = memoryview(fd.read())
+        magic, version, header_length = PREAMBLE.unpack_from(data)
+        if magic != MAGIC:
+            raise Exception("File '%s' is not a dynaparse binary file" % (filename))
+        if version > FORMAT_VERSION:
+            raise Exception(
+                "File '%s' has unsupported format version %d" % (filename, version)
+            )
+        start = PREAMBLE.size + header_length
+        header = json.loads(str(data[PREAMBLE.size : start], "utf-8"))
+        if header["kind"] != kind:
+            raise Exception(
+                "File '%s' holds a %s, not a %s" % (filename, header["kind"], kind)
+            )
+        return header, data[start:]
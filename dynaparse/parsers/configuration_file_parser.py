@@ -1,26 +1,51 @@
 import json
 
+from dynaparse.parsers.binary_parser import BinaryParser
 from dynaparse.parsers.yaml_parser import YAMLParser
 
 
 class ConfigurationFileParser:
     @classmethod
     def load_flat_spec(cls, filename):
-        """Return the flattened spec dict from JSON file."""
+        """Return the flattened spec dict from JSON or binary file."""
+        if BinaryParser.is_binary(filename):
+            return BinaryParser.load_flat_spec(filename)
         with open(filename, "r") as fd:
             raw = json.load(fd)
         return cls._flatten_nested_structure(raw)
 
     @classmethod
     def load_flat_config(cls, filename):
-        """Return flattened config dict from JSON file."""
+        """Return flattened config dict from JSON, YAML or binary file."""
         if YAMLParser.is_yaml(filename):
             raw = YAMLParser.load(filename)
+        elif BinaryParser.is_binary(filename):  # Already flat
+            return BinaryParser.load_flat_config(filename)
         else:  # Assume json otherwise
             with open(filename, "r") as fd:
                 raw = json.load(fd)
         return cls._flatten_nested_structure(raw)
 
+    @classmethod
+    def iter_flat_spec(cls, filename):
+        """Yield flattened spec (dotted_key, parameter_dict) pairs, streaming the file."""
+        from dynaparse.parsers.streaming_parser import StreamingParser
+
+        if BinaryParser.is_binary(filename):  # Compact already: no need to stream
+            return iter(BinaryParser.load_flat_spec(filename).items())
+
+        return StreamingParser.iter_flat_items(filename)
+
+    @classmethod
+    def iter_flat_config(cls, filename):
+        """Yield flattened config (dotted_key, value) pairs, streaming the file."""
+        from dynaparse.parsers.streaming_parser import StreamingParser
+
+        if BinaryParser.is_binary(filename):  # Compact already: no need to stream
+            return iter(BinaryParser.load_flat_config(filename).items())
+
+        return StreamingParser.iter_flat_items(filename)
+
     @classmethod
     def expand_flat_spec(cls, spec_dict):
         """Expand a flattened spec dict."""
@@ -61,22 +86,29 @@ class ConfigurationFileParser:
     @classmethod
     def _has_parameter_children(cls, raw):
         """Check whether a nested structure has parameter children."""
+        return id(raw) in cls._find_parameter_containers(raw)
 
-        def inspect(to_inspect):
-            found_parameter = False
-            found_child_parameter = False
-            if isinstance(to_inspect, list):
-                for el in to_inspect:
-                    found_child_parameter = inspect(el)
-            elif isinstance(to_inspect, dict):
-                if cls._is_parameter_dict(to_inspect):
-                    found_parameter = True
-                for _, value in to_inspect.items():
-                    if isinstance(value, list) or isinstance(value, dict):
-                        found_child_parameter = inspect(value)
-            return found_parameter or found_child_parameter
-
-        return inspect(raw)
+    @classmethod
+    def _find_parameter_containers(cls, raw):
+        """Return the ids of all containers holding a parameter dict, in one bottom-up pass."""
+        containers = set()
+        stack = [(raw, False)]
+        while stack:
+            node, is_visited = stack.pop()
+            children = node.values() if isinstance(node, dict) else node
+            if is_visited:
+                if cls._is_parameter_dict(node) or any(
+                    id(child) in containers for child in children
+                ):
+                    containers.add(id(node))
+            elif isinstance(node, (dict, list)):
+                stack.append((node, True))
+                stack.extend(
+                    (child, False)
+                    for child in children
+                    if isinstance(child, (dict, list))
+                )
+        return containers
 
     @classmethod
     def _is_kwarg_list(cls, raw):
@@ -92,89 +124,85 @@ class ConfigurationFileParser:
         return True
 
     @classmethod
-    def _flatten_nested_structure(cls, raw_dict):
-        """Flatten dict structure for argparse interoperability."""
+    def _flatten_nested_structure(cls, raw_dict, parent_str=None):
+        """Flatten dict structure for argparse interoperability.
+
+        Containers are classified once up front, so flattening is linear in the size
+        of the structure. Keys are prefixed with 'parent_str' if given.
+        """
+        parameter_containers = None
         flat_dict = {}
 
-        def extract_flat_parameters(raw, parent_str=None):
-            raw_type = cls._get_parameter_type(raw)
-            if raw_type == "parameter_value":
-                flat_dict[parent_str] = raw
-                return
-            if isinstance(raw, list):
-                if cls._is_kwarg_list(raw):
-                    flat_dict[parent_str] = raw
-                    return
-                for instance in raw:
-                    extract_flat_parameters(instance, parent_str)
-            elif isinstance(raw, dict):
-                if raw_type == "parameter_dict":
+        def extract_flat_parameters(raw, parent_str):
+            nonlocal parameter_containers
+            if isinstance(raw, dict):
+                if cls._is_parameter_dict(raw):
                     parameter_name = (
                         raw["name"]
                         if parent_str is None
-                        else ".".join([parent_str, raw["name"]])
+                        else parent_str + "." + raw["name"]
                     )
                     flat_dict[parameter_name] = raw
                     return
-                elif raw_type == "parameter_value":
-                    flat_dict[parent_str] = raw
-                    return
-                for key in raw:
-                    new_parent_str = (
-                        key if parent_str is None else ".".join([parent_str, key])
+                for key, value in raw.items():
+                    extract_flat_parameters(
+                        value, key if parent_str is None else parent_str + "." + key
                     )
-                    extract_flat_parameters(raw[key], new_parent_str)
-
-        extract_flat_parameters(raw_dict)
-        return flat_dict
-
-    @classmethod
-    def _assign_nested_value_by_keys(cls, output_dict, parent_keys, value, is_spec):
-        """Assign a value into a nested dict, creating keys as necessary."""
-
-        def assign(current, remaining_keys):
-            key = remaining_keys[0]
-            if is_spec and len(remaining_keys) == 2:
-                if key not in current:
-                    current[key] = []
-                current[key].insert(-1, value)
                 return
-            elif not is_spec and len(remaining_keys) == 1:
-                current[key] = value
-                return
-            else:
-                if is_spec:
-                    if key not in current:
-                        current[key] = []
-                    if (
-                        len(current[key]) == 0
-                        or cls._get_parameter_type(current[key][-1]) == "parameter_dict"
-                    ):
-                        current[key].append({})
-                    assign(current[key][-1], remaining_keys[1:])
-                else:
-                    if key not in current:
-                        current[key] = {}
-                    assign(current[key], remaining_keys[1:])
+            if isinstance(raw, list) and any(isinstance(el, dict) for el in raw):
+                if parameter_containers is None:
+                    parameter_containers = cls._find_parameter_containers(raw_dict)
+                if id(raw) in parameter_containers:
+                    # Lists of parameters are sections, other lists of dicts are values
+                    for el in raw:
+                        extract_flat_parameters(el, parent_str)
+                    return
+            flat_dict[parent_str] = raw
 
-        assign(output_dict, parent_keys)
+        extract_flat_parameters(raw_dict, parent_str)
+        return flat_dict
 
     @classmethod
     def _expand_flat_structure(cls, structure, is_spec):
-        """Expand a flattened data structure into a serializable nested dict."""
-        output_list = []
-        nested_dict = {}
-        for key in structure:
-            if "." not in key:
+        """Expand a flattened data structure into a serializable nested dict.
+
+        Parent nodes are kept in a prefix trie keyed by dotted parent name, so each
+        key only creates the part of its path that doesn't exist yet.
+        """
+        if is_spec:
+            # Spec nodes hold their parameter dicts and a dict of child sections
+            trie = {"": ([], {})}
+        else:
+            trie = {"": {}}
+
+        def get_node(prefix):
+            node = trie.get(prefix)
+            if node is None:
+                parent_prefix, _, key = prefix.rpartition(".")
+                parent_node = get_node(parent_prefix)
                 if is_spec:
-                    output_list.append(structure[key])
+                    node = parent_node[1].setdefault(key, ([], {}))
                 else:
-                    nested_dict[key] = structure[key]
+                    node = parent_node.setdefault(key, {})
+                trie[prefix] = node
+            return node
+
+        for key, value in structure.items():
+            parent_prefix, _, name = key.rpartition(".")
+            if is_spec:
+                get_node(parent_prefix)[0].append(value)
             else:
-                parent_keys = key.split(".")
-                cls._assign_nested_value_by_keys(
-                    nested_dict, parent_keys, structure[key], is_spec
+                get_node(parent_prefix)[name] = value
+        if not is_spec:
+            return trie[""]
+
+        def to_section_list(node):
+            parameter_dicts, children = node
+            section_list = list(parameter_dicts)
+            if len(children) > 0:
+                section_list.append(
+                    {key: to_section_list(child) for key, child in children.items()}
                 )
-        if len(nested_dict) > 0:
-            output_list.append(nested_dict)
-        return output_list if is_spec else nested_dict
+            return section_list
+
+        return to_section_list(trie[""])
@@ -1,25 +1,59 @@
 import argparse
 from argparse import ArgumentParser
 import sys
-from types import SimpleNamespace
-
 from dynaparse.dynamic_configuration import DynamicConfiguration
+from dynaparse.layered_configuration import LayeredConfiguration
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.util.bulk_caster import BulkCaster
+from dynaparse.util.parse_cache import get_file_version
+from dynaparse.util.namespace_builder import FrozenNamespace, NamespaceBuilder
 
 
 class DynamicArgumentParser(ArgumentParser):
     """Extends 'ArgumentParser' to include dynamic functionality."""
 
-    _RESERVED_ARGS = ["spec", "config", "random_sample"]
+    _RESERVED_ARGS = [
+        "spec",
+        "config",
+        "random_sample",
+        "dynaparse_sampler",
+        "dynaparse_sampler_size",
+        "dynaparse_sampler_index",
+        "dynaparse_sampler_seed",
+    ]
+
+    def __init__(
+        self,
+        *args,
+        argv=None,
+        lazy_dynamic_args=False,
+        frozen_namespace=False,
+        **kwargs
+    ):
+        """Initialize new arg parser with dynamic args taken into account.
+
+        'argv' is the command line to parse, without the program name. By default
+        'sys.argv' is read; it is never modified, so parsers with explicit argv lists
+        can be used from several threads at once.
 
-    def __init__(self, *args, **kwargs):
-        """Initialize new arg parser with dynamic args taken into account."""
+        If 'lazy_dynamic_args' is True, only the dynamic args given on the command
+        line are registered with argparse (all of them when asking for help); the
+        others are set straight from the configuration, which keeps parsing fast for
+        large schemas. Dynamic args must then be spelled out in full.
+        If 'frozen_namespace' is True, 'parse_args' returns a read-only
+        'FrozenNamespace' tree instead of an argparse namespace.
+        """
         super().__init__(*args, **kwargs)
+        self.lazy_dynamic_args = lazy_dynamic_args
+        self.frozen_namespace = frozen_namespace
+        self._argv = None if argv is None else list(argv)
 
         self._spec_file = self._get_command_line_value_from_arg("spec")
         self._config_file = self._get_command_line_value_from_arg("config")
-        self._dynamic_config = DynamicConfiguration(
+        self._dynamic_config = LayeredConfiguration(
             config=self._config_file, spec=self._spec_file
         )
+        self._parse_from_states = {}
 
         self.add_argument(
             "--spec",
@@ -39,6 +73,31 @@ class DynamicArgumentParser(ArgumentParser):
             default=False,
             help="If True, generate random parameters from the specified dynamic configuration.",
         )
+        self.add_argument(
+            "--dynaparse_sampler",
+            type=str,
+            choices=["grid", "lhs", "random", "sobol"],
+            default=None,
+            help="Take parameters from point '--dynaparse_sampler_index' of a space-filling design ('lhs' or 'sobol') of '--dynaparse_sampler_size' points, from seeded random trial '--dynaparse_sampler_index' ('random'), or from point '--dynaparse_sampler_index' of the full grid ('grid').",
+        )
+        self.add_argument(
+            "--dynaparse_sampler_size",
+            type=int,
+            default=1,
+            help="Number of points in the '--dynaparse_sampler' design, typically the number of runs in a sweep.",
+        )
+        self.add_argument(
+            "--dynaparse_sampler_index",
+            type=int,
+            default=0,
+            help="Index of the '--dynaparse_sampler' design point or random trial used by this run.",
+        )
+        self.add_argument(
+            "--dynaparse_sampler_seed",
+            type=int,
+            default=None,
+            help="Seed of the '--dynaparse_sampler' design or trials, shared by every run of a sweep (default: 0). With '--random_sample', draws trial '--dynaparse_sampler_index' reproducibly.",
+        )
 
     def add_argument(self, *args, **kwargs):
         try:
@@ -53,63 +112,234 @@ class DynamicArgumentParser(ArgumentParser):
         """Append a new config to the existing configuration. Accepts all inputs that a dynamic configuration accepts."""
         other_dynamic_config = DynamicConfiguration(config=config)
         self._dynamic_config.merge_with(other_dynamic_config, inplace=True)
+        self._parse_from_states.clear()
 
     def parse_args(self):
         """Parse all arguments including dynamic configuration-based ones."""
-        self._merge_dynamic_config_into_argparser()
-        args = super().parse_args()
+        argv = self._get_argv()
+        registered_names = self._merge_dynamic_config_into_argparser(argv)
+        args = super().parse_args(argv)
+        if registered_names is not None:
+            self._set_unregistered_args(args, registered_names)
 
         if args.config is not None:
-            self._dynamic_config.overwrite_args_with_contents(args)
-        if args.random_sample:
-            self._dynamic_config.overwrite_args_with_random(args)
+            self._dynamic_config.overwrite_args_with_contents(args, argv)
+        self._overwrite_args_with_sampler(args, self._dynamic_config)
         if self._dynamic_config.has_spec():
             self._dynamic_config.validate_args(args)
 
         return self._patch_kwargs(args)
 
+    def parse_from(self, config=None, overrides=None, argv=None):
+        """Parse arguments programmatically, without argparse for dynamic ones.
+
+        'argv' is a list of command line arguments (without the program name);
+        only the non-dynamic ones go through argparse. 'config' is any config a
+        dynamic configuration accepts, applied over '--config', and 'overrides' is a
+        nested or dotted dictionary of values applied last. Returns what 'parse_args'
+        returns for the equivalent command line, without touching 'sys.argv'.
+        """
+        argv = [] if argv is None else list(argv)
+        dynamic_config, arg_values = self._get_parse_from_state(
+            self._get_argv_value(argv, "spec"), self._get_argv_value(argv, "config")
+        )
+        raw_values = {}
+        if config is not None:
+            if dynamic_config.has_spec():
+                raw_values.update(DynamicConfiguration(config=config).get_values())
+            else:
+                dynamic_config = dynamic_config.merge_with(
+                    DynamicConfiguration(config=config)
+                )
+                arg_values = self._get_arg_values(dynamic_config)
+        static_argv, dynamic_argv = self._split_dynamic_argv(
+            argv, dynamic_config._schema
+        )
+        args = ArgumentParser.parse_args(self, static_argv)
+        raw_values.update(dynamic_argv)
+        if overrides is not None:
+            raw_values.update(
+                ConfigurationFileParser._flatten_nested_structure(overrides)
+            )
+        casted_columns, report = BulkCaster.cast_columns(
+            dynamic_config._schema,
+            {name: [value] for name, value in raw_values.items()},
+        )
+        report.raise_if_invalid()
+        namespace_dict = vars(args)
+        namespace_dict.update(arg_values)
+        for name, value in arg_values.items():
+            if isinstance(value, list):  # Don't share cached lists with callers
+                namespace_dict[name] = list(value)
+        for name, (casted,) in casted_columns.items():
+            namespace_dict[name] = casted
+        self._overwrite_args_with_sampler(args, dynamic_config)
+        return self._patch_kwargs(args)
+
     def format_help(self):
         """Format help as usual, but append note about dynamic argument parser."""
         help_str = super().format_help()
         help_str += "\nNOTE: This script uses a dynamic argument parser for configuration.\nSee https://github.com/kungfuai/dynaparse for more information.\n"
         return help_str
 
+    def _get_argv(self):
+        """Return the command line to parse, without the program name."""
+        return list(sys.argv[1:] if self._argv is None else self._argv)
+
     def _get_command_line_value_from_arg(self, arg):
         """Return command line value from a specific argument name."""
+        return self._get_argv_value(self._get_argv(), arg)
+
+    def _merge_dynamic_config_into_argparser(self, argv):
+        """Append arguments for the dynamic configuration given on command line 'argv'.
+
+        Return the set of registered names in lazy mode, or None if all were registered.
+        """
+        given_names = self._dynamic_config.get_command_line_names(argv)
+        if not self.lazy_dynamic_args or self._is_help_requested(given_names, argv):
+            self._dynamic_config.append_to_arg_parser(self, defaults_from_values=True)
+            return None
+        registered_names = [
+            name for name in self._dynamic_config._schema if name in given_names
+        ]
+        self._dynamic_config.append_to_arg_parser(self, registered_names)
+        return set(registered_names)
+
+    def _set_unregistered_args(self, args, registered_names):
+        """Set dynamic args that were not registered from configured values or defaults."""
+        self._set_dynamic_args(
+            args,
+            self._dynamic_config,
+            self._dynamic_config.get_values(random=False),
+            registered_names,
+        )
+
+    @staticmethod
+    def _set_dynamic_args(args, dynamic_config, values, skipped_names=()):
+        """Set dynamic args from 'values', or from defaults as argparse would."""
+        for name, parameter in dynamic_config._schema.items():
+            if name not in skipped_names:
+                setattr(
+                    args,
+                    name,
+                    values[name] if name in values else parameter.get_default(),
+                )
+
+    @staticmethod
+    def _overwrite_args_with_sampler(args, dynamic_config):
+        """Overwrite dynamic args with random or design values if requested."""
+        sampler = args.dynaparse_sampler
+        if args.random_sample and sampler is None:
+            if args.dynaparse_sampler_seed is None:
+                dynamic_config.overwrite_args_with_random(args)
+            else:
+                sampler = "random"
+        if sampler is not None:
+            dynamic_config.overwrite_args_with_design(
+                args,
+                sampler,
+                args.dynaparse_sampler_size,
+                args.dynaparse_sampler_index,
+                (
+                    args.dynaparse_sampler_seed
+                    if args.dynaparse_sampler_seed is not None
+                    else 0
+                ),
+            )
+
+    def _get_parse_from_state(self, spec_file, config_file):
+        """Return the dynamic configuration of a spec and config file pair and its arg values.
+
+        Both are kept until either file changes or a config is appended, so that
+        repeated calls only cost a dictionary copy.
+        """
+        versions = tuple(
+            None if filename is None else get_file_version(filename)
+            for filename in (spec_file, config_file)
+        )
+        state = self._parse_from_states.get((spec_file, config_file))
+        if state is None or state[0] != versions:
+            if spec_file == self._spec_file and config_file == self._config_file:
+                dynamic_config = self._dynamic_config
+            else:
+                dynamic_config = LayeredConfiguration(
+                    config=config_file, spec=spec_file
+                )
+            state = (versions, dynamic_config, self._get_arg_values(dynamic_config))
+            self._parse_from_states[(spec_file, config_file)] = state
+        return state[1], state[2]
+
+    @staticmethod
+    def _get_arg_values(dynamic_config):
+        """Return the value of every dynamic arg, falling back to defaults as argparse would."""
+        values = dynamic_config.get_values(random=False)
+        return {
+            name: values[name] if name in values else parameter.get_default()
+            for name, parameter in dynamic_config._schema.items()
+        }
+
+    @staticmethod
+    def _get_argv_value(argv, arg):
+        """Return the value of '--arg' in an argv list, or None."""
         arg_str = "--" + arg
-        for i in range(len(sys.argv)):
-            if sys.argv[i] == arg_str:
-                return sys.argv[i + 1]
+        for i, token in enumerate(argv):
+            if token == arg_str and i + 1 < len(argv):
+                return argv[i + 1]
+            if token.startswith(arg_str + "="):
+                return token[len(arg_str) + 1 :]
         return None
 
-    def _merge_dynamic_config_into_argparser(self):
-        """Append arguments for a dynamic configuration."""
-        self._dynamic_config.append_to_arg_parser(self)
-        self._dynamic_config.patch_sys_argv()
+    @staticmethod
+    def _split_dynamic_argv(argv, schema):
+        """Split argv into non-dynamic arguments and argparse-typed dynamic values."""
+        static_argv = []
+        dynamic_values = {}
+        i = 0
+        while i < len(argv):
+            name, has_value, value = argv[i][2:].partition("=")
+            if not argv[i].startswith("--") or name not in schema:
+                static_argv.append(argv[i])
+                i += 1
+                continue
+            if has_value:
+                tokens = [value]
+                i += 1
+            else:
+                tokens = []
+                i += 1
+                while i < len(argv) and not argv[i].startswith("--"):
+                    tokens.append(argv[i])
+                    i += 1
+            typefunc = schema[name].get_argparse_type()
+            if schema[name].is_list():
+                dynamic_values[name] = [typefunc(token) for token in tokens]
+            elif len(tokens) != 1:
+                raise Exception(
+                    "Argument '--%s' expects one value, got %d" % (name, len(tokens))
+                )
+            else:
+                dynamic_values[name] = typefunc(tokens[0])
+        return static_argv, dynamic_values
+
+    def _is_help_requested(self, given_names, argv):
+        """Return whether help was asked for on command line 'argv'."""
+        return self.add_help and ("help" in given_names or "-h" in argv)
 
     def _patch_kwargs(self, args):
         """Patch kwargs in an argparse namespace so that nested values are accessible via dot notation."""
-        kwargs = args._get_kwargs()
-
-        def assign(parent_obj, parent_names, arg_name, arg_value):
-            if len(parent_names) > 0:
-                if parent_names[0] not in dir(parent_obj):
-                    setattr(parent_obj, parent_names[0], SimpleNamespace())
-                curr_parent = parent_names.pop(0)
-                assign(
-                    getattr(parent_obj, curr_parent), parent_names, arg_name, arg_value
+        if self.frozen_namespace:
+            return FrozenNamespace(
+                **NamespaceBuilder.build(vars(args).items(), FrozenNamespace)
+            )
+        dotted_items = [
+            (name, value) for name, value in vars(args).items() if "." in name
+        ]
+        for name, _ in dotted_items:
+            delattr(args, name)
+        for name, value in NamespaceBuilder.build(dotted_items).items():
+            if hasattr(args, name):
+                raise Exception(
+                    "Name '%s' is used both as a value and as a section" % (name)
                 )
-            else:
-                setattr(parent_obj, arg_name, arg_value)
-                return
-
-        for arg in kwargs:
-            arg_full_name = arg[0]
-            if "." in arg_full_name:
-                arg_value = arg[1]
-                parent_names = arg_full_name.split(".")[:-1]
-                arg_name = arg_full_name.split(".")[-1]
-                assign(args, parent_names, arg_name, arg_value)
-                delattr(args, arg_full_name)
-
+            setattr(args, name, value)
         return args
@@ -0,0 +1,370 @@
+import itertools
+import json
+from json.decoder import scanstring
+from json.scanner import make_scanner
+import re
+
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.parsers.yaml_parser import YAMLParser
+
+START_MAP = "start_map"
+MAP_KEY = "map_key"
+END_MAP = "end_map"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+SCALAR = "scalar"
+
+CONTAINER_EVENTS = frozenset([START_MAP, MAP_KEY, END_MAP, START_ARRAY, END_ARRAY])
+
+# What the JSON grammar allows next
+EXPECT_VALUE = 0
+EXPECT_FIRST_VALUE = 1  # Or the end of an array
+EXPECT_KEY = 2
+EXPECT_FIRST_KEY = 3  # Or the end of a map
+EXPECT_COLON = 4
+EXPECT_COMMA = 5  # Or the end of the container
+EXPECT_END = 6
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+WHITESPACE = " \t\n\r"
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+TOKEN_RE = re.compile(r'[^\s,:\[\]{}"]*')
+
+
+def get_decode_error(message, pos=None):
+    """Return a 'JSONDecodeError' at character 'pos' of a streamed file."""
+    error = json.JSONDecodeError(message, "", 0)
+    error.pos = pos
+    error.lineno = error.colno = None
+    error.args = (message if pos is None else "%s: char %d" % (message, pos),)
+    return error
+
+
+def get_parameter_keys():
+    """Return every key a parameter dict may contain."""
+    from dynaparse.parameters.base_parameter import get_init_fields
+    from dynaparse.parameters.boolean_parameter import BooleanParameter
+    from dynaparse.parameters.categorical_parameter import CategoricalParameter
+    from dynaparse.parameters.float_parameter import FloatParameter
+    from dynaparse.parameters.int_parameter import IntParameter
+    from dynaparse.parameters.list_parameter import ListParameter
+    from dynaparse.parameters.string_parameter import StringParameter
+
+    parameter_keys = set()
+    for parameter_class in [
+        BooleanParameter,
+        CategoricalParameter,
+        FloatParameter,
+        IntParameter,
+        ListParameter,
+        StringParameter,
+    ]:
+        parameter_keys.update(
+            parameter_field.name for parameter_field in get_init_fields(parameter_class)
+        )
+    return frozenset(parameter_keys)
+
+
+class StreamingParser:
+    """Emit flattened (dotted_key, value) pairs from a file without building the nested tree.
+
+    Maps are streamed key by key and lists of parameters element by element; only
+    leaf values (including lists of values or kwargs) and parameter dicts are ever
+    held in memory. This gives the same pairs as 'ConfigurationFileParser', as
+    long as parameter dicts only contain parameter keys.
+    """
+
+    @classmethod
+    def iter_flat_items(cls, filename, chunk_size=DEFAULT_CHUNK_SIZE, backend=None):
+        """Yield flattened (dotted_key, value) pairs from a JSON or YAML file.
+
+        JSON is parsed by ijson's C parser if installed (or 'backend' is "ijson"),
+        and by a pure Python parser otherwise (or if 'backend' is "python"). Without
+        a 'backend', input that ijson rejects but 'json.load' accepts (integers
+        beyond 64 bits, NaN and Infinity) is finished by the Python parser, so
+        installing ijson never changes which files parse.
+        """
+        if YAMLParser.is_yaml(filename):
+            with open(filename, "r") as fd:
+                yield from cls._flatten_events(cls._iter_yaml_events(fd))
+            return
+        if backend is None and cls.has_ijson():
+            num_items = 0
+            with open(filename, "rb") as fd:
+                flat_items = cls._flatten_events(cls._iter_ijson_events(fd, chunk_size))
+                while True:
+                    try:
+                        flat_item = next(flat_items)
+                    except StopIteration:
+                        return
+                    except json.JSONDecodeError:  # Resume where ijson stopped
+                        break
+                    yield flat_item
+                    num_items += 1
+            with open(filename, "r") as fd:
+                flat_items = cls._flatten_events(cls._iter_json_events(fd, chunk_size))
+                yield from itertools.islice(flat_items, num_items, None)
+        elif backend == "ijson":
+            with open(filename, "rb") as fd:
+                yield from cls._flatten_events(cls._iter_ijson_events(fd, chunk_size))
+        elif backend in ("python", None):
+            with open(filename, "r") as fd:
+                yield from cls._flatten_events(cls._iter_json_events(fd, chunk_size))
+        else:
+            raise Exception("Unrecognized JSON backend '%s'" % (backend))
+
+    @staticmethod
+    def has_ijson():
+        """Return whether the optional ijson parser is installed."""
+        try:
+            import ijson  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @classmethod
+    def _flatten_events(cls, events):
+        """Yield flattened (dotted_key, value) pairs from a stream of parse events."""
+        events = iter(events)
+        parameter_keys = get_parameter_keys()
+        for event in events:
+            yield from cls._stream_value(events, event, None, parameter_keys)
+
+    @classmethod
+    def _stream_value(cls, events, event, parent_str, parameter_keys):
+        """Yield flattened pairs for the value starting at 'event'."""
+        if event[0] == START_MAP:
+            yield from cls._stream_map(events, parent_str, parameter_keys)
+        elif event[0] == START_ARRAY:
+            yield from cls._stream_array(events, parent_str, parameter_keys)
+        else:
+            yield parent_str, event[1]
+
+    @classmethod
+    def _stream_map(cls, events, parent_str, parameter_keys):
+        """Yield flattened pairs for a map, buffering it only while it may be a parameter dict."""
+        buffered = {}
+        for kind, key in events:
+            if kind == END_MAP:
+                break
+            event = next(events)
+            if buffered is not None and key not in parameter_keys:
+                for buffered_key, buffered_value in buffered.items():
+                    yield from cls._flatten_value(
+                        buffered_value, cls._join(parent_str, buffered_key)
+                    )
+                buffered = None
+            if buffered is not None:
+                buffered[key] = cls._materialize(events, event)
+            else:
+                yield from cls._stream_value(
+                    events, event, cls._join(parent_str, key), parameter_keys
+                )
+        if buffered is not None:
+            yield from cls._flatten_value(buffered, parent_str)
+
+    @classmethod
+    def _stream_array(cls, events, parent_str, parameter_keys):
+        """Yield flattened pairs for a list, streaming it once it is known to hold parameters."""
+        pending = []
+        for event in events:
+            if event[0] == END_ARRAY:
+                break
+            if pending is None:
+                yield from cls._stream_value(events, event, parent_str, parameter_keys)
+                continue
+            value = cls._materialize(events, event)
+            pending.append(value)
+            if isinstance(
+                value, dict
+            ) and ConfigurationFileParser._has_parameter_children(value):
+                for pending_value in pending:
+                    yield from cls._flatten_value(pending_value, parent_str)
+                pending = None
+        if pending is not None:
+            yield parent_str, pending
+
+    @classmethod
+    def _flatten_value(cls, value, parent_str):
+        """Yield flattened pairs for an in-memory value."""
+        yield from ConfigurationFileParser._flatten_nested_structure(
+            value, parent_str
+        ).items()
+
+    @classmethod
+    def _materialize(cls, events, event):
+        """Build the in-memory value starting at 'event'."""
+        if event[0] == START_MAP:
+            value = {}
+            for kind, key in events:
+                if kind == END_MAP:
+                    return value
+                value[key] = cls._materialize(events, next(events))
+        elif event[0] == START_ARRAY:
+            value = []
+            for child_event in events:
+                if child_event[0] == END_ARRAY:
+                    return value
+                value.append(cls._materialize(events, child_event))
+        return event[1]
+
+    @staticmethod
+    def _join(parent_str, key):
+        """Return the dotted name of a child key."""
+        return key if parent_str is None else parent_str + "." + key
+
+    @classmethod
+    def _iter_json_events(cls, fd, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield parse events from a JSON file object, reading it in chunks.
+
+        Tokens are checked against the JSON grammar as they are read, and input
+        ending inside a value raises, so truncated files are never accepted.
+        """
+        scan_once = make_scanner(json.JSONDecoder())
+        buffer = ""
+        pos = 0
+        offset = 0  # Characters read before 'buffer'
+        is_eof = False
+        containers = []
+        state = EXPECT_VALUE
+
+        def read_chunk():
+            nonlocal buffer, pos, offset, is_eof
+            chunk = "" if is_eof else fd.read(chunk_size)
+            if not chunk:
+                is_eof = True
+                return False
+            offset += pos
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        while True:
+            if pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos = WHITESPACE_RE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if read_chunk():
+                    continue
+                break
+            char = buffer[pos]
+            if char == '"':
+                try:
+                    value, end = scanstring(buffer, pos + 1)
+                except json.JSONDecodeError:
+                    if read_chunk():
+                        continue
+                    raise get_decode_error("Unterminated string", offset + pos)
+                if state == EXPECT_KEY or state == EXPECT_FIRST_KEY:
+                    state = EXPECT_COLON
+                    pos = end
+                    yield MAP_KEY, value
+                    continue
+                event = SCALAR, value
+            elif char == ":":
+                if state != EXPECT_COLON:
+                    raise get_decode_error("Unexpected ':'", offset + pos)
+                state = EXPECT_VALUE
+                pos += 1
+                continue
+            elif char == ",":
+                if state != EXPECT_COMMA:
+                    raise get_decode_error("Unexpected ','", offset + pos)
+                state = EXPECT_KEY if containers[-1] == END_MAP else EXPECT_VALUE
+                pos += 1
+                continue
+            elif char == "{" or char == "[":
+                if state != EXPECT_VALUE and state != EXPECT_FIRST_VALUE:
+                    raise get_decode_error("Unexpected '%s'" % (char), offset + pos)
+                pos += 1
+                if char == "{":
+                    containers.append(END_MAP)
+                    state = EXPECT_FIRST_KEY
+                    yield START_MAP, None
+                else:
+                    containers.append(END_ARRAY)
+                    state = EXPECT_FIRST_VALUE
+                    yield START_ARRAY, None
+                continue
+            elif char == "}" or char == "]":
+                closing = END_MAP if char == "}" else END_ARRAY
+                if (
+                    state != EXPECT_COMMA
+                    and state
+                    != (EXPECT_FIRST_KEY if char == "}" else EXPECT_FIRST_VALUE)
+                ) or containers[-1] != closing:
+                    raise get_decode_error("Unexpected '%s'" % (char), offset + pos)
+                containers.pop()
+                state = EXPECT_COMMA if containers else EXPECT_END
+                pos += 1
+                yield closing, None
+                continue
+            else:
+                try:
+                    value, end = scan_once(buffer, pos)
+                except StopIteration:
+                    end = None
+                if (
+                    not is_eof
+                    and (end is None or len(buffer) - end <= 2)  # Like "1.5e-"
+                    and TOKEN_RE.match(buffer, pos).end() == len(buffer)
+                    and read_chunk()
+                ):
+                    continue  # The token might continue in the next chunk
+                if end is None:
+                    raise get_decode_error("Expecting value", offset + pos)
+                event = SCALAR, value
+            if state != EXPECT_VALUE and state != EXPECT_FIRST_VALUE:
+                raise get_decode_error("Unexpected value", offset + pos)
+            state = EXPECT_COMMA if containers else EXPECT_END
+            pos = end
+            yield event
+        if state != EXPECT_END:
+            raise get_decode_error("Unexpected end of file", offset + pos)
+
+    @classmethod
+    def _iter_ijson_events(cls, fd, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield parse events from a binary JSON file object using ijson's C parser."""
+        import ijson
+
+        try:
+            for kind, value in ijson.basic_parse(
+                fd, use_float=True, buf_size=chunk_size
+            ):
+                yield (kind if kind in CONTAINER_EVENTS else SCALAR), value
+        except ijson.JSONError as e:
+            raise get_decode_error(str(e).splitlines()[0]) from e
+
+    @classmethod
+    def _iter_yaml_events(cls, fd):
+        """Yield parse events from a YAML file object using PyYAML's event parser."""
+        import yaml
+
+        loader = yaml.SafeLoader("")
+        containers = []
+        for event in yaml.parse(fd, Loader=yaml.SafeLoader):
+            is_key = (
+                len(containers) > 0
+                and containers[-1][0] == END_MAP
+                and containers[-1][1]
+            )
+            if isinstance(event, (yaml.ScalarEvent, yaml.CollectionStartEvent)):
+                if len(containers) > 0 and containers[-1][0] == END_MAP:
+                    containers[-1][1] = not is_key
+            if isinstance(event, yaml.ScalarEvent):
+                tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+                node = yaml.ScalarNode(tag, event.value, style=event.style)
+                value = loader.yaml_constructors.get(
+                    tag, loader.yaml_constructors[None]
+                )(loader, node)
+                yield (MAP_KEY if is_key else SCALAR), value
+            elif isinstance(event, yaml.MappingStartEvent):
+                containers.append([END_MAP, True])
+                yield START_MAP, None
+            elif isinstance(event, yaml.SequenceStartEvent):
+                containers.append([END_ARRAY, False])
+                yield START_ARRAY, None
+            elif isinstance(event, yaml.CollectionEndEvent):
+                yield containers.pop()[0], None
+            elif isinstance(event, yaml.AliasEvent):
+                raise Exception("YAML aliases are not supported when streaming")
@@ -1,9 +1,8 @@
-import yaml
-
-
 class YAMLParser:
     @classmethod
     def load(cls, filename):
+        import yaml
+
         with open(filename, "r") as fd:
             return yaml.safe_load(fd)
 
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class BaseSampler(ABC):
+    """Sample whole batches of configurations from a schema."""
+
+    def __init__(self, seed=None):
+        """Instantiate a sampler with an optional seed."""
+        self.seed = seed
+
+    @abstractmethod
+    def sample(self, schema, n):
+        """Return a dictionary mapping each parameter name to an array of 'n' values."""
@@ -0,0 +1,34 @@
+from abc import abstractmethod
+
+from dynaparse.parameters.base_parameter import constant_batch
+from dynaparse.samplers.base_sampler import BaseSampler
+
+
+class DesignSampler(BaseSampler):
+    """Sample whole batches of configurations from a design of uniform points.
+
+    Subclasses generate an (n, d) design over [0, 1)^d, with one dimension per
+    sampled parameter; each column is then mapped through its parameter's
+    distribution with 'from_unit'.
+    """
+
+    @abstractmethod
+    def sample_unit(self, n, num_dimensions):
+        """Return an (n, num_dimensions) array of points in [0, 1)."""
+
+    def sample(self, schema, n):
+        """Return a dictionary mapping each parameter name to an array of 'n' values."""
+        sampled_names = [name for name in schema if schema[name].is_sampled()]
+        unit = self.sample_unit(n, len(sampled_names))
+        columns = {
+            name: schema[name].from_unit(unit[:, dimension])
+            for dimension, name in enumerate(sampled_names)
+        }
+        return {
+            name: (
+                columns[name]
+                if name in columns
+                else constant_batch(schema[name].get_default(), n)
+            )
+            for name in schema
+        }
@@ -0,0 +1,102 @@
+from dynaparse.util.parse_cache import copy_mutable
+
+
+def shard_range(indices, shard_index, num_shards):
+    """Return contiguous part 'shard_index' of 'num_shards' near-equal parts of a range."""
+    if not 0 <= shard_index < num_shards:
+        raise Exception(
+            "Shard index %d out of range for %d shards" % (shard_index, num_shards)
+        )
+    start = len(indices) * shard_index // num_shards
+    stop = len(indices) * (shard_index + 1) // num_shards
+    return indices[start:stop]
+
+
+class GridSampler:
+    """Lazy cartesian product of every parameter with a grid axis.
+
+    Axes are categorical options, non-constant booleans, and "quantized_uniform"
+    int and float ranges; other parameters keep their default. Points are decoded
+    from their index in mixed radix (the last axis varies fastest), so the product
+    is never built: 'len', indexing and slicing are O(number of axes).
+    """
+
+    def __init__(self, schema, indices=None):
+        """Instantiate a grid over 'schema', optionally restricted to a range of indices."""
+        self.schema = schema
+        self.axes = {}
+        for name, parameter in schema.items():
+            axis = parameter.get_grid_axis()
+            if axis is not None:
+                self.axes[name] = axis
+        self.size = 1
+        for axis in self.axes.values():
+            self.size *= len(axis)
+        self.indices = range(self.size) if indices is None else indices
+
+    def __len__(self):
+        """Return the number of points."""
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        """Return the value dictionary of a point, or a sub-grid for a slice."""
+        if isinstance(index, slice):
+            return GridSampler(self.schema, self.indices[index])
+        return self.decode(self.indices[index])
+
+    def __iter__(self):
+        """Yield the value dictionaries of all points, in index order."""
+        if self.indices.step != 1 or len(self.indices) == 0:
+            yield from (self.decode(grid_index) for grid_index in self.indices)
+            return
+        # Decode the first point, then count up in mixed radix like an odometer
+        names = list(self.axes)
+        axes = [self.axes[name] for name in names]
+        digits = self._get_digits(self.indices.start)
+        for _ in range(len(self.indices)):
+            yield self._to_values(
+                {name: axis[digit] for name, axis, digit in zip(names, axes, digits)}
+            )
+            for position in reversed(range(len(digits))):
+                digits[position] += 1
+                if digits[position] < len(axes[position]):
+                    break
+                digits[position] = 0
+
+    def decode(self, grid_index):
+        """Return the value dictionary of the point at 'grid_index' of the full grid."""
+        if not 0 <= grid_index < self.size:
+            raise IndexError("Grid index %d out of range" % (grid_index))
+        digits = self._get_digits(grid_index)
+        return self._to_values(
+            {name: self.axes[name][digit] for name, digit in zip(self.axes, digits)}
+        )
+
+    def shard(self, shard_index, num_shards):
+        """Return contiguous part 'shard_index' of 'num_shards' near-equal parts."""
+        return GridSampler(
+            self.schema, shard_range(self.indices, shard_index, num_shards)
+        )
+
+    def iter_indexed(self):
+        """Yield (grid_index, values) pairs of all points."""
+        return zip(self.indices, self)
+
+    def _get_digits(self, grid_index):
+        """Return the mixed-radix digits of a grid index, one per axis."""
+        digits = []
+        for axis in reversed(list(self.axes.values())):
+            grid_index, digit = divmod(grid_index, len(axis))
+            digits.append(digit)
+        return digits[::-1]
+
+    def _to_values(self, axis_values):
+        """Return a value dictionary in schema order, filling (copied) defaults off the axes."""
+        return {
+            name: (
+                axis_values[name]
+                if name in axis_values
+                else copy_mutable(self.schema[name].get_default())
+            )
+            for name in self.schema
+        }
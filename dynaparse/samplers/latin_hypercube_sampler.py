@@ -0,0 +1,13 @@
+from dynaparse.samplers.design_sampler import DesignSampler
+
+
+class LatinHypercubeSampler(DesignSampler):
+    """Latin hypercube design: every dimension has exactly one point in each of n strata."""
+
+    def sample_unit(self, n, num_dimensions):
+        """Return an (n, num_dimensions) Latin hypercube design in [0, 1)."""
+        import numpy as np
+
+        rng = np.random.default_rng(self.seed)
+        strata = np.argsort(rng.random((n, num_dimensions)), axis=0)
+        return (strata + rng.random((n, num_dimensions))) / n
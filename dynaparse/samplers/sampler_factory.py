@@ -0,0 +1,23 @@
+from dynaparse.samplers.latin_hypercube_sampler import LatinHypercubeSampler
+from dynaparse.samplers.sobol_sampler import SobolSampler
+from dynaparse.samplers.trial_sampler import TrialSampler
+
+SAMPLER_CLASSES = {
+    "lhs": LatinHypercubeSampler,
+    "random": TrialSampler,
+    "sobol": SobolSampler,
+}
+
+
+class SamplerFactory:
+    """Build samplers from their command line names."""
+
+    @classmethod
+    def get_sampler(cls, sampler_name, seed=None):
+        """Return a sampler instance for a name in 'SAMPLER_CLASSES'."""
+        if sampler_name not in SAMPLER_CLASSES:
+            raise Exception(
+                "Unrecognized sampler '%s', should be one of %s"
+                % (sampler_name, sorted(SAMPLER_CLASSES))
+            )
+        return SAMPLER_CLASSES[sampler_name](seed)
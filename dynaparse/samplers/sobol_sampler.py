@@ -0,0 +1,24 @@
+import warnings
+
+from dynaparse.samplers.design_sampler import DesignSampler
+
+
+class SobolSampler(DesignSampler):
+    """Scrambled Sobol sequence, which requires scipy>=1.7."""
+
+    def sample_unit(self, n, num_dimensions):
+        """Return the first n points of a scrambled Sobol sequence in [0, 1)."""
+        import numpy as np
+
+        try:
+            from scipy.stats import qmc
+        except ImportError as e:
+            raise ImportError(
+                "Sobol sampling requires scipy>=1.7, install it or use 'lhs' instead"
+            ) from e
+
+        if num_dimensions == 0:
+            return np.empty((n, 0))
+        with warnings.catch_warnings():  # Balance warning when n isn't a power of 2
+            warnings.simplefilter("ignore", UserWarning)
+            return qmc.Sobol(num_dimensions, scramble=True, seed=self.seed).random(n)
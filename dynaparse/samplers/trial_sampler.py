@@ -0,0 +1,46 @@
+from dynaparse.samplers.base_sampler import BaseSampler
+
+
+class TrialSampler(BaseSampler):
+    """Independent random sampling where trial i always yields the same configuration.
+
+    Each trial draws from its own generator, seeded with
+    'SeedSequence(seed, spawn_key=(i,))' (what 'SeedSequence(seed).spawn' would
+    give as its i-th child). Trial i therefore does not depend on the worker, the
+    batch size or earlier trials, and can be drawn directly. Parameters are drawn
+    in sorted name order, so reordering a spec does not change the values.
+    """
+
+    def __init__(self, seed=None):
+        """Instantiate a sampler; without a seed, fresh entropy is drawn and kept."""
+        import numpy as np
+
+        super().__init__(np.random.SeedSequence(seed).entropy)
+
+    def get_rng(self, index):
+        """Return the generator of trial 'index'."""
+        import numpy as np
+
+        return np.random.default_rng(
+            np.random.SeedSequence(self.seed, spawn_key=(index,))
+        )
+
+    def sample_trial(self, schema, index):
+        """Return the value dictionary of trial 'index'."""
+        rng = self.get_rng(index)
+        values = {
+            name: schema[name].sample_batch(1, rng).tolist()[0]
+            for name in sorted(schema)
+        }
+        return {name: values[name] for name in schema}
+
+    def sample(self, schema, n, start_index=0):
+        """Return a dictionary mapping each parameter name to the values of 'n' trials."""
+        import numpy as np
+
+        columns = {name: np.empty(n, dtype=object) for name in schema}
+        for position in range(n):
+            values = self.sample_trial(schema, start_index + position)
+            for name, value in values.items():
+                columns[name][position] = value
+        return columns
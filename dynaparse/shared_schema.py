@@ -0,0 +1,209 @@
+from array import array
+from collections.abc import Mapping
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import weakref
+
+from dynaparse.dynamic_configuration import DynamicConfiguration
+from dynaparse.util.schema_validator import SchemaValidator
+
+MAGIC = b"DYNS"
+FORMAT_VERSION = 1
+# Magic, format version and number of parameters
+PREAMBLE = struct.Struct("<4sBI")
+# Offset and length of the name, parameter dict and value of a parameter
+ENTRY = struct.Struct("<QIQIQI")
+SHARED_MEMORY_DIR = "/dev/shm"
+
+
+def _release(buffer, filename, owner_pid):
+    """Close a mapped file, removing it if this process created it."""
+    buffer.close()
+    if owner_pid == os.getpid() and os.path.exists(filename):
+        os.remove(filename)
+
+
+class SharedSchema(Mapping):
+    """Read-only schema and values of a configuration, memory-mapped from a file.
+
+    The file holds one fixed-width entry per parameter in schema order, the entry
+    indices sorted by name, then the UTF-8 names and JSON-encoded parameter dicts
+    and values (empty for optional parameters without a value). Processes opening
+    the same file share its pages, and a parameter is only decoded (once per
+    process) when it is looked up, so memory stays flat as workers are added.
+    Pickling sends the filename only, so attaching from a spawned worker costs an
+    mmap and a binary search per looked up name.
+    """
+
+    def __init__(self, filename, _owner_pid=None):
+        """Attach to the shared schema file 'filename'."""
+        self.filename = filename
+        self._owner_pid = _owner_pid
+        with open(filename, "rb") as fd:
+            self._buffer = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._num_entries = PREAMBLE.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self._buffer.close()
+            raise Exception("File '%s' is not a dynaparse shared schema" % (filename))
+        if version > FORMAT_VERSION:
+            self._buffer.close()
+            raise Exception(
+                "File '%s' has unsupported format version %d" % (filename, version)
+            )
+        self._sorted_offset = PREAMBLE.size + ENTRY.size * self._num_entries
+        self._parameters = {}
+        # Also releases the file if the owner is never closed
+        self._finalizer = weakref.finalize(
+            self, _release, self._buffer, filename, _owner_pid
+        )
+
+    @classmethod
+    def create(cls, dynamic_config, filename=None):
+        """Write the schema and current values of a configuration and attach to them.
+
+        Without a filename, the file is created in shared memory ('/dev/shm') where
+        available, or in the temporary directory otherwise. The returned instance
+        owns the file and removes it on 'close', on garbage collection or at exit.
+        """
+        if filename is None:
+            directory = SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None
+            fd, filename = tempfile.mkstemp(
+                prefix="dynaparse_", suffix=".schema", dir=directory
+            )
+            os.close(fd)
+        values = dynamic_config.get_values(random=False)
+        names = list(dynamic_config._schema)
+        encoded_names = [name.encode("utf-8") for name in names]
+        chunks = []
+        entries = []
+        offset = PREAMBLE.size + (ENTRY.size + 4) * len(names)  # Data comes last
+        for name, encoded_name in zip(names, encoded_names):
+            entry = []
+            for chunk in (
+                encoded_name,
+                json.dumps(dynamic_config._raw_schema[name]).encode("utf-8"),
+                json.dumps(values[name]).encode("utf-8") if name in values else b"",
+            ):
+                entry += [offset, len(chunk)]
+                chunks.append(chunk)
+                offset += len(chunk)
+            entries.append(ENTRY.pack(*entry))
+        sorted_indices = array(
+            "I", sorted(range(len(names)), key=encoded_names.__getitem__)
+        )
+        if sys.byteorder == "big":
+            sorted_indices.byteswap()
+        with open(filename, "wb") as fd:
+            fd.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(names)))
+            fd.write(b"".join(entries))
+            fd.write(sorted_indices.tobytes())
+            fd.write(b"".join(chunks))
+        return cls(filename, _owner_pid=os.getpid())
+
+    def __enter__(self):
+        """Return this shared schema."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the shared schema."""
+        self.close()
+
+    def __reduce__(self):
+        """Pickle the filename only; the unpickled copy attaches without owning the file."""
+        return (SharedSchema, (self.filename,))
+
+    def __getitem__(self, name):
+        """Return the parameter object of a name, decoding it on first access."""
+        parameter = self._parameters.get(name)
+        if parameter is None:
+            parameter = SchemaValidator.build_parameter(self.get_parameter_dict(name))
+            self._parameters[name] = parameter
+        return parameter
+
+    def __iter__(self):
+        """Yield the names in schema order."""
+        for index in range(self._num_entries):
+            yield self._read_chunk(index, 0).decode("utf-8")
+
+    def __len__(self):
+        """Return the number of parameters."""
+        return self._num_entries
+
+    def __contains__(self, name):
+        """Return whether a parameter exists, without decoding it."""
+        return isinstance(name, str) and self._find(name) is not None
+
+    def get_parameter_dict(self, name):
+        """Return the raw parameter dict of a name."""
+        return json.loads(self._read_chunk(self._get_index(name), 1))
+
+    def get_value(self, name):
+        """Return the value of a name, decoded anew so callers may modify it.
+
+        Raises a 'KeyError' for optional parameters without a value.
+        """
+        encoded_value = self._read_chunk(self._get_index(name), 2)
+        if len(encoded_value) == 0:
+            raise KeyError(name)
+        return json.loads(encoded_value)
+
+    def get_values(self, names=None):
+        """Return the flat values of 'names', or of every parameter, skipping those without one."""
+        values = {}
+        for index, name in (
+            enumerate(self)
+            if names is None
+            else ((self._get_index(name), name) for name in names)
+        ):
+            encoded_value = self._read_chunk(index, 2)
+            if len(encoded_value) > 0:
+                values[name] = json.loads(encoded_value)
+        return values
+
+    def to_dynamic_config(self):
+        """Return a 'DynamicConfiguration' holding every parameter and value."""
+        dynamic_config = DynamicConfiguration()
+        for index, name in enumerate(self):
+            dynamic_config._raw_schema[name] = json.loads(self._read_chunk(index, 1))
+            dynamic_config._schema[name] = self[name]
+        dynamic_config.set_values(self.get_values()).raise_if_invalid()
+        return dynamic_config
+
+    def close(self):
+        """Detach from the file, removing it if this process created it."""
+        self._finalizer()
+
+    def _get_index(self, name):
+        """Return the entry index of a name."""
+        index = self._find(name)
+        if index is None:
+            raise KeyError(name)
+        return index
+
+    def _find(self, name):
+        """Return the entry index of a name by binary search over sorted names, or None."""
+        encoded_name = name.encode("utf-8")
+        low, high = 0, self._num_entries
+        while low < high:
+            middle = (low + high) // 2
+            index = struct.unpack_from(
+                "<I", self._buffer, self._sorted_offset + 4 * middle
+            )[0]
+            middle_name = self._read_chunk(index, 0)
+            if middle_name < encoded_name:
+                low = middle + 1
+            elif middle_name > encoded_name:
+                high = middle
+            else:
+                return index
+        return None
+
+    def _read_chunk(self, index, field):
+        """Return the bytes of field 0 (name), 1 (parameter dict) or 2 (value) of an entry."""
+        entry = ENTRY.unpack_from(self._buffer, PREAMBLE.size + ENTRY.size * index)
+        offset, length = entry[2 * field], entry[2 * field + 1]
+        return self._buffer[offset : offset + length]
@@ -0,0 +1,241 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from dynaparse.dynamic_configuration import DynamicConfiguration
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.samplers.grid_sampler import shard_range
+
+
+def resolve_target(target):
+    """Return a callable for a 'module:callable' string, or the target itself."""
+    if not isinstance(target, str):
+        return target
+    module_name, _, attribute_name = target.partition(":")
+    if attribute_name == "":
+        raise Exception(
+            "Target '%s' should be a script path or 'module:callable'" % (target)
+        )
+    return getattr(import_module(module_name), attribute_name)
+
+
+def import_module(module_name):
+    """Import a module, resolving it relative to the working directory if needed."""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    path = os.getcwd()
+    if path in sys.path:
+        return importlib.import_module(module_name)
+    sys.path.append(path)  # Only while importing, so workers don't accumulate entries
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        sys.path.remove(path)
+
+
+def run_trial(target, index, values, spec, script_args):
+    """Run one configuration through a callable or script and return its record."""
+    start_time = time.time()
+    result = None
+    error = None
+    try:
+        if isinstance(target, str) and target.endswith(".py"):
+            result = run_script(target, values, spec, script_args)
+        else:
+            result = resolve_target(target)(
+                ConfigurationFileParser.expand_flat_config(values)
+            )
+    except Exception as e:
+        error = "%s: %s" % (type(e).__name__, str(e))
+    return {
+        "index": index,
+        "config": values,
+        "result": result,
+        "error": error,
+        "elapsed": time.time() - start_time,
+    }
+
+
+def run_script(script, values, spec, script_args):
+    """Run a script with a config file holding 'values' and return its exit code."""
+    fd, config_path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as config_fd:
+            json.dump(ConfigurationFileParser.expand_flat_config(values), config_fd)
+        command = [sys.executable, script, "--config", config_path]
+        if spec is not None:
+            command += ["--spec", spec]
+        returncode = subprocess.call(command + list(script_args))
+    finally:
+        os.remove(config_path)
+    if returncode != 0:
+        raise Exception("Script '%s' exited with code %d" % (script, returncode))
+    return returncode
+
+
+class SweepRunner:
+    """Sample configurations from a spec and run them across a process pool.
+
+    The target is a picklable callable, a 'module:callable' string, or a path to a
+    '.py' script. Callables receive each configuration as a nested dictionary;
+    scripts are run with '--config <file> --spec <spec>', as 'DynamicArgumentParser'
+    expects. One JSON record per trial is written to 'output' as trials complete.
+    """
+
+    def __init__(
+        self,
+        spec,
+        target,
+        num_samples,
+        output=None,
+        max_workers=None,
+        seed=None,
+        script_args=(),
+        sampler="random",
+        shard_index=0,
+        num_shards=1,
+    ):
+        """Instantiate a sweep over 'num_samples' configurations of 'spec'.
+
+        Configurations are seeded random trials, unless 'sampler' names a
+        space-filling design ('lhs' or 'sobol') or the full grid ('grid', where
+        'num_samples' may be None to run every point). Without a seed, one is drawn
+        and kept in 'self.seed' so the sweep can be reproduced. Only shard
+        'shard_index' of 'num_shards' contiguous shards of the configurations is run.
+        """
+        if num_samples is None and sampler != "grid":
+            raise Exception("'num_samples' is required unless sampler is 'grid'")
+        if seed is None:
+            import numpy as np
+
+            seed = np.random.SeedSequence().entropy
+        self.spec = spec
+        self.target = target
+        self.num_samples = num_samples
+        self.output = output
+        self.max_workers = max_workers if max_workers else os.cpu_count() or 1
+        self.seed = seed
+        self.script_args = list(script_args)
+        self.sampler = sampler
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self._dynamic_config = (
+            spec
+            if isinstance(spec, DynamicConfiguration)
+            else DynamicConfiguration(spec=spec)
+        )
+
+    def get_configs(self):
+        """Return the list of this shard's configurations as flat value dictionaries."""
+        return [values for _, values in self.iter_configs()]
+
+    def iter_configs(self):
+        """Yield (index, values) pairs of this shard's configurations."""
+        if self.sampler == "grid":
+            grid = self._dynamic_config.get_grid()
+            if self.num_samples is not None:
+                grid = grid[: self.num_samples]
+            return grid.shard(self.shard_index, self.num_shards).iter_indexed()
+        indices = shard_range(
+            range(self.num_samples), self.shard_index, self.num_shards
+        )
+        if self.sampler == "random":
+            return (
+                (index, self._dynamic_config.sample_trial(index, self.seed))
+                for index in indices
+            )
+        records = self._dynamic_config.sample_design(
+            self.num_samples, self.sampler, seed=self.seed, as_records=True
+        )
+        return ((index, records[index]) for index in indices)
+
+    def run(self):
+        """Run every trial and return a summary of the sweep.
+
+        Records are written to 'output' as JSON lines as trials complete, or as a
+        'TrialArchive' if it ends with '.parquet', and are not kept in memory; use
+        'iter_results' to consume them directly. The summary holds 'num_trials',
+        'num_failed', 'seed' and 'output'.
+        """
+        summary = {
+            "num_trials": 0,
+            "num_failed": 0,
+            "seed": self.seed,
+            "output": self.output,
+        }
+        if self.output is None:
+            for record in self.iter_results():
+                self._update_summary(summary, record)
+        elif self.output.endswith(".parquet"):
+            self._run_to_archive(summary)
+        else:
+            with open(self.output, "w") as fd:
+                for record in self.iter_results():
+                    fd.write(json.dumps(record, default=str) + "\n")
+                    fd.flush()
+                    self._update_summary(summary, record)
+        return summary
+
+    def _run_to_archive(self, summary):
+        """Run every trial, appending flat configs and outcomes to a Parquet archive."""
+        from dynaparse.trial_archive import TrialArchive, import_pyarrow
+
+        pa, _ = import_pyarrow()
+        extra_columns = {
+            "trial.index": pa.int64(),
+            "trial.result": pa.string(),  # JSON-encoded
+            "trial.error": pa.string(),
+            "trial.elapsed": pa.float64(),
+        }
+        with TrialArchive(self.output, self._dynamic_config, extra_columns) as archive:
+            for record in self.iter_results():
+                archive.append(
+                    {
+                        **record["config"],
+                        "trial.index": record["index"],
+                        "trial.result": json.dumps(record["result"], default=str),
+                        "trial.error": record["error"],
+                        "trial.elapsed": record["elapsed"],
+                    }
+                )
+                self._update_summary(summary, record)
+
+    @staticmethod
+    def _update_summary(summary, record):
+        """Count a completed trial record into a sweep summary."""
+        summary["num_trials"] += 1
+        summary["num_failed"] += record["error"] is not None
+
+    def iter_results(self):
+        """Yield trial records as they complete, keeping at most two per worker in flight."""
+        spec = self._dynamic_config.spec
+        spec_filename = spec if isinstance(spec, str) else None
+        configs = self.iter_configs()
+        max_pending = 2 * self.max_workers
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for index, values in configs:
+                pending.add(
+                    executor.submit(
+                        run_trial,
+                        self.target,
+                        index,
+                        values,
+                        spec_filename,
+                        self.script_args,
+                    )
+                )
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
@@ -0,0 +1,219 @@
+import json
+
+from dynaparse.dynamic_configuration import DynamicConfiguration
+
+DEFAULT_ROW_GROUP_SIZE = 65536
+SPEC_METADATA_KEY = b"dynaparse.spec"
+
+
+def import_pyarrow():
+    """Return the pyarrow and pyarrow.parquet modules."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Trial archives require pyarrow, install it with 'pip install dynaparse[arrow]'"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def get_arrow_type(parameter):
+    """Return the Arrow type of a parameter's values."""
+    pa, _ = import_pyarrow()
+    scalar_types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "str": pa.string(),
+        "dict": pa.string(),  # JSON-encoded
+    }
+    if parameter.parameter_type == "categorical":
+        return pa.dictionary(pa.int32(), pa.string())
+    if parameter.parameter_type == "list":
+        return pa.list_(scalar_types[parameter.value_type])
+    return scalar_types[parameter.parameter_type]
+
+
+class TrialArchive:
+    """Parquet file of flat configurations, one typed column per parameter.
+
+    Column types come from the schema: int64, float64, bool and string scalars,
+    dictionary-encoded categoricals, and list columns; 'extra_columns' maps further
+    names (results, timings...) to Arrow types. Rows are buffered and written one
+    row group at a time, so memory stays bounded however many trials are appended.
+    The flat spec is stored in the file metadata so configurations can be read back.
+    """
+
+    def __init__(
+        self,
+        filename,
+        dynamic_config,
+        extra_columns=None,
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+    ):
+        """Open 'filename' for writing configurations of 'dynamic_config'."""
+        self.filename = filename
+        self.dynamic_config = dynamic_config
+        self.extra_columns = dict(extra_columns) if extra_columns is not None else {}
+        self.row_group_size = row_group_size
+        self.arrow_schema = self.get_arrow_schema(dynamic_config, self.extra_columns)
+        self._buffer = []
+        self._writer = None
+
+    def __enter__(self):
+        """Return this archive."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive."""
+        self.close()
+
+    @classmethod
+    def get_arrow_schema(cls, dynamic_config, extra_columns=None):
+        """Return the Arrow schema of a configuration's flat values and extra columns."""
+        pa, _ = import_pyarrow()
+        fields = [
+            pa.field(name, get_arrow_type(parameter))
+            for name, parameter in dynamic_config._schema.items()
+        ]
+        for name, arrow_type in (extra_columns or {}).items():
+            fields.append(pa.field(name, arrow_type))
+        metadata = {SPEC_METADATA_KEY: json.dumps(dict(dynamic_config._raw_schema))}
+        return pa.schema(fields, metadata=metadata)
+
+    @classmethod
+    def to_table(cls, dynamic_config, records, extra_columns=None):
+        """Return an Arrow table of flat value dictionaries."""
+        pa, _ = import_pyarrow()
+        arrow_schema = cls.get_arrow_schema(dynamic_config, extra_columns)
+        return pa.Table.from_pydict(
+            cls._to_columns(dynamic_config._schema, arrow_schema, records),
+            schema=arrow_schema,
+        )
+
+    def append(self, values):
+        """Buffer one flat value dictionary, writing a row group when the buffer is full."""
+        self._buffer.append(values)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def extend(self, records):
+        """Append many flat value dictionaries."""
+        for values in records:
+            self.append(values)
+
+    def flush(self):
+        """Write the buffered rows as a row group."""
+        if len(self._buffer) == 0:
+            return
+        pa, pq = import_pyarrow()
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.filename, self.arrow_schema)
+        self._writer.write_table(
+            pa.Table.from_pydict(
+                self._to_columns(
+                    self.dynamic_config._schema, self.arrow_schema, self._buffer
+                ),
+                schema=self.arrow_schema,
+            ),
+            row_group_size=self.row_group_size,
+        )
+        self._buffer = []
+
+    def close(self):
+        """Write the remaining rows and close the file."""
+        self.flush()
+        if self._writer is None:  # Nothing appended: write an empty file
+            _, pq = import_pyarrow()
+            self._writer = pq.ParquetWriter(self.filename, self.arrow_schema)
+        self._writer.close()
+
+    @classmethod
+    def read_table(cls, filename):
+        """Return the whole archive as an Arrow table."""
+        _, pq = import_pyarrow()
+        return pq.read_table(filename)
+
+    @classmethod
+    def iter_configs(cls, filename, dynamic_config=None, batch_size=None):
+        """Yield a 'DynamicConfiguration' per row, reading one batch at a time.
+
+        Values are cast with the schema of 'dynamic_config', or with the spec stored
+        in the archive; extra columns are ignored. Rows share one read-only copy of
+        the schema, as configurations loaded from a memoized spec do, and null
+        cells of optional parameters are left unset.
+        """
+        _, pq = import_pyarrow()
+        parquet_file = pq.ParquetFile(filename)
+        if dynamic_config is None:
+            dynamic_config = cls.get_dynamic_config(parquet_file.schema_arrow)
+        names = [
+            name
+            for name in parquet_file.schema_arrow.names
+            if name in dynamic_config._schema
+        ]
+        raw_schema = dict(dynamic_config._raw_schema)
+        schema = dict(dynamic_config._schema)
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_size or DEFAULT_ROW_GROUP_SIZE, columns=names
+        ):
+            for values in batch.to_pylist():
+                row_config = DynamicConfiguration()
+                row_config.spec = dynamic_config.spec
+                row_config._raw_schema = raw_schema
+                row_config._schema = schema
+                row_config.set_values(cls._from_row(schema, values)).raise_if_invalid()
+                yield row_config
+
+    @classmethod
+    def load_configs(cls, filename, dynamic_config=None):
+        """Return a 'DynamicConfiguration' per row."""
+        return list(cls.iter_configs(filename, dynamic_config))
+
+    @classmethod
+    def get_dynamic_config(cls, arrow_schema):
+        """Return an empty configuration with the spec stored in an archive's schema."""
+        dynamic_config = DynamicConfiguration()
+        for name, parameter_dict in json.loads(
+            arrow_schema.metadata[SPEC_METADATA_KEY]
+        ).items():
+            dynamic_config._raw_schema[name] = parameter_dict
+            dynamic_config._append_parameter_from_dict(name, parameter_dict)
+        return dynamic_config
+
+    @staticmethod
+    def _to_columns(schema, arrow_schema, records):
+        """Return the columns of a list of flat value dictionaries, in schema order."""
+        columns = {}
+        for name in arrow_schema.names:
+            column = [values.get(name) for values in records]
+            parameter = schema.get(name)
+            if (
+                parameter is not None
+                and getattr(parameter, "value_type", None) == "dict"
+            ):
+                column = [
+                    None if value is None else [json.dumps(item) for item in value]
+                    for value in column
+                ]
+            columns[name] = column
+        return columns
+
+    @staticmethod
+    def _from_row(schema, values):
+        """Return the flat values of a row, decoding JSON-encoded dictionaries.
+
+        Nulls of optional parameters were missing values when written, and are dropped.
+        """
+        row_values = {}
+        for name, value in values.items():
+            parameter = schema[name]
+            if value is None:
+                if parameter.required:
+                    row_values[name] = value
+            elif getattr(parameter, "value_type", None) == "dict":
+                row_values[name] = [json.loads(item) for item in value]
+            else:
+                row_values[name] = value
+        return row_values
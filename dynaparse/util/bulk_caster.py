@@ -0,0 +1,154 @@
+from dynaparse.util.validation_report import ValidationReport
+
+# Placeholder for values that failed to cast
+INVALID = object()
+
+CAST_ERROR_MESSAGE = (
+    "Exception encountered while typecasting parameter '%s' with value '%s'"
+)
+UNKNOWN_NAME_MESSAGE = "Parameter name '%s' not recognized in schema"
+
+
+def is_none(value):
+    """Return whether a raw value casts to None."""
+    return value is None or (isinstance(value, str) and value == "None")
+
+
+class BulkCaster:
+    """Cast columns of raw values, one pass per parameter type.
+
+    Float columns that already hold numbers, and int columns that already hold
+    int64-range integers, are concatenated and checked with a single NumPy
+    conversion; other columns go through each parameter's precomputed caster.
+    Values cast exactly as 'BaseParameter.cast' would, but failures are collected
+    in a 'ValidationReport' instead of raised.
+    """
+
+    @classmethod
+    def cast_columns(cls, schema, columns, indices=None):
+        """Cast each column in 'columns' with the schema parameter of the same name.
+
+        'indices' optionally maps names to the config index of each value, which is
+        what gets reported. Returns (casted_columns, report); values that failed
+        are replaced by 'INVALID'.
+        """
+        return cls._process_columns(schema, columns, indices, keep_values=True)
+
+    @classmethod
+    def validate_columns(cls, schema, columns, indices=None):
+        """Check that every value in 'columns' casts, and return the report."""
+        return cls._process_columns(schema, columns, indices, keep_values=False)[1]
+
+    @classmethod
+    def _process_columns(cls, schema, columns, indices, keep_values):
+        """Cast or validate columns, grouped by parameter type."""
+        report = ValidationReport()
+        if indices is None:
+            indices = {}
+        groups = {}
+        casted_columns = {}
+        for name, values in columns.items():
+            report.num_checked += len(values)
+            if name not in schema:
+                for position, value in enumerate(values):
+                    report.add_issue(
+                        name,
+                        value,
+                        UNKNOWN_NAME_MESSAGE % (name),
+                        cls._get_index(indices, name, position),
+                    )
+                casted_columns[name] = [INVALID] * len(values)
+                continue
+            groups.setdefault(schema[name].parameter_type, []).append(name)
+        for parameter_type, names in groups.items():
+            group_columns = {name: columns[name] for name in names}
+            if parameter_type in ("float", "int"):
+                casted = cls._cast_numeric_group(
+                    parameter_type, schema, group_columns, report, indices, keep_values
+                )
+            else:
+                casted = {
+                    name: cls._cast_column(
+                        name, schema[name], values, report, indices, keep_values
+                    )
+                    for name, values in group_columns.items()
+                }
+            casted_columns.update(casted)
+        return casted_columns, report
+
+    @classmethod
+    def _cast_numeric_group(
+        cls, parameter_type, schema, columns, report, indices, keep_values
+    ):
+        """Cast all int or float columns of a group at once if they only hold numbers.
+
+        Int columns only take the fast path if NumPy stores them as int64 (or
+        bool), since converting floats or object arrays would truncate or wrap.
+        """
+        import numpy as np
+
+        values = []
+        for column in columns.values():
+            values.extend(column)
+        flat = None
+        if all(
+            len(column) == 0 or isinstance(column[0], (int, float))
+            for column in columns.values()
+        ):
+            try:
+                flat = np.asarray(values)
+            except (ValueError, OverflowError):  # Ragged nested lists, huge ints
+                pass
+        is_numeric = (
+            flat is not None
+            and flat.ndim == 1
+            and flat.dtype.kind in ("bif" if parameter_type == "float" else "bi")
+        )
+        if not is_numeric:
+            # Strings, None or invalid values: cast value by value
+            return {
+                name: cls._cast_column(
+                    name, schema[name], column, report, indices, keep_values
+                )
+                for name, column in columns.items()
+            }
+        if not keep_values:
+            return {}
+        flat = flat.astype(np.int64 if parameter_type == "int" else np.float64).tolist()
+        casted_columns = {}
+        start = 0
+        for name, column in columns.items():
+            casted_columns[name] = flat[start : start + len(column)]
+            start += len(column)
+        return casted_columns
+
+    @classmethod
+    def _cast_column(cls, name, parameter, values, report, indices, keep_values):
+        """Cast a column with the parameter's caster, locating failures on error."""
+        typefunc = parameter.get_typefunc()
+        try:
+            casted = [
+                None if value is None or value == "None" else typefunc(value)
+                for value in values
+            ]
+            return casted if keep_values else []
+        except Exception:
+            pass
+        casted = []
+        for position, value in enumerate(values):
+            try:
+                casted.append(None if is_none(value) else typefunc(value))
+            except Exception:
+                report.add_issue(
+                    name,
+                    value,
+                    CAST_ERROR_MESSAGE % (parameter.name, str(value)),
+                    cls._get_index(indices, name, position),
+                )
+                casted.append(INVALID)
+        return casted
+
+    @staticmethod
+    def _get_index(indices, name, position):
+        """Return the config index of a value, if known."""
+        return indices[name][position] if name in indices else None
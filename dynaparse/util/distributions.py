@@ -0,0 +1,47 @@
+# Coefficients of Acklam's rational approximation of the inverse normal CDF
+_PPF_A = (
+    -39.69683028665376,
+    220.9460984245205,
+    -275.9285104469687,
+    138.3577518672690,
+    -30.66479806614716,
+    2.506628277459239,
+)
+_PPF_B = (
+    -54.47609879822406,
+    161.5858368580409,
+    -155.6989798598866,
+    66.80131188771972,
+    -13.28068155288572,
+)
+_PPF_C = (
+    -0.007784894002430293,
+    -0.3223964580411365,
+    -2.400758277161838,
+    -2.549732539343734,
+    4.374664141464968,
+    2.938163982698783,
+)
+_PPF_D = (
+    0.007784695709041462,
+    0.3224671290700398,
+    2.445134137142996,
+    3.754408661907416,
+)
+_PPF_LOW = 0.02425
+
+
+def normal_ppf(u):
+    """Return the standard normal quantiles of an array of probabilities in (0, 1)."""
+    import numpy as np
+
+    u = np.clip(np.asarray(u, dtype=np.float64), 1e-12, 1 - 1e-12)
+    tail = np.minimum(u, 1 - u)
+    q = np.sqrt(-2 * np.log(tail))
+    tail_value = np.polyval(_PPF_C, q) / np.polyval(_PPF_D + (1,), q)
+    q = u - 0.5
+    r = q * q
+    central_value = q * np.polyval(_PPF_A, r) / np.polyval(_PPF_B + (1,), r)
+    return np.where(
+        tail < _PPF_LOW, np.where(u < 0.5, tail_value, -tail_value), central_value
+    )
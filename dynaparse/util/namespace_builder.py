@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+
+class FrozenNamespace:
+    """Read-only namespace holding its attributes in a single slotted dictionary."""
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, **fields):
+        """Instantiate a namespace with attributes 'fields'."""
+        object.__setattr__(self, "_fields", fields)
+
+    def __getattr__(self, name):
+        """Return an attribute."""
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(
+                "'FrozenNamespace' object has no attribute '%s'" % (name)
+            ) from None
+
+    def __setattr__(self, name, value):
+        """Refuse to set attributes."""
+        raise AttributeError("'FrozenNamespace' object is read-only")
+
+    def __delattr__(self, name):
+        """Refuse to delete attributes."""
+        raise AttributeError("'FrozenNamespace' object is read-only")
+
+    def __contains__(self, name):
+        """Return whether an attribute exists."""
+        return name in self._fields
+
+    def __dir__(self):
+        """Return the attribute names."""
+        return list(self._fields)
+
+    def __eq__(self, other):
+        """Return whether both namespaces have equal attributes."""
+        return isinstance(other, FrozenNamespace) and self._fields == other._fields
+
+    def __repr__(self):
+        """Return a representation listing the attributes."""
+        return "FrozenNamespace(%s)" % (
+            ", ".join("%s=%r" % (name, value) for name, value in self._fields.items())
+        )
+
+    def __reduce__(self):
+        """Pickle through the constructor, since attributes can't be set."""
+        return (_make_frozen_namespace, (self._fields,))
+
+    def to_dict(self):
+        """Return the attributes as nested dictionaries."""
+        return {
+            name: value.to_dict() if isinstance(value, FrozenNamespace) else value
+            for name, value in self._fields.items()
+        }
+
+
+def _make_frozen_namespace(fields):
+    """Return a 'FrozenNamespace' with attributes 'fields'."""
+    return FrozenNamespace(**fields)
+
+
+class _Section(dict):
+    """Children of a dotted prefix, told apart from dictionary values."""
+
+
+class NamespaceBuilder:
+    """Build nested namespaces from dotted names in one pass over the names."""
+
+    @classmethod
+    def build(cls, flat_items, namespace_class=SimpleNamespace):
+        """Return a dictionary of top-level names to values or nested namespaces.
+
+        'flat_items' are (dotted_name, value) pairs; every dotted prefix becomes a
+        'namespace_class' instance holding its children as attributes.
+        """
+        return cls._to_namespaces(cls._build_tree(flat_items), namespace_class)
+
+    @staticmethod
+    def _build_tree(flat_items):
+        """Group values by dotted prefix into nested sections."""
+        root = _Section()
+        for name, value in flat_items:
+            *section_names, leaf_name = name.split(".")
+            node = root
+            for section_name in section_names:
+                child = node.get(section_name)
+                if child is None:
+                    child = node[section_name] = _Section()
+                elif not isinstance(child, _Section):
+                    raise Exception(
+                        "Name '%s' is used both as a value and as a section in '%s'"
+                        % (section_name, name)
+                    )
+                node = child
+            if isinstance(node.get(leaf_name), _Section):
+                raise Exception(
+                    "Name '%s' is used both as a value and as a section" % (name)
+                )
+            node[leaf_name] = value
+        return root
+
+    @classmethod
+    def _to_namespaces(cls, section, namespace_class):
+        """Return the values of a section, with subsections made namespaces."""
+        return {
+            name: (
+                namespace_class(**cls._to_namespaces(value, namespace_class))
+                if isinstance(value, _Section)
+                else value
+            )
+            for name, value in section.items()
+        }
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+import os
+import threading
+
+DEFAULT_MAX_SIZE = 128
+
+
+def get_file_version(filename):
+    """Return the (mtime_ns, size) version of a file, or None if it is missing."""
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:  # Being replaced, for instance
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def copy_mutable(value):
+    """Return a copy of nested lists and dictionaries, sharing their immutable leaves."""
+    if isinstance(value, list):
+        return [copy_mutable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: copy_mutable(item) for key, item in value.items()}
+    return value
+
+
+class ParseCache:
+    """In-process LRU cache of parsed files, keyed by path and file stats.
+
+    A file's entry is reused only while its modification time and size (or, with
+    'use_hash', its contents) are unchanged. Cached values are shared between
+    callers and must be treated as immutable: copy mutable values (see
+    'copy_mutable') before handing them out.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, use_hash=False):
+        """Instantiate a cache holding at most 'max_size' entries."""
+        self.max_size = max_size
+        self.use_hash = use_hash
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def get_key(self, kind, filename, *extra):
+        """Return the key of a parsed file; 'kind' and 'extra' tell parsings apart."""
+        path = os.path.abspath(filename)
+        if self.use_hash:
+            import hashlib
+
+            with open(path, "rb") as fd:
+                version = hashlib.sha256(fd.read()).hexdigest()
+        else:
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        return (kind, path, version) + extra
+
+    def get(self, key):
+        """Return a cached value, or None on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entries beyond 'max_size'."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, filename=None):
+        """Drop the entries of a file, or every entry if no file is given."""
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(filename)
+            for key in [key for key in self._entries if key[1] == path]:
+                del self._entries[key]
+
+
+# Cache shared by every 'DynamicConfiguration' in the process
+PARSE_CACHE = ParseCache()
@@ -1,5 +1,6 @@
 import enum
 from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.parameters.base_parameter import trusted_construction
 from dynaparse.parameters.boolean_parameter import BooleanParameter
 from dynaparse.parameters.categorical_parameter import CategoricalParameter
 from dynaparse.parameters.float_parameter import FloatParameter
@@ -7,7 +8,6 @@ from dynaparse.parameters.int_parameter import IntParameter
 from dynaparse.parameters.list_parameter import ListParameter
 from dynaparse.parameters.string_parameter import StringParameter
 
-
 NO_HELP_CONFIGURED_STR = ""  # "(NO HELP CONFIGURED)"
 
 
@@ -15,6 +15,12 @@ class SchemaBuilder:
     @classmethod
     def _get_parameter_dict_for_value(cls, name, value):
         """Get a parameter dict given a static value."""
+        with trusted_construction():  # Field types follow from the value's type
+            return cls._get_parameter_for_value(name, value).to_dict()
+
+    @classmethod
+    def _get_parameter_for_value(cls, name, value):
+        """Get a parameter object given a static value."""
         if isinstance(value, bool):
             param = BooleanParameter(
                 name=name, help=NO_HELP_CONFIGURED_STR, required=True, default=value
@@ -66,7 +72,7 @@ class SchemaBuilder:
                 "Can't infer type for variable %s of type %s and value %s"
                 % (name, str(type(value)), str(value))
             )
-        return param.to_dict()
+        return param
 
     @classmethod
     def _get_value_type_from_list(cls, value_list):
@@ -96,6 +102,11 @@ class SchemaBuilder:
     def infer_from_flat_config(cls, flat_config):
         inferred_schema = {}
         for key, value in flat_config.items():
-            name = key.split(".")[-1]
-            inferred_schema[key] = cls._get_parameter_dict_for_value(name, value)
+            inferred_schema[key] = cls.infer_from_flat_item(key, value)
         return inferred_schema
+
+    @classmethod
+    def infer_from_flat_item(cls, key, value):
+        """Infer a parameter dict from a single flattened (dotted_key, value) pair."""
+        name = key.split(".")[-1]
+        return cls._get_parameter_dict_for_value(name, value)
@@ -0,0 +1,80 @@
+from dynaparse.parameters.base_parameter import trusted_construction
+from dynaparse.parameters.boolean_parameter import BooleanParameter
+from dynaparse.parameters.categorical_parameter import CategoricalParameter
+from dynaparse.parameters.float_parameter import FloatParameter
+from dynaparse.parameters.int_parameter import IntParameter
+from dynaparse.parameters.list_parameter import ListParameter
+from dynaparse.parameters.string_parameter import StringParameter
+
+PARAMETER_CLASSES = {
+    "bool": BooleanParameter,
+    "categorical": CategoricalParameter,
+    "float": FloatParameter,
+    "int": IntParameter,
+    "list": ListParameter,
+    "str": StringParameter,
+}
+
+# Accepted instance types per annotation, matching what typeguard accepts
+ACCEPTED_TYPES = {
+    bool: (bool,),
+    float: (float, int),
+    int: (int,),
+    list: (list,),
+    str: (str,),
+}
+
+
+class SchemaValidator:
+    """Validate and build a whole flattened spec in one pass, without typeguard.
+
+    Field validators are precomputed once per parameter class, so validating a
+    parameter costs one 'isinstance' check per field.
+    """
+
+    _field_validators = {}
+
+    @classmethod
+    def build_schema(cls, raw_schema):
+        """Validate a flattened spec and return the dict of parameter objects."""
+        return {
+            parameter_name: cls.build_parameter(parameter_dict)
+            for parameter_name, parameter_dict in raw_schema.items()
+        }
+
+    @classmethod
+    def build_parameter(cls, parameter_dict):
+        """Validate a parameter dict and construct its parameter object."""
+        parameter_class = cls.get_parameter_class(parameter_dict["parameter_type"])
+        cls.validate_parameter_dict(parameter_dict, parameter_class)
+        with trusted_construction():
+            return parameter_class(**parameter_dict)
+
+    @classmethod
+    def get_parameter_class(cls, parameter_type):
+        """Return the parameter class for a 'parameter_type' string."""
+        if parameter_type not in PARAMETER_CLASSES:
+            raise Exception("Unrecognized parameter type '%s'" % (parameter_type))
+        return PARAMETER_CLASSES[parameter_type]
+
+    @classmethod
+    def validate_parameter_dict(cls, parameter_dict, parameter_class):
+        """Check field types of a parameter dict, raising TypeError like strict construction."""
+        for field_name, accepted_types in cls._get_field_validators(parameter_class):
+            value = parameter_dict.get(field_name)
+            if value is not None and not isinstance(value, accepted_types):
+                raise TypeError(
+                    "Parameter '%s' (value: '%s') type invalid, should be '%s'"
+                    % (field_name, str(value), str(accepted_types[0]))
+                )
+
+    @classmethod
+    def _get_field_validators(cls, parameter_class):
+        """Return (field_name, accepted_types) pairs for a parameter class, computed once."""
+        if parameter_class not in cls._field_validators:
+            cls._field_validators[parameter_class] = [
+                (field_name, ACCEPTED_TYPES[field.type])
+                for field_name, field in parameter_class.__dataclass_fields__.items()
+                if field.type in ACCEPTED_TYPES
+            ]
+        return cls._field_validators[parameter_class]
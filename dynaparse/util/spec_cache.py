@@ -0,0 +1,104 @@
+import os
+import sys
+
+from dynaparse.version import __version__
+
+CACHE_DIR_ENV_VAR = "DYNAPARSE_CACHE_DIR"
+DISABLE_CACHE_ENV_VAR = "DYNAPARSE_DISABLE_SPEC_CACHE"
+
+
+class SpecCache:
+    """On-disk cache of compiled specs, keyed by spec file contents and dynaparse version.
+
+    Entries are pickles, and loading a pickle can run arbitrary code: the cache
+    is only used once a directory is chosen, and only entries owned by the current
+    user and not writable by others are loaded. Never point it at a directory
+    other users can write to.
+    """
+
+    def __init__(self, cache_dir=None):
+        """Instantiate a cache in 'cache_dir', defaulting to $DYNAPARSE_CACHE_DIR."""
+        if cache_dir is None:
+            cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+        if cache_dir is None:
+            raise Exception(
+                "No spec cache directory: pass 'cache_dir' or set %s"
+                % (CACHE_DIR_ENV_VAR)
+            )
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    @staticmethod
+    def is_enabled(cache_dir=None):
+        """Return whether a cache directory is given and the cache isn't disabled through the environment."""
+        if cache_dir is None and CACHE_DIR_ENV_VAR not in os.environ:
+            return False
+        return os.environ.get(DISABLE_CACHE_ENV_VAR, "0").lower() in ("", "0", "false")
+
+    def get_key(self, filename, trusted=False):
+        """Return the cache key for a spec file compiled with or without 'trusted'."""
+        import hashlib
+
+        digest = hashlib.sha256()
+        with open(filename, "rb") as fd:
+            for chunk in iter(lambda: fd.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(
+            (
+                "%s-py%d.%d-%s-trusted=%d"
+                % (
+                    (__version__,)
+                    + sys.version_info[:2]
+                    + (os.path.splitext(filename)[1].lower(), trusted)
+                )
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def get_path(self, key):
+        """Return the path of a cache entry."""
+        return os.path.join(self.cache_dir, key + ".pkl")
+
+    def load(self, key):
+        """Return a cached (raw_schema, schema) tuple, or None on a miss."""
+        import pickle
+
+        try:
+            with open(self.get_path(key), "rb") as fd:
+                if not self._is_private(os.fstat(fd.fileno())):
+                    return None
+                return pickle.load(fd)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _is_private(stat):
+        """Return whether a file is owned by the current user and only writable by them."""
+        import stat as stat_module
+
+        if stat.st_mode & (stat_module.S_IWGRP | stat_module.S_IWOTH):
+            return False
+        return not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+
+    def save(self, key, raw_schema, schema):
+        """Write a compiled spec to the cache, ignoring unwritable cache directories."""
+        import pickle
+        import tempfile
+
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_fd:
+                pickle.dump((raw_schema, schema), tmp_fd, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.get_path(key))
+        except Exception:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self):
+        """Remove all cache entries."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".pkl"):
+                os.remove(os.path.join(self.cache_dir, filename))
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ValidationIssue:
+    name: str
+    value: object
+    message: str
+    index: int = None
+
+
+@dataclass
+class ValidationReport:
+    """Collected validation failures, instead of stopping at the first one.
+
+    'index' is the position of the failing config in a batch, or None when a
+    single mapping was validated.
+    """
+
+    issues: list = field(default_factory=list)
+    num_checked: int = 0
+
+    def is_valid(self):
+        """Return whether no issues were found."""
+        return len(self.issues) == 0
+
+    def add_issue(self, name, value, message, index=None):
+        """Record a failing value."""
+        self.issues.append(ValidationIssue(name, value, message, index))
+
+    def get_invalid_names(self):
+        """Return the sorted names of parameters with at least one issue."""
+        return sorted({issue.name for issue in self.issues})
+
+    def get_invalid_indices(self):
+        """Return the sorted indices of configs with at least one issue."""
+        return sorted({issue.index for issue in self.issues if issue.index is not None})
+
+    def get_issues_by_index(self):
+        """Return a dictionary mapping config indices to their issues."""
+        issues_by_index = {}
+        for issue in self.issues:
+            issues_by_index.setdefault(issue.index, []).append(issue)
+        return issues_by_index
+
+    def raise_if_invalid(self):
+        """Raise an exception summarizing the issues, if any."""
+        if self.is_valid():
+            return
+        raise Exception(
+            "%d invalid value(s) found, first: %s"
+            % (len(self.issues), self.issues[0].message)
+        )
+
+    def to_dict(self):
+        """Return a dictionary representation of this report."""
+        return {
+            "num_checked": self.num_checked,
+            "issues": [
+                {
+                    "name": issue.name,
+                    "value": issue.value,
+                    "message": issue.message,
+                    "index": issue.index,
+                }
+                for issue in self.issues
+            ],
+        }
@@ -6,6 +6,12 @@ def read(fname):
     return open(os.path.join(os.path.dirname(__file__), fname)).read()
 
 
+def read_version():
+    namespace = {}
+    exec(read("dynaparse/version.py"), namespace)
+    return namespace["__version__"]
+
+
 classifiers = [
     "Development Status :: 3 - Alpha",
     "Intended Audience :: Developers",
@@ -18,14 +24,14 @@ classifiers = [
 
 install_requires = [
     "typeguard>=2.5,<3",
-    "numpy>=1.15.0,<2",
+    "numpy>=1.17.0,<2",
     "pydantic>=1.0,<2",
     "pyyaml>=3.13,<7",
 ]
 
 setup(
     name="dynaparse",
-    version="0.1a3",
+    version=read_version(),
     author="KUNGFU.AI",
     author_email="michael@kungfu.ai",
     description=(
@@ -33,10 +39,17 @@ setup(
     ),
     url="https://github.com/kungfuai/dynaparse",
     packages=find_packages(),
-    entry_points={"console_scripts": ["dynaparse = dynaparse.console:main"],},
+    entry_points={
+        "console_scripts": ["dynaparse = dynaparse.console:main"],
+    },
     include_package_data=True,
     download_url="",
     install_requires=install_requires,
+    extras_require={
+        "sobol": ["scipy>=1.7"],
+        "arrow": ["pyarrow>=8"],
+        "streaming": ["ijson>=3.1"],
+    },
     classifiers=classifiers,
     zip_safe=False,
 )
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def spec_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk spec cache of every test out of the home directory."""
+    cache_dir = tmp_path / "spec_cache"
+    monkeypatch.setenv("DYNAPARSE_CACHE_DIR", str(cache_dir))
+    return cache_dir
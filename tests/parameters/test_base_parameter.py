@@ -1,7 +1,10 @@
+from dataclasses import FrozenInstanceError
+import sys
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from dynaparse.parameters.base_parameter import BaseParameter
+from dynaparse.parameters.base_parameter import BaseParameter, trusted_construction
 
 
 def test_init_when_valid():
@@ -33,20 +36,20 @@ def test_init_when_required_type_invalid():
 
 def test_cast_when_int():
     bp = BaseParameter(name="test_param", help="test_param help", required=True)
-    bp.get_typefunc = lambda: int
-    assert bp.cast("1") == 1
+    with patch.object(BaseParameter, "get_typefunc", lambda self: int, create=True):
+        assert bp.cast("1") == 1
 
 
 def test_cast_when_none():
     bp = BaseParameter(name="test_param", help="test_param help", required=True)
-    bp.get_typefunc = lambda: int
-    assert bp.cast(None) is None
+    with patch.object(BaseParameter, "get_typefunc", lambda self: int, create=True):
+        assert bp.cast(None) is None
 
 
 def test_get_default():
     bp = BaseParameter(name="test_param", help="test_param help", required=True)
-    bp.default = "test"
-    assert bp.get_default() == "test"
+    with patch.object(BaseParameter, "default", "test", create=True):
+        assert bp.get_default() == "test"
 
 
 def test_get_name():
@@ -75,9 +78,14 @@ def test_is_list():
 
 def test_get_argparse_args_when_not_list():
     bp = BaseParameter(name="test_param", help="test_param help", required=True)
-    bp.get_argparse_type = lambda: "test_type"
-    bp.get_default = lambda: "test_default"
-    assert bp.get_argparse_args() == {
+    with patch.multiple(
+        BaseParameter,
+        get_argparse_type=lambda self: "test_type",
+        get_default=lambda self: "test_default",
+        create=True,
+    ):
+        argparse_args = bp.get_argparse_args()
+    assert argparse_args == {
         "type": "test_type",
         "default": "test_default",
         "help": "test_param help",
@@ -87,13 +95,50 @@ def test_get_argparse_args_when_not_list():
 
 def test_get_argparse_args_when_list():
     bp = BaseParameter(name="test_param", help="test_param help", required=True)
-    bp.get_argparse_type = lambda: "test_type"
-    bp.get_default = lambda: "test_default"
-    bp.is_list = lambda: True
-    assert bp.get_argparse_args() == {
+    with patch.multiple(
+        BaseParameter,
+        get_argparse_type=lambda self: "test_type",
+        get_default=lambda self: "test_default",
+        is_list=lambda self: True,
+        create=True,
+    ):
+        argparse_args = bp.get_argparse_args()
+    assert argparse_args == {
         "type": "test_type",
         "default": "test_default",
         "help": "test_param help",
         "required": True,
         "nargs": "+",
     }
+
+
+def test_init_when_trusted_construction():
+    with trusted_construction():
+        bp = BaseParameter(name=1, help="test", required=True)
+    assert bp.name == 1
+    with pytest.raises(TypeError):
+        BaseParameter(name=1, help="test", required=True)
+
+
+def test_init_when_frozen():
+    bp = BaseParameter(name="test_param", help="test_param help", required=True)
+    # Some CPython versions raise TypeError for new attributes of frozen slotted dataclasses
+    with pytest.raises((AttributeError, TypeError)):
+        bp.unknown_attribute = 1
+    with pytest.raises(FrozenInstanceError):
+        bp.name = "other_param"
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="Parameters are only slotted from Python 3.10"
+)
+def test_init_when_slotted():
+    bp = BaseParameter(name="test_param", help="test_param help", required=True)
+    assert not hasattr(bp, "__dict__")
+
+
+def test_pickle_round_trip():
+    import pickle
+
+    bp = BaseParameter(name="test_param", help="test_param help", required=True)
+    assert pickle.loads(pickle.dumps(bp)) == bp
@@ -2,6 +2,8 @@ import argparse
 import pytest
 import random
 
+import numpy as np
+
 from dynaparse.parameters.boolean_parameter import BooleanParameter
 from dynaparse.parameters.boolean_parameter import str2bool
 
@@ -82,3 +84,24 @@ def test_get_typefunc():
 def test_get_argparse_type():
     bp = BooleanParameter(default=True, **BASE_KWARGS)
     assert bp.get_argparse_type() == str2bool
+
+
+def test_sample_batch_when_is_constant():
+    bp = BooleanParameter(default=True, is_constant=True, **BASE_KWARGS)
+    assert bp.sample_batch(5, np.random.default_rng(0)).tolist() == [True] * 5
+
+
+def test_sample_batch_when_not_constant():
+    bp = BooleanParameter(default=True, is_constant=False, **BASE_KWARGS)
+    samples = bp.sample_batch(100, np.random.default_rng(0)).tolist()
+    assert set(samples) == {False, True}
+
+
+def test_from_unit():
+    u = np.array([0.1, 0.9])
+    bp = BooleanParameter(default=True, is_constant=False, **BASE_KWARGS)
+    assert bp.is_sampled() is True
+    assert bp.from_unit(u).tolist() == [False, True]
+    bp = BooleanParameter(default=True, **BASE_KWARGS)
+    assert bp.is_sampled() is False
+    assert bp.from_unit(u).tolist() == [True, True]
@@ -1,6 +1,9 @@
 import pytest
+import pickle
 import random
 
+import numpy as np
+
 from dynaparse.parameters.categorical_parameter import CategoricalParameter
 from dynaparse.parameters.string_parameter import str_with_none
 
@@ -55,3 +58,23 @@ def test_typefunc():
 def test_get_argparse_type():
     cp = CategoricalParameter(default="o1", options=["o1", "o2"], **BASE_KWARGS)
     assert cp.get_argparse_type() == str_with_none
+
+
+def test_sample_batch():
+    cp = CategoricalParameter(default="o1", options=["o1", "o2"], **BASE_KWARGS)
+    samples = cp.sample_batch(100, np.random.default_rng(0)).tolist()
+    assert len(samples) == 100
+    assert set(samples) == {"o1", "o2"}
+
+
+def test_typefunc_after_pickle():
+    cp = pickle.loads(
+        pickle.dumps(
+            CategoricalParameter(default="o1", options=["o1", "o2"], **BASE_KWARGS)
+        )
+    )
+    typefunc = cp.get_typefunc()
+    assert typefunc == cp.get_typefunc()
+    assert typefunc("o2") == "o2"
+    with pytest.raises(Exception):
+        typefunc("invalid")
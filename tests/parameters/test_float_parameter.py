@@ -99,3 +99,105 @@ def test_get_argparse_type():
         **BASE_KWARGS
     )
     assert fp.get_argparse_type() == float_with_none
+
+
+def test_sample_batch_when_uniform():
+    fp = FloatParameter(
+        default=1.0,
+        distribution="uniform",
+        p1=2.0,
+        p2=3.0,
+        parameter_type="float",
+        **BASE_KWARGS
+    )
+    samples = fp.sample_batch(100, np.random.default_rng(0))
+    assert samples.shape == (100,)
+    assert np.all((samples >= 2.0) & (samples < 3.0))
+
+
+def test_sample_batch_when_normal():
+    fp = FloatParameter(
+        default=1.0,
+        distribution="normal",
+        p1=2.0,
+        p2=3.0,
+        parameter_type="float",
+        **BASE_KWARGS
+    )
+    samples = fp.sample_batch(10, np.random.default_rng(0))
+    assert np.allclose(samples, np.random.default_rng(0).normal(2.0, 3.0, size=10))
+
+
+def test_sample_batch_when_distribution_invalid():
+    with pytest.raises(Exception):
+        FloatParameter(
+            default=1.0,
+            distribution="test",
+            p1=2.0,
+            p2=3.0,
+            parameter_type="float",
+            **BASE_KWARGS
+        ).sample_batch(10, np.random.default_rng(0))
+
+
+def test_from_unit_when_uniform():
+    fp = FloatParameter(default=1.0, p1=2.0, p2=4.0, **BASE_KWARGS)
+    assert fp.from_unit(np.array([0.0, 0.5, 0.75])).tolist() == [2.0, 3.0, 3.5]
+
+
+def test_from_unit_when_normal():
+    fp = FloatParameter(
+        default=1.0, distribution="normal", p1=2.0, p2=3.0, **BASE_KWARGS
+    )
+    samples = fp.from_unit(np.array([0.5, 0.975, 0.001]))
+    assert np.allclose(samples, [2.0, 2.0 + 3.0 * 1.959964, 2.0 - 3.0 * 3.090232])
+
+
+def test_sample_when_quantized_uniform():
+    fp = FloatParameter(
+        default=0.0,
+        distribution="quantized_uniform",
+        p1=0.0,
+        p2=1.0,
+        step=0.25,
+        **BASE_KWARGS
+    )
+    assert fp.sample() in fp.get_grid_axis()
+    samples = fp.sample_batch(100, np.random.default_rng(0))
+    assert set(samples.tolist()) == {0.0, 0.25, 0.5, 0.75, 1.0}
+    assert fp.from_unit(np.array([0.0, 0.5, 0.99])).tolist() == [0.0, 0.5, 1.0]
+
+
+def test_get_grid_axis():
+    fp = FloatParameter(
+        default=0.0,
+        distribution="quantized_uniform",
+        p1=0.0,
+        p2=1.0,
+        step=0.1,
+        **BASE_KWARGS
+    )
+    assert len(fp.get_grid_axis()) == 11
+    assert (
+        FloatParameter(default=0.0, p1=0.0, p2=1.0, **BASE_KWARGS).get_grid_axis()
+        is None
+    )
+
+
+def test_to_dict_when_step_default():
+    parameter = FloatParameter(default=0, p1=0, p2=10, **BASE_KWARGS)
+    assert "step" not in parameter.to_dict()
+    assert FloatParameter(**parameter.to_dict()) == parameter
+
+
+def test_to_dict_when_step():
+    parameter = FloatParameter(
+        default=0,
+        distribution="quantized_uniform",
+        p1=0,
+        p2=10,
+        step=0.5,
+        **BASE_KWARGS
+    )
+    assert parameter.to_dict()["step"] == 0.5
+    assert FloatParameter(**parameter.to_dict()) == parameter
@@ -1,6 +1,8 @@
 import pytest
 import random
 
+import numpy as np
+
 from dynaparse.parameters.int_parameter import IntParameter
 from dynaparse.parameters.int_parameter import int_with_none
 
@@ -80,3 +82,119 @@ def test_get_argparse_type():
         **BASE_KWARGS
     )
     assert ip.get_argparse_type() == int_with_none
+
+
+def test_sample_batch_when_uniform():
+    ip = IntParameter(
+        default=1,
+        distribution="uniform",
+        p1=2,
+        p2=3,
+        parameter_type="int",
+        **BASE_KWARGS
+    )
+    samples = ip.sample_batch(100, np.random.default_rng(0))
+    assert samples.shape == (100,)
+    assert set(samples.tolist()) == {2, 3}
+
+
+def test_sample_when_uniform_and_range_large():
+    ip = IntParameter(default=0, distribution="uniform", p1=0, p2=2**62, **BASE_KWARGS)
+    assert 0 <= ip.sample() <= 2**62
+    samples = ip.sample_batch(10, np.random.default_rng(0))
+    assert np.all((samples >= 0) & (samples <= 2**62))
+
+
+def test_sample_when_log_uniform():
+    random.seed(0)
+    ip = IntParameter(
+        default=1, distribution="log_uniform", p1=1, p2=1000, **BASE_KWARGS
+    )
+    samples = [ip.sample() for _ in range(100)]
+    assert all(1 <= s <= 1000 for s in samples)
+    samples = ip.sample_batch(1000, np.random.default_rng(0))
+    assert np.all((samples >= 1) & (samples <= 1000))
+    assert np.median(samples) < 500
+
+
+def test_sample_when_log_uniform_and_p1_not_power_of_e():
+    random.seed(0)
+    for p1 in [5, 7, 8]:
+        ip = IntParameter(
+            default=p1, distribution="log_uniform", p1=p1, p2=p1 + 1, **BASE_KWARGS
+        )
+        assert all(p1 <= ip.sample() <= p1 + 1 for _ in range(100))
+        samples = ip.sample_batch(100, np.random.default_rng(0))
+        assert np.all((samples >= p1) & (samples <= p1 + 1))
+        assert ip.from_unit(np.array([0.0])).tolist() == [p1]
+
+
+def test_sample_when_log_uniform_and_p1_invalid():
+    ip = IntParameter(
+        default=1, distribution="log_uniform", p1=0, p2=1000, **BASE_KWARGS
+    )
+    with pytest.raises(Exception):
+        ip.sample()
+
+
+def test_sample_when_quantized_uniform():
+    random.seed(0)
+    ip = IntParameter(
+        default=16,
+        distribution="quantized_uniform",
+        p1=16,
+        p2=130,
+        step=16,
+        **BASE_KWARGS
+    )
+    expected = {16, 32, 48, 64, 80, 96, 112, 128}
+    assert {ip.sample() for _ in range(200)} == expected
+    assert set(ip.sample_batch(200, np.random.default_rng(0)).tolist()) == expected
+
+
+def test_sample_when_normal():
+    random.seed(0)
+    ip = IntParameter(default=0, distribution="normal", p1=10, p2=2, **BASE_KWARGS)
+    assert isinstance(ip.sample(), int)
+    samples = ip.sample_batch(1000, np.random.default_rng(0))
+    assert samples.dtype == np.int64
+    assert abs(samples.mean() - 10) < 0.5
+
+
+def test_from_unit():
+    u = np.array([0.0, 0.4, 0.999999])
+    ip = IntParameter(default=1, p1=2, p2=4, **BASE_KWARGS)
+    assert ip.from_unit(u).tolist() == [2, 3, 4]
+    ip = IntParameter(
+        default=1, distribution="log_uniform", p1=1, p2=100, **BASE_KWARGS
+    )
+    assert ip.from_unit(u).tolist() == [1, 6, 100]
+    ip = IntParameter(
+        default=0, distribution="quantized_uniform", p1=0, p2=10, step=5, **BASE_KWARGS
+    )
+    assert ip.from_unit(u).tolist() == [0, 5, 10]
+    ip = IntParameter(default=0, distribution="normal", p1=10, p2=2, **BASE_KWARGS)
+    assert ip.from_unit(np.array([0.5])).tolist() == [10]
+
+
+def test_to_dict_when_step_default():
+    parameter = IntParameter(default=0, p1=0, p2=10, **BASE_KWARGS)
+    assert "step" not in parameter.to_dict()
+    assert IntParameter(**parameter.to_dict()) == parameter
+
+
+def test_to_dict_when_step():
+    parameter = IntParameter(
+        default=0, distribution="quantized_uniform", p1=0, p2=10, step=5, **BASE_KWARGS
+    )
+    assert parameter.to_dict()["step"] == 5
+    assert IntParameter(**parameter.to_dict()) == parameter
+
+
+def test_sample_batch_when_beyond_int64():
+    ip = IntParameter(default=0, p1=-(2**70), p2=2**70, **BASE_KWARGS)
+    samples = ip.sample_batch(100, np.random.default_rng(0)).tolist()
+    assert all(-(2**70) <= sample <= 2**70 for sample in samples)
+    assert max(abs(sample) for sample in samples) > 2**63
+    assert samples == ip.sample_batch(100, np.random.default_rng(0)).tolist()
+    assert ip.from_unit(np.array([0.0, 0.5, 1 - 1e-12])).tolist()[0] == -(2**70)
@@ -1,5 +1,6 @@
-from dynaparse.parameters.list_parameter import ListParameter
+import numpy as np
 
+from dynaparse.parameters.list_parameter import ListParameter
 
 BASE_KWARGS = {"name": "test_list", "help": "test_help", "required": True}
 
@@ -71,3 +72,26 @@ def test_is_list():
         default=[1, 2, 3], value_type="float", parameter_type="list", **BASE_KWARGS
     )
     assert lp.is_list() is True
+
+
+def test_that_sample_batch_returns_default():
+    lp = ListParameter(
+        default=[1, 2, 3], value_type="int", parameter_type="list", **BASE_KWARGS
+    )
+    assert lp.sample_batch(2, np.random.default_rng(0)).tolist() == [[1, 2, 3]] * 2
+
+
+def test_to_dict_and_pickle_when_derived_fields():
+    import pickle
+
+    lp = ListParameter(default=[1], value_type="int", **BASE_KWARGS)
+    assert lp.to_dict() == {
+        **BASE_KWARGS,
+        "default": [1],
+        "value_type": "int",
+        "parameter_type": "list",
+    }
+    unpickled = pickle.loads(pickle.dumps(lp))
+    assert unpickled == lp
+    assert unpickled.value_typefunc is int
+    assert unpickled.get_typefunc()(["2"]) == [2]
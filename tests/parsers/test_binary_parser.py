@@ -0,0 +1,59 @@
+import pytest
+
+from dynaparse import DynamicConfiguration
+from dynaparse.parsers.binary_parser import BinaryParser
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+
+SPEC_FILENAME = "tests/data/spec_example.json"
+CONFIG_FILENAME = "tests/data/config_example.json"
+
+records = [
+    {"a.b": 1, "c": 0.5, "d": True, "e": "é", "f": [1, 2], "g": None, "h": 2**70},
+    {"a.b": -2, "c": float("inf"), "d": False, "e": "", "f": [], "g": 1, "h": 0},
+    {"a.b": 3, "c": -1.0, "d": True, "e": "xyz", "f": [3], "g": "x", "h": 1},
+]
+
+
+def test_dump_and_load_records(tmp_path):
+    filename = str(tmp_path / "configs.dynb")
+    BinaryParser.dump_records(filename, records)
+    assert BinaryParser.is_binary(filename)
+    assert not BinaryParser.is_binary(CONFIG_FILENAME)
+    assert BinaryParser.load_records(filename) == records
+    columns, num_rows = BinaryParser.load_columns(filename)
+    assert num_rows == 3 and list(columns) != []
+    assert columns["e"] == ["é", "", "xyz"] and columns["h"] == [2**70, 0, 1]
+    with pytest.raises(Exception):
+        BinaryParser.load_flat_config(filename)
+    with pytest.raises(Exception):
+        BinaryParser.dump_records(filename, [{"a": 1}, {"b": 1}])
+
+
+def test_save_config_when_binary(tmp_path):
+    filename = str(tmp_path / "config.dynb")
+    dc = DynamicConfiguration(config=CONFIG_FILENAME, spec=SPEC_FILENAME)
+    dc.save_config(filename, format="binary")
+    assert ConfigurationFileParser.load_flat_config(
+        filename
+    ) == ConfigurationFileParser.load_flat_config(CONFIG_FILENAME)
+    dc2 = DynamicConfiguration(config=filename, spec=SPEC_FILENAME)
+    assert dc2.get_values() == dc.get_values()
+    dc3 = DynamicConfiguration(config=filename, spec=SPEC_FILENAME, streaming=True)
+    assert dc3.get_values() == dc.get_values()
+    with pytest.raises(Exception):
+        dc.save_config(filename, format="xml")
+
+
+def test_save_spec_when_binary(tmp_path):
+    filename = str(tmp_path / "spec.dynb")
+    dc = DynamicConfiguration(spec=SPEC_FILENAME)
+    dc.save_spec(filename, format="binary")
+    assert dc.spec == filename
+    dc2 = DynamicConfiguration(spec=filename, config=CONFIG_FILENAME, use_cache=False)
+    assert dc2._raw_schema == dc._raw_schema
+    assert (
+        dc2.get_values()
+        == DynamicConfiguration(spec=SPEC_FILENAME, config=CONFIG_FILENAME).get_values()
+    )
+    with pytest.raises(Exception):
+        BinaryParser.load_columns(filename)
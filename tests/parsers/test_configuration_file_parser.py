@@ -113,3 +113,69 @@ def test_get_parameter_type_when_param_list():
 def test_get_parameter_type_when_param_value():
     test_value = 0
     assert ConfigurationFileParser._get_parameter_type(test_value) == "parameter_value"
+
+
+def test_has_parameter_children_when_nested():
+    nested = [{"section": [{"subsection": [raw_spec[0]]}]}]
+    assert ConfigurationFileParser._has_parameter_children(nested) is True
+    assert ConfigurationFileParser._has_parameter_children([{"a": [1]}]) is False
+
+
+def test_has_parameter_children_when_not_last():
+    assert ConfigurationFileParser._has_parameter_children([raw_spec[0], {"a": 1}])
+
+
+def test_flatten_nested_structure_when_spec():
+    flat_spec = ConfigurationFileParser._flatten_nested_structure(raw_spec)
+    assert list(flat_spec) == [
+        "boolean_parameter_1",
+        "categorical_parameter_1",
+        "float_parameter_1",
+        "list_parameter_1",
+        "nested_section.int_parameter_1",
+        "nested_section.str_parameter_1",
+    ]
+    assert (
+        flat_spec["nested_section.int_parameter_1"] == raw_spec[4]["nested_section"][0]
+    )
+
+
+def test_flatten_nested_structure_when_config():
+    assert ConfigurationFileParser._flatten_nested_structure(raw_config) == {
+        "boolean_parameter_1": False,
+        "categorical_parameter_1": "option2",
+        "float_parameter_1": 2.0,
+        "list_parameter_1": [2, 1, 0],
+        "nested_section.str_parameter_1": "test",
+        "nested_section.int_parameter_1": 2,
+    }
+
+
+def test_flatten_nested_structure_when_kwarg_list():
+    augmentations = [{"type": "flip", "p": 0.5}, {"type": "crop"}]
+    assert ConfigurationFileParser._flatten_nested_structure(
+        {"data": {"augmentations": augmentations, "empty": {}}}
+    ) == {"data.augmentations": augmentations}
+
+
+def test_expand_flat_structure_when_config():
+    flat_config = ConfigurationFileParser._flatten_nested_structure(raw_config)
+    assert ConfigurationFileParser._expand_flat_structure(flat_config, False) == (
+        raw_config
+    )
+
+
+def test_expand_flat_structure_when_spec():
+    flat_spec = ConfigurationFileParser._flatten_nested_structure(raw_spec)
+    assert ConfigurationFileParser._expand_flat_structure(flat_spec, True) == raw_spec
+
+
+def test_expand_flat_structure_when_spec_deeply_nested():
+    parameter = {"name": "p", "help": "", "required": True, "default": 1}
+    flat_spec = {"p": parameter, "a.b.c.p": parameter, "a.p": parameter}
+    expanded = ConfigurationFileParser._expand_flat_structure(flat_spec, True)
+    assert expanded == [
+        parameter,
+        {"a": [parameter, {"b": [{"c": [parameter]}]}]},
+    ]
+    assert ConfigurationFileParser._flatten_nested_structure(expanded) == flat_spec
@@ -1,4 +1,5 @@
 from argparse import ArgumentDefaultsHelpFormatter
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import unittest
 import sys
@@ -142,6 +143,186 @@ class TestDynamicArgumentParser(unittest.TestCase):
         assert args.random_sample is False
         assert args.spec == "tests/data/spec_example.json"
 
+    def test_parse_args_when_sampler(self):
+        values = []
+        for index in range(3):
+            sys.argv = [
+                "script.sh",
+                "--spec",
+                "tests/data/spec_example.json",
+                "--dynaparse_sampler",
+                "lhs",
+                "--dynaparse_sampler_size",
+                "3",
+                "--dynaparse_sampler_index",
+                str(index),
+            ]
+            args = get_sample_parser()().parse_args()
+            values.append(args.categorical_parameter_1)
+        assert sorted(values) == ["option1", "option2", "option3"]
+
+    def test_parse_args_when_sampler_argument(self):
+        sys.argv = ["script.sh", "--sampler", "weighted"]
+        args = get_sample_parser("--sampler", type=str)().parse_args()
+        assert args.sampler == "weighted"
+        assert args.dynaparse_sampler is None
+
+    def test_parse_args_when_seeded_random_sample(self):
+        sys.argv = [
+            "script.sh",
+            "--spec",
+            "tests/data/spec_example.json",
+            "--random_sample",
+            "--dynaparse_sampler_seed",
+            "3",
+            "--dynaparse_sampler_index",
+            "2",
+        ]
+        tp = get_sample_parser()()
+        args = tp.parse_args()
+        values = tp._dynamic_config.sample_trial(2, seed=3)
+        assert args.float_parameter_1 == values["float_parameter_1"]
+        assert args.categorical_parameter_1 == values["categorical_parameter_1"]
+        assert args.nested_section.int_parameter_1 == (
+            values["nested_section.int_parameter_1"]
+        )
+
+    def test_parse_args_when_lazy_dynamic_args(self):
+        argv = [
+            "script.sh",
+            "--spec",
+            "tests/data/spec_example.json",
+            "--config",
+            "tests/data/config_example.json",
+            "--float_parameter_1=5.0",
+            "--nested_section.int_parameter_1",
+            "5",
+        ]
+        sys.argv = argv[:]
+        expected = vars(get_sample_parser()().parse_args())
+        sys.argv = argv[:]
+        tp = DynamicArgumentParser(lazy_dynamic_args=True)
+        args = tp.parse_args()
+        assert "--float_parameter_1" in tp._option_string_actions
+        assert "--categorical_parameter_1" not in tp._option_string_actions
+        assert args.float_parameter_1 == 5.0
+        assert args.nested_section.int_parameter_1 == 5
+        assert args.nested_section.str_parameter_1 == "test"
+        assert vars(args).keys() == expected.keys()
+        for name in ["boolean_parameter_1", "categorical_parameter_1"]:
+            assert getattr(args, name) == expected[name]
+
+    def test_parse_args_when_lazy_dynamic_args_and_help(self):
+        sys.argv = ["script.sh", "--spec", "tests/data/spec_example.json", "-h"]
+        tp = DynamicArgumentParser(lazy_dynamic_args=True)
+        with pytest.raises(SystemExit):
+            tp.parse_args()
+        assert "--categorical_parameter_1" in tp.format_help()
+
+    def test_parse_args_when_frozen_namespace(self):
+        sys.argv = [
+            "script.sh",
+            "--spec",
+            "tests/data/spec_example.json",
+            "--nested_section.int_parameter_1",
+            "5",
+        ]
+        args = DynamicArgumentParser(frozen_namespace=True).parse_args()
+        assert args.nested_section.int_parameter_1 == 5
+        assert args.categorical_parameter_1 == "option1"
+        with pytest.raises(AttributeError):
+            args.nested_section.int_parameter_1 = 6
+
+    def test_parse_from_when_same_as_parse_args(self):
+        spec_argv = ["--spec", "tests/data/spec_example.json"]
+        config_argv = ["--config", "tests/data/config_example.json"]
+        for argv in [
+            spec_argv,
+            spec_argv + config_argv,
+            spec_argv
+            + config_argv
+            + [
+                "--boolean_parameter_1",
+                "false",
+                "--list_parameter_1",
+                "5",
+                "6",
+                "--nested_section.int_parameter_1=5",
+            ],
+            spec_argv + ["--dynaparse_sampler", "lhs", "--dynaparse_sampler_size", "3"],
+            spec_argv + ["--random_sample", "--dynaparse_sampler_seed", "3"],
+            config_argv,
+        ]:
+            sys.argv = ["script.sh"] + argv
+            expected = get_sample_parser()().parse_args()
+            sys.argv = ["script.sh"]
+            args = get_sample_parser()().parse_from(argv=argv)
+            assert vars(args) == vars(expected), argv
+
+    def test_parse_from_when_config_and_overrides(self):
+        sys.argv = ["script.sh"]
+        tp = DynamicArgumentParser()
+        argv = ["--spec", "tests/data/spec_example.json", "--float_parameter_1", "3"]
+        args = tp.parse_from(
+            config="tests/data/config_example.json",
+            overrides={"nested_section": {"int_parameter_1": "7"}},
+            argv=argv,
+        )
+        assert args.float_parameter_1 == 3.0
+        assert args.categorical_parameter_1 == "option2"
+        assert args.nested_section.int_parameter_1 == 7
+        assert args.spec == "tests/data/spec_example.json"
+        assert sys.argv == ["script.sh"]
+        with pytest.raises(Exception):
+            tp.parse_from(overrides={"categorical_parameter_1": "option4"}, argv=argv)
+
+    def test_parse_args_when_explicit_argv(self):
+        sys.argv = ["script.sh", "--spec", "missing.json"]
+        argv = ["--spec", "tests/data/spec_example.json", "--float_parameter_1", "3"]
+        args = DynamicArgumentParser(argv=argv).parse_args()
+        assert args.float_parameter_1 == 3.0
+        assert args.nested_section.int_parameter_1 == 1
+        assert sys.argv == ["script.sh", "--spec", "missing.json"]
+
+    def test_parse_args_when_concurrent(self):
+        def parse(i):
+            argv = [
+                "--spec",
+                "tests/data/spec_example.json",
+                "--nested_section.int_parameter_1",
+                str(i),
+            ]
+            if i % 2 == 0:
+                argv += ["--config", "tests/data/config_example.json"]
+            args = DynamicArgumentParser(
+                argv=argv, lazy_dynamic_args=i % 3 == 0
+            ).parse_args()
+            return args.nested_section.int_parameter_1, args.categorical_parameter_1
+
+        sys.argv = ["script.sh"]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse, range(2000)))
+        assert results == [
+            (i, "option2" if i % 2 == 0 else "option1") for i in range(2000)
+        ]
+        assert sys.argv == ["script.sh"]
+
+    def test_parse_from_when_concurrent(self):
+        sys.argv = ["script.sh"]
+        tp = DynamicArgumentParser()
+        argv = ["--spec", "tests/data/spec_example.json"]
+
+        def parse(i):
+            args = tp.parse_from(
+                overrides={"nested_section.int_parameter_1": i},
+                argv=argv + ["--list_parameter_1", str(i), str(i + 1)],
+            )
+            return args.nested_section.int_parameter_1, args.list_parameter_1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse, range(5000)))
+        assert results == [(i, [i, i + 1]) for i in range(5000)]
+
     def test_when_spec_argname_conflict(self):
         Parser = get_sample_parser("--spec", type=int, default=None)
         with pytest.raises(Exception):
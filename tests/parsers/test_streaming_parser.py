@@ -0,0 +1,139 @@
+import io
+import json
+import math
+import pytest
+
+from dynaparse import DynamicConfiguration
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.parsers.streaming_parser import StreamingParser
+
+TEST_FILENAMES = [
+    "tests/data/spec_example.json",
+    "tests/data/config_example.json",
+    "tests/data/config_example.yaml",
+]
+
+
+def get_flat_items(text, chunk_size):
+    events = StreamingParser._iter_json_events(io.StringIO(text), chunk_size)
+    return list(StreamingParser._flatten_events(events))
+
+
+@pytest.mark.parametrize("filename", TEST_FILENAMES)
+def test_iter_flat_items_when_file(filename):
+    expected = ConfigurationFileParser.load_flat_config(filename)
+    assert list(StreamingParser.iter_flat_items(filename)) == list(expected.items())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 4096])
+def test_iter_flat_items_when_chunked(chunk_size):
+    filename = "tests/data/spec_example.json"
+    expected = ConfigurationFileParser.load_flat_spec(filename)
+    flat_items = StreamingParser.iter_flat_items(filename, chunk_size=chunk_size)
+    assert list(flat_items) == list(expected.items())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_flatten_events_when_values(chunk_size):
+    raw = {
+        "numbers": [1, -2, 2.5e3, -0.5, 1e-3],
+        "literals": [True, False, None],
+        "text": 'quoted "value" é',
+        "nested": {"kwargs": [{"k": 1}, {"k": 2}], "empty": {}, "deep": {"a": 1}},
+    }
+    text = json.dumps(raw)
+    expected = ConfigurationFileParser._flatten_nested_structure(raw)
+    assert get_flat_items(text, chunk_size) == list(expected.items())
+
+
+def test_flatten_events_when_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        get_flat_items('{"a": tru}', 3)
+
+
+MALFORMED_JSON = [
+    '{"a" 1}',
+    "[1 2]",
+    '{"a": 1,, "b": 2}',
+    '{"a": 1,}',
+    '{"a": {"b": 1}]',
+    "{1: 2}",
+    '{"a": 1} 2',
+    '{"a": 1',
+    '{"a": [1, 2',
+    '{"a": "b',
+    "",
+]
+
+
+@pytest.mark.parametrize("backend", ["python", "ijson", None])
+@pytest.mark.parametrize("text", MALFORMED_JSON)
+@pytest.mark.parametrize("chunk_size", [1, 4096])
+def test_iter_flat_items_when_malformed(tmp_path, backend, text, chunk_size):
+    if backend == "ijson":
+        pytest.importorskip("ijson")
+    filename = str(tmp_path / "config.json")
+    with open(filename, "w") as fd:
+        fd.write(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(
+            StreamingParser.iter_flat_items(
+                filename, chunk_size=chunk_size, backend=backend
+            )
+        )
+
+
+@pytest.mark.parametrize("filename", TEST_FILENAMES[:2])
+def test_iter_flat_items_when_ijson(filename):
+    pytest.importorskip("ijson")
+    expected = ConfigurationFileParser.load_flat_config(filename)
+    flat_items = StreamingParser.iter_flat_items(filename, backend="ijson")
+    assert list(flat_items) == list(expected.items())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4096])
+def test_iter_flat_items_when_beyond_ijson(tmp_path, chunk_size):
+    filename = str(tmp_path / "config.json")
+    with open(filename, "w") as fd:
+        fd.write('{"a": 1, "b": {"c": 123456789012345678901234567890}, "d": NaN}')
+    flat_items = list(StreamingParser.iter_flat_items(filename, chunk_size=chunk_size))
+    expected = ConfigurationFileParser.load_flat_config(filename)
+    assert [name for name, _ in flat_items] == list(expected)
+    assert flat_items[:2] == [("a", 1), ("b.c", 123456789012345678901234567890)]
+    assert math.isnan(flat_items[2][1])
+    if StreamingParser.has_ijson():
+        with pytest.raises(json.JSONDecodeError):
+            list(StreamingParser.iter_flat_items(filename, backend="ijson"))
+
+
+def test_iter_yaml_events():
+    with open("tests/data/config_example.yaml", "r") as fd:
+        events = list(StreamingParser._iter_yaml_events(fd))
+    assert events[:3] == [
+        ("start_map", None),
+        ("map_key", "boolean_parameter_1"),
+        ("scalar", False),
+    ]
+    assert events[-1] == ("end_map", None)
+
+
+def test_dynamic_configuration_when_streaming():
+    kwargs = {
+        "config": "tests/data/config_example.yaml",
+        "spec": "tests/data/spec_example.json",
+        "use_cache": False,
+    }
+    streamed = DynamicConfiguration(streaming=True, **kwargs)
+    loaded = DynamicConfiguration(**kwargs)
+    assert streamed._raw_schema == loaded._raw_schema
+    assert streamed._schema == loaded._schema
+    assert streamed.get_values() == loaded.get_values()
+
+
+def test_dynamic_configuration_when_streaming_without_spec():
+    streamed = DynamicConfiguration(
+        config="tests/data/config_example.json", streaming=True
+    )
+    loaded = DynamicConfiguration(config="tests/data/config_example.json")
+    assert streamed._raw_schema == loaded._raw_schema
+    assert streamed.get_values() == loaded.get_values()
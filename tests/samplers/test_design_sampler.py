@@ -0,0 +1,14 @@
+import pytest
+
+from dynaparse.samplers.base_sampler import BaseSampler
+from dynaparse.samplers.design_sampler import DesignSampler
+from dynaparse.samplers.trial_sampler import TrialSampler
+
+
+def test_init_when_abstract():
+    with pytest.raises(TypeError):
+        BaseSampler()
+    with pytest.raises(TypeError):
+        DesignSampler()
+    assert isinstance(TrialSampler(0), BaseSampler)
+    assert not isinstance(TrialSampler(0), DesignSampler)
@@ -0,0 +1,85 @@
+import itertools
+import pytest
+
+from dynaparse.parameters.boolean_parameter import BooleanParameter
+from dynaparse.parameters.categorical_parameter import CategoricalParameter
+from dynaparse.parameters.float_parameter import FloatParameter
+from dynaparse.parameters.int_parameter import IntParameter
+from dynaparse.samplers.grid_sampler import GridSampler
+
+BASE_KWARGS = {"help": "test_help", "required": True}
+
+SCHEMA = {
+    "c": CategoricalParameter(
+        name="c", default="a", options=["a", "b", "c"], **BASE_KWARGS
+    ),
+    "b": BooleanParameter(name="b", default=True, is_constant=False, **BASE_KWARGS),
+    "i": IntParameter(
+        name="i",
+        default=0,
+        distribution="quantized_uniform",
+        p1=0,
+        p2=10,
+        step=5,
+        **BASE_KWARGS
+    ),
+    "f": FloatParameter(
+        name="f",
+        default=0.0,
+        distribution="quantized_uniform",
+        p1=0.0,
+        p2=0.2,
+        step=0.1,
+        **BASE_KWARGS
+    ),
+    "u": FloatParameter(name="u", default=0.5, p1=0.0, p2=1.0, **BASE_KWARGS),
+}
+
+
+def get_expected_points():
+    return [
+        {"c": c, "b": b, "i": i, "f": f, "u": 0.5}
+        for c, b, i, f in itertools.product(
+            ["a", "b", "c"], [False, True], [0, 5, 10], [0.0, 0.1, 0.2]
+        )
+    ]
+
+
+def test_iter_and_getitem():
+    grid = GridSampler(SCHEMA)
+    expected = get_expected_points()
+    assert len(grid) == 54
+    assert [{**point, "f": round(point["f"], 9)} for point in grid] == expected
+    assert grid[17]["c"] == "a" and grid[17]["i"] == 10 and grid[-1]["c"] == "c"
+    assert grid[17] == list(grid)[17]
+    with pytest.raises(IndexError):
+        grid[54]
+
+
+def test_shard():
+    grid = GridSampler(SCHEMA)
+    shards = [grid.shard(shard_index, 4) for shard_index in range(4)]
+    assert [len(shard) for shard in shards] == [13, 14, 13, 14]
+    assert [point for shard in shards for point in shard] == list(grid)
+    assert [index for index, _ in shards[1].iter_indexed()] == list(range(13, 27))
+    assert shards[1][0] == grid[13]
+    with pytest.raises(Exception):
+        grid.shard(4, 4)
+
+
+def test_len_when_huge():
+    schema = {
+        str(k): IntParameter(
+            name=str(k),
+            default=0,
+            distribution="quantized_uniform",
+            p1=0,
+            p2=999,
+            **BASE_KWARGS
+        )
+        for k in range(4)
+    }
+    grid = GridSampler(schema)
+    assert len(grid) == 10**12
+    assert grid[10**12 - 1] == {str(k): 999 for k in range(4)}
+    assert next(iter(grid.shard(3, 4)))["0"] == 750
@@ -0,0 +1,37 @@
+import numpy as np
+
+from dynaparse.parameters.categorical_parameter import CategoricalParameter
+from dynaparse.parameters.float_parameter import FloatParameter
+from dynaparse.parameters.list_parameter import ListParameter
+from dynaparse.samplers.latin_hypercube_sampler import LatinHypercubeSampler
+
+BASE_KWARGS = {"help": "test_help", "required": True}
+
+
+def test_sample_unit_is_stratified():
+    unit = LatinHypercubeSampler(seed=0).sample_unit(10, 3)
+    assert unit.shape == (10, 3)
+    for dimension in range(3):
+        assert sorted(np.floor(unit[:, dimension] * 10).tolist()) == list(range(10))
+
+
+def test_sample_unit_when_seeded():
+    assert np.array_equal(
+        LatinHypercubeSampler(seed=1).sample_unit(5, 2),
+        LatinHypercubeSampler(seed=1).sample_unit(5, 2),
+    )
+
+
+def test_sample():
+    schema = {
+        "f": FloatParameter(name="f", default=0.0, p1=0.0, p2=1.0, **BASE_KWARGS),
+        "c": CategoricalParameter(
+            name="c", default="a", options=["a", "b"], **BASE_KWARGS
+        ),
+        "l": ListParameter(name="l", default=[1], value_type="int", **BASE_KWARGS),
+    }
+    columns = LatinHypercubeSampler(seed=0).sample(schema, 4)
+    assert list(columns) == ["f", "c", "l"]
+    assert sorted(np.floor(columns["f"] * 4).tolist()) == [0, 1, 2, 3]
+    assert sorted(columns["c"].tolist()) == ["a", "a", "b", "b"]
+    assert columns["l"].tolist() == [[1]] * 4
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from dynaparse.samplers.sampler_factory import SamplerFactory
+from dynaparse.samplers.sobol_sampler import SobolSampler
+
+pytest.importorskip("scipy")
+
+
+def test_sample_unit():
+    unit = SobolSampler(seed=0).sample_unit(8, 2)
+    assert unit.shape == (8, 2)
+    assert ((unit >= 0) & (unit < 1)).all()
+    # The first 8 points of a Sobol sequence fill each of 8 strata once
+    assert sorted(np.floor(unit[:, 0] * 8).tolist()) == list(range(8))
+
+
+def test_sample_unit_when_no_dimensions():
+    assert SobolSampler(seed=0).sample_unit(3, 0).shape == (3, 0)
+
+
+def test_get_sampler_when_invalid():
+    assert isinstance(SamplerFactory.get_sampler("sobol"), SobolSampler)
+    with pytest.raises(Exception):
+        SamplerFactory.get_sampler("invalid")
@@ -0,0 +1,36 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from dynaparse import DynamicConfiguration
+from dynaparse.samplers.trial_sampler import TrialSampler
+
+SPEC = "tests/data/spec_example.json"
+
+
+def sample_trial(index):
+    return DynamicConfiguration(spec=SPEC).sample_trial(index, seed=7)
+
+
+def test_sample_trial_is_reproducible():
+    dc = DynamicConfiguration(spec=SPEC)
+    trials = [dc.sample_trial(index, seed=7) for index in range(4)]
+    assert dc.sample_trial(3, seed=7) == trials[3]
+    assert dc.sample_trial(3, seed=8) != trials[3]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(sample_trial, [3, 0])) == [trials[3], trials[0]]
+
+
+def test_sample_matches_sample_trial():
+    dc = DynamicConfiguration(spec=SPEC)
+    records = dc.sample_design(5, sampler="random", seed=7, as_records=True)
+    assert records == [dc.sample_trial(index, seed=7) for index in range(5)]
+    columns = TrialSampler(7).sample(dc._schema, 2, start_index=3)
+    assert columns["float_parameter_1"].tolist() == [
+        records[3]["float_parameter_1"],
+        records[4]["float_parameter_1"],
+    ]
+
+
+def test_init_when_no_seed():
+    sampler = TrialSampler()
+    assert isinstance(sampler.seed, int)
+    assert TrialSampler(sampler.seed).get_rng(2).random() == sampler.get_rng(2).random()
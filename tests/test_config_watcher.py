@@ -0,0 +1,157 @@
+import json
+import os
+import shutil
+import time
+
+from dynaparse import DynamicConfiguration, LayeredConfiguration
+
+SPEC_FILENAME = "tests/data/spec_example.json"
+CONFIG_FILENAME = "tests/data/config_example.json"
+
+
+def write_json(filename, contents, version):
+    """Write a JSON file and give it a distinct modification time."""
+    with open(filename, "w") as fd:
+        json.dump(contents, fd)
+    os.utime(filename, ns=(version * 10**9, version * 10**9))
+
+
+def load_config(tmp_path):
+    """Return a spec-backed configuration loaded from copies of the example files."""
+    spec = str(tmp_path / "spec.json")
+    config = str(tmp_path / "config.json")
+    shutil.copy(SPEC_FILENAME, spec)
+    shutil.copy(CONFIG_FILENAME, config)
+    with open(CONFIG_FILENAME) as fd:
+        contents = json.load(fd)
+    return DynamicConfiguration(config=config, spec=spec, use_cache=False), contents
+
+
+def test_poll_when_config_changes(tmp_path):
+    dc, contents = load_config(tmp_path)
+    deltas = []
+    watcher = dc.watch(callback=deltas.append, start=False)
+    assert watcher.poll() is None
+    snapshot = watcher.snapshot
+    contents["float_parameter_1"] = 3.5
+    contents["nested_section"]["int_parameter_1"] = "4"
+    del contents["categorical_parameter_1"]
+    write_json(dc.config, contents, 1)
+    delta = watcher.poll()
+    assert deltas == [delta] and delta.version == 1
+    assert delta.changed == {
+        "float_parameter_1": (2.0, 3.5),
+        "nested_section.int_parameter_1": (2, 4),
+        "categorical_parameter_1": ("option2", "option1"),
+    }
+    assert delta.added == {} and delta.removed == {}
+    assert watcher.snapshot.values["nested_section.int_parameter_1"] == 4
+    assert snapshot.values["float_parameter_1"] == 2.0
+    assert dc.get_values() == watcher.snapshot.get_values()
+
+
+def test_poll_when_config_is_invalid(tmp_path):
+    dc, contents = load_config(tmp_path)
+    errors = []
+    watcher = dc.watch(on_error=errors.append, start=False)
+    contents["float_parameter_1"] = 3.5
+    contents["nested_section"]["int_parameter_1"] = "four"
+    write_json(dc.config, contents, 1)
+    assert watcher.poll() is None
+    assert errors[0].get_invalid_names() == ["nested_section.int_parameter_1"]
+    assert watcher.snapshot.version == 0
+    assert dc.get_values()["float_parameter_1"] == 2.0
+    with open(dc.config, "w") as fd:
+        fd.write("{")
+    os.utime(dc.config, ns=(2 * 10**9, 2 * 10**9))
+    assert watcher.poll() is None and len(errors) == 2
+
+
+def test_poll_when_spec_changes(tmp_path):
+    dc, _ = load_config(tmp_path)
+    watcher = dc.watch(start=False)
+    with open(dc.spec) as fd:
+        spec = json.load(fd)
+    spec[1]["options"].append("option4")
+    spec[1]["default"] = "option4"
+    spec.append(
+        {
+            "name": "new_parameter",
+            "help": "",
+            "required": True,
+            "default": 5,
+            "parameter_type": "int",
+        }
+    )
+    write_json(dc.spec, spec, 1)
+    delta = watcher.poll()
+    assert delta.spec_changed
+    assert delta.added == {"new_parameter": 5}
+    assert delta.changed == {} and delta.removed == {}
+    assert dc._schema["categorical_parameter_1"].options[-1] == "option4"
+
+
+def test_watch_when_inferred_and_layered(tmp_path):
+    config = str(tmp_path / "config.json")
+    write_json(config, {"a": 1, "b": {"c": "x"}}, 1)
+    lc = LayeredConfiguration(config=config, use_cache=False)
+    deltas = []
+    with lc.watch(callback=deltas.append, interval=0.01) as watcher:
+        write_json(config, {"a": 2, "d": [1, 2]}, 2)
+        deadline = time.time() + 5
+        while not deltas and time.time() < deadline:
+            time.sleep(0.01)
+    assert deltas[0].changed == {"a": (1, 2)}
+    assert deltas[0].added == {"d": [1, 2]}
+    assert deltas[0].removed == {"b.c": "x"}
+    assert watcher.snapshot.get_values(expand=True) == {"a": 2, "d": [1, 2]}
+    assert lc.get_values() == {"a": 2, "d": [1, 2]}
+
+
+def test_poll_when_rejected_config_then_spec_changes(tmp_path):
+    spec = str(tmp_path / "spec.json")
+    config = str(tmp_path / "config.json")
+    parameter = {"help": "", "required": True, "parameter_type": "int"}
+    write_json(spec, [dict(name="a", default=1, **parameter)], 1)
+    write_json(config, {"a": 2}, 1)
+    dc = DynamicConfiguration(config=config, spec=spec, use_cache=False)
+    errors = []
+    watcher = dc.watch(on_error=errors.append, start=False)
+    write_json(config, {"a": 3, "b": 7}, 2)
+    assert watcher.poll() is None
+    assert watcher.poll() is None and len(errors) == 1
+    write_json(
+        spec,
+        [
+            dict(name="a", default=1, **parameter),
+            dict(name="b", default=1, **parameter),
+        ],
+        2,
+    )
+    delta = watcher.poll()
+    assert delta.changed == {"a": (2, 3)} and delta.added == {"b": 7}
+    assert dict(watcher.snapshot.values) == {"a": 3, "b": 7}
+
+
+def test_poll_when_callback_raises(tmp_path, caplog):
+    dc, contents = load_config(tmp_path)
+    errors = []
+    deltas = []
+    watcher = dc.watch(on_error=errors.append, start=False)
+
+    def fail(delta):
+        raise ValueError("failed")
+
+    watcher.add_callback(fail)
+    watcher.add_callback(deltas.append)
+    contents["float_parameter_1"] = 3.5
+    write_json(dc.config, contents, 1)
+    delta = watcher.poll()
+    assert delta.changed == {"float_parameter_1": (2.0, 3.5)}
+    assert deltas == [delta] and errors == []
+    assert "ValueError: failed" in caplog.text
+    contents["nested_section"]["int_parameter_1"] = 4
+    write_json(dc.config, contents, 2)
+    delta = watcher.poll()
+    assert delta.changed == {"nested_section.int_parameter_1": (2, 4)}
+    assert deltas == [deltas[0], delta] and errors == []
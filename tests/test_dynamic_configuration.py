@@ -1,5 +1,9 @@
+import asyncio
+import json
 import warnings
 
+import pytest
+
 from dynaparse import DynamicConfiguration
 
 test_config_1 = {"A": 1, "B": "Btest", "C": [3, 4, 5], "nested": {"AA": 11}}
@@ -57,3 +61,128 @@ def test_merge_when_not_inplace():
         "nested.AA": 11,
     }
     assert len(dc3.get_values()) == 5
+
+
+def test_sample_batch_when_columnar():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    columns = dc.sample_batch(8, seed=0)
+    assert set(columns) == set(dc.get_values())
+    assert all(len(column) == 8 for column in columns.values())
+    assert columns["float_parameter_1"].tolist() == [1.0] * 8
+    assert set(columns["categorical_parameter_1"].tolist()) <= {
+        "option1",
+        "option2",
+        "option3",
+    }
+
+
+def test_sample_batch_when_records():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    records = dc.sample_batch(3, seed=0, as_records=True)
+    assert len(records) == 3
+    assert records[0].keys() == dc.get_values().keys()
+    assert records[0]["list_parameter_1"] == [0, 1, 2]
+    assert isinstance(records[0]["nested_section.int_parameter_1"], int)
+
+
+def test_sample_batch_when_seeded():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    assert dc.sample_batch(5, seed=1, as_records=True) == dc.sample_batch(
+        5, seed=1, as_records=True
+    )
+
+
+def test_set_values():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    report = dc.set_values(
+        {
+            "float_parameter_1": "2.5",
+            "nested_section.int_parameter_1": "x",
+            "unknown": 1,
+        }
+    )
+    assert dc.get_values()["float_parameter_1"] == 2.5
+    assert report.get_invalid_names() == ["nested_section.int_parameter_1", "unknown"]
+    assert report.to_dict()["num_checked"] == 3
+
+
+def test_validate_many():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    report = dc.validate_many(
+        [
+            {"float_parameter_1": 1.0},
+            {"nested_section": {"int_parameter_1": "x"}},
+            {"float_parameter_1": "y"},
+            "tests/data/config_example.json",
+        ]
+    )
+    assert report.get_invalid_indices() == [1, 2]
+    assert not report.is_valid()
+    assert (
+        dc.get_values()
+        == DynamicConfiguration(spec="tests/data/spec_example.json").get_values()
+    )
+
+
+def test_sample_design():
+    dc = DynamicConfiguration(spec="tests/data/spec_example.json")
+    columns = dc.sample_design(6, sampler="lhs", seed=0)
+    assert set(columns) == set(dc.get_values())
+    assert sorted(columns["categorical_parameter_1"].tolist()) == [
+        "option1",
+        "option1",
+        "option2",
+        "option2",
+        "option3",
+        "option3",
+    ]
+    assert dc.sample_design(6, seed=0, as_records=True) == dc.sample_design(
+        6, seed=0, as_records=True
+    )
+
+
+def test_aload():
+    spec = "tests/data/spec_example.json"
+    config = "tests/data/config_example.json"
+    dc = asyncio.run(DynamicConfiguration.aload(config=config, spec=spec))
+    assert (
+        dc.get_values() == DynamicConfiguration(config=config, spec=spec).get_values()
+    )
+    dc = asyncio.run(DynamicConfiguration.aload(config=test_config_1))
+    assert dc.get_values()["nested.AA"] == 11
+
+
+def test_aload_many(tmp_path):
+    spec = "tests/data/spec_example.json"
+    pairs = []
+    for i in range(50):
+        config = str(tmp_path / ("config_%d.json" % (i)))
+        with open(config, "w") as fd:
+            json.dump({"nested_section": {"int_parameter_1": i}}, fd)
+        pairs.append((config, spec))
+    pairs.append(({"float_parameter_1": "x"}, spec))
+    configs = asyncio.run(
+        DynamicConfiguration.aload_many(
+            pairs, max_concurrency=4, return_exceptions=True
+        )
+    )
+    assert [
+        dc.get_values()["nested_section.int_parameter_1"] for dc in configs[:-1]
+    ] == list(range(50))
+    assert isinstance(configs[-1], Exception)
+    with pytest.raises(Exception):
+        asyncio.run(DynamicConfiguration.aload_many(pairs[-1:]))
+
+
+def test_sample_when_default_mutated():
+    spec = "tests/data/spec_example.json"
+    dc = DynamicConfiguration(spec=spec)
+    other_dc = DynamicConfiguration(spec=spec)
+    records = dc.sample_batch(2, seed=0, as_records=True)
+    records += dc.sample_design(2, sampler="lhs", seed=0, as_records=True)
+    records += [dc.sample_trial(0), dc.get_grid()[0]]
+    for record in records:
+        record["list_parameter_1"].append(3)
+    assert records[0]["list_parameter_1"] is not records[1]["list_parameter_1"]
+    assert other_dc.get_values()["list_parameter_1"] == [0, 1, 2]
+    assert dc.sample_batch(1, as_records=True)[0]["list_parameter_1"] == [0, 1, 2]
@@ -0,0 +1,71 @@
+from dynaparse import DynamicConfiguration, LayeredConfiguration
+
+test_config_1 = {"A": 1, "B": "Btest", "C": [3, 4, 5], "nested": {"AA": 11}}
+test_config_2 = {"C": 6, "D": "Dtest"}
+merged_values = {"A": 1, "B": "Btest", "C": 6, "D": "Dtest", "nested.AA": 11}
+
+
+def test_merge_when_inplace():
+    lc = LayeredConfiguration(config=test_config_1)
+    dc2 = DynamicConfiguration(config=test_config_2)
+    lc3 = lc.merge_with(dc2, inplace=True)
+    assert lc3 is lc
+    assert lc.get_values() == merged_values
+    assert list(lc.get_values()) == list(
+        DynamicConfiguration(config=test_config_1).merge_with(dc2).get_values()
+    )
+    assert dc2.get_values() == {"C": 6, "D": "Dtest"}
+
+
+def test_merge_when_not_inplace():
+    lc = LayeredConfiguration(config=test_config_1)
+    lc3 = lc.merge_with(LayeredConfiguration(config=test_config_2))
+    assert lc.get_values() == {"A": 1, "B": "Btest", "C": [3, 4, 5], "nested.AA": 11}
+    assert lc3.get_values() == merged_values
+
+
+def test_set_value_is_copy_on_write():
+    dc2 = DynamicConfiguration(config=test_config_2)
+    lc = LayeredConfiguration(config=test_config_1)
+    lc.set_value("A", 2)
+    branch = lc.merge_with(dc2)
+    branch.set_value("D", "changed")
+    lc.set_value("A", 3)
+    assert branch.get_values()["A"] == 2
+    assert branch.get_values()["D"] == "changed"
+    assert lc.get_values()["A"] == 3
+    assert dc2.get_values()["D"] == "Dtest"
+
+
+def test_merge_when_source_mutated_after_merge():
+    for source in [
+        DynamicConfiguration(config=test_config_2),
+        LayeredConfiguration(config=test_config_2),
+    ]:
+        lc = LayeredConfiguration(config=test_config_1).merge_with(source)
+        source.set_value("D", "unread")
+        assert lc.get_values()["D"] == "Dtest"
+        source.set_value("D", "read")
+        source.set_value("C", 7)
+        assert lc.get_values()["D"] == "Dtest"
+        assert lc.get_values()["C"] == 6
+
+
+def test_merge_overrides_earlier_writes():
+    lc = LayeredConfiguration(config=test_config_1)
+    lc.set_value("C", [1])
+    lc.merge_with(DynamicConfiguration(config=test_config_2), inplace=True)
+    assert lc.get_values()["C"] == 6
+    assert lc.get_num_layers() == 4
+
+
+def test_flatten():
+    lc = LayeredConfiguration(config=test_config_1)
+    lc.merge_with(DynamicConfiguration(config=test_config_2), inplace=True)
+    flat = lc.flatten()
+    assert type(flat) is DynamicConfiguration
+    assert type(flat._schema) is dict
+    assert flat.get_values() == merged_values
+    assert lc.flatten(inplace=True) is lc
+    assert lc.get_num_layers() == 2
+    assert lc.get_values() == merged_values
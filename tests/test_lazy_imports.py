@@ -0,0 +1,52 @@
+import pytest
+import subprocess
+import sys
+
+
+def get_loaded_modules(statement):
+    code = statement + "\nimport sys\nprint(','.join(sorted(sys.modules)))"
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+    return set(output.strip().split(","))
+
+
+def test_import_when_no_spec():
+    modules = get_loaded_modules(
+        "import sys\n"
+        "sys.argv = ['script.sh']\n"
+        "from dynaparse import DynamicArgumentParser\n"
+        "DynamicArgumentParser().parse_args()"
+    )
+    assert "dynaparse.dynamic_configuration" in modules
+    for heavy_module in ["numpy", "pydantic", "typeguard", "yaml"]:
+        assert heavy_module not in modules
+
+
+def test_import_when_json_spec_and_config():
+    modules = get_loaded_modules(
+        "from dynaparse import DynamicConfiguration\n"
+        "DynamicConfiguration(\n"
+        "    config='tests/data/config_example.json',\n"
+        "    spec='tests/data/spec_example.json',\n"
+        "    use_cache=False,\n"
+        ")"
+    )
+    for heavy_module in ["numpy", "pydantic", "yaml"]:
+        assert heavy_module not in modules
+
+
+def test_import_when_yaml_config():
+    modules = get_loaded_modules(
+        "from dynaparse import DynamicConfiguration\n"
+        "DynamicConfiguration(config='tests/data/config_example.yaml')"
+    )
+    assert "yaml" in modules
+    assert "pydantic" not in modules
+
+
+def test_getattr_when_unknown():
+    import dynaparse
+
+    with pytest.raises(AttributeError):
+        dynaparse.UnknownClass
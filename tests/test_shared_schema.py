@@ -0,0 +1,91 @@
+from concurrent.futures import ProcessPoolExecutor
+import gc
+import multiprocessing
+import os
+import pickle
+
+import pytest
+
+from dynaparse import DynamicConfiguration
+from dynaparse.shared_schema import SharedSchema
+
+SPEC = "tests/data/spec_example.json"
+CONFIG = "tests/data/config_example.json"
+
+
+def get_int_parameter(shared_schema):
+    parameter = shared_schema["nested_section.int_parameter_1"]
+    return (
+        os.getpid(),
+        parameter.parameter_type,
+        shared_schema.get_value("nested_section.int_parameter_1"),
+    )
+
+
+def test_create_and_lookup(tmp_path):
+    dc = DynamicConfiguration(config=CONFIG, spec=SPEC)
+    filename = str(tmp_path / "shared.schema")
+    with SharedSchema.create(dc, filename) as shared_schema:
+        assert list(shared_schema) == list(dc._schema)
+        assert len(shared_schema) == len(dc._schema)
+        assert "float_parameter_1" in shared_schema
+        assert "missing" not in shared_schema
+        assert shared_schema["float_parameter_1"].p2 == 1.0
+        assert (
+            shared_schema.get_parameter_dict("float_parameter_1")
+            == dc._raw_schema["float_parameter_1"]
+        )
+        assert shared_schema["float_parameter_1"] is shared_schema["float_parameter_1"]
+        assert shared_schema.get_values() == dc.get_values()
+        assert shared_schema.get_value("categorical_parameter_1") == "option2"
+        with pytest.raises(KeyError):
+            shared_schema["missing"]
+        other_dc = shared_schema.to_dynamic_config()
+        assert other_dc.get_values() == dc.get_values()
+        assert other_dc._raw_schema == dc._raw_schema
+    assert not os.path.exists(filename)
+
+
+def test_create_when_optional_without_value(tmp_path):
+    dc = DynamicConfiguration(config={"a": 1})
+    dc._raw_schema["b"] = dict(
+        name="b", help="", required=False, default=2, parameter_type="int"
+    )
+    dc._append_parameter_from_dict("b", dc._raw_schema["b"], trusted=True)
+    with SharedSchema.create(dc, str(tmp_path / "shared.schema")) as shared_schema:
+        assert "b" in shared_schema
+        assert shared_schema.get_values() == dc.get_values() == {"a": 1}
+        assert shared_schema.get_values(["a", "b"]) == {"a": 1}
+        with pytest.raises(KeyError):
+            shared_schema.get_value("b")
+        assert shared_schema.to_dynamic_config().get_values() == {"a": 1}
+
+
+def test_create_when_not_closed():
+    shared_schema = DynamicConfiguration(config={"a": 1}).share()
+    filename = shared_schema.filename
+    assert os.path.exists(filename)
+    del shared_schema
+    gc.collect()
+    assert not os.path.exists(filename)
+
+
+def test_pickle_when_attached(tmp_path):
+    dc = DynamicConfiguration(config={"a": 1, "b": {"c": [1, 2]}})
+    with dc.share(str(tmp_path / "shared.schema")) as shared_schema:
+        attached = pickle.loads(pickle.dumps(shared_schema))
+        assert attached.get_values() == {"a": 1, "b.c": [1, 2]}
+        attached.close()
+        assert os.path.exists(shared_schema.filename)
+
+
+def test_share_with_spawned_workers():
+    dc = DynamicConfiguration(config=CONFIG, spec=SPEC)
+    with dc.share() as shared_schema:
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = list(executor.map(get_int_parameter, [shared_schema] * 4))
+    assert {result[1:] for result in results} == {("int", 2)}
+    assert all(pid != os.getpid() for pid, _, _ in results)
+    assert not os.path.exists(shared_schema.filename)
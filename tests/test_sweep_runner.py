@@ -0,0 +1,105 @@
+import json
+import sys
+
+from dynaparse import SweepRunner
+from dynaparse.sweep_runner import resolve_target
+from dynaparse.console import run_sweep
+
+SPEC = "tests/data/spec_example.json"
+
+SCRIPT = """
+from dynaparse import DynamicArgumentParser
+
+args = DynamicArgumentParser().parse_args()
+assert args.categorical_parameter_1 in ["option1", "option2", "option3"]
+"""
+
+
+def get_int_parameter(config):
+    return config["nested_section"]["int_parameter_1"]
+
+
+def fail(config):
+    raise ValueError("failed")
+
+
+def test_run_when_callable(tmp_path):
+    output = str(tmp_path / "sweep.jsonl")
+    runner = SweepRunner(
+        SPEC, get_int_parameter, num_samples=6, output=output, max_workers=2, seed=0
+    )
+    summary = runner.run()
+    assert summary == {"num_trials": 6, "num_failed": 0, "seed": 0, "output": output}
+    with open(output) as fd:
+        records = [json.loads(line) for line in fd]
+    assert sorted(record["index"] for record in records) == list(range(6))
+    configs = runner.get_configs()
+    for record in records:
+        assert record["error"] is None
+        assert record["config"] == configs[record["index"]]
+        assert record["result"] == record["config"]["nested_section.int_parameter_1"]
+
+
+def test_run_when_module_target_fails():
+    runner = SweepRunner(
+        SPEC, "tests.test_sweep_runner:fail", num_samples=3, max_workers=1
+    )
+    records = list(runner.iter_results())
+    assert [record["error"] for record in records] == ["ValueError: failed"] * 3
+    summary = runner.run()
+    assert (summary["num_trials"], summary["num_failed"]) == (3, 3)
+
+
+def test_run_sweep_when_script(tmp_path, monkeypatch):
+    script = tmp_path / "script.py"
+    script.write_text(SCRIPT)
+    monkeypatch.setenv("PYTHONPATH", ":".join(sys.path))
+    output = str(tmp_path / "sweep.jsonl")
+    num_failed = run_sweep(
+        [
+            "--spec",
+            SPEC,
+            "--target",
+            str(script),
+            "--num_samples",
+            "2",
+            "--output",
+            output,
+            "--workers",
+            "2",
+        ]
+    )
+    assert num_failed == 0
+    with open(output) as fd:
+        assert [json.loads(line)["result"] for line in fd] == [0, 0]
+
+
+def test_run_when_grid_shard():
+    runner = SweepRunner(
+        SPEC,
+        get_int_parameter,
+        num_samples=None,
+        max_workers=1,
+        sampler="grid",
+        shard_index=1,
+        num_shards=2,
+    )
+    records = list(runner.iter_results())
+    assert [record["index"] for record in records] == [1, 2]
+    assert [record["config"]["categorical_parameter_1"] for record in records] == [
+        "option2",
+        "option3",
+    ]
+
+
+def test_resolve_target_when_relative_to_working_directory(tmp_path, monkeypatch):
+    (tmp_path / "sweep_target_module.py").write_text(
+        "def target(config):\n    return 1\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    path = list(sys.path)
+    try:
+        assert resolve_target("sweep_target_module:target")({}) == 1
+        assert sys.path == path
+    finally:
+        sys.modules.pop("sweep_target_module", None)
@@ -0,0 +1,83 @@
+import pytest
+
+from dynaparse import DynamicConfiguration, SweepRunner
+from dynaparse.trial_archive import TrialArchive
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+SPEC = "tests/data/spec_example.json"
+CONFIG = "tests/data/config_example.json"
+
+
+def get_int_parameter(config):
+    return config["nested_section"]["int_parameter_1"]
+
+
+def test_get_arrow_schema():
+    dc = DynamicConfiguration(spec=SPEC)
+    arrow_schema = TrialArchive.get_arrow_schema(dc, {"result": pa.float64()})
+    assert arrow_schema.field("nested_section.int_parameter_1").type == pa.int64()
+    assert arrow_schema.field("float_parameter_1").type == pa.float64()
+    assert arrow_schema.field("boolean_parameter_1").type == pa.bool_()
+    assert arrow_schema.field("categorical_parameter_1").type == pa.dictionary(
+        pa.int32(), pa.string()
+    )
+    assert arrow_schema.field("list_parameter_1").type == pa.list_(pa.int64())
+    assert arrow_schema.names[-1] == "result"
+
+
+def test_append_and_iter_configs(tmp_path):
+    filename = str(tmp_path / "trials.parquet")
+    dc = DynamicConfiguration(config=CONFIG, spec=SPEC)
+    records = dc.sample_batch(10, seed=0, as_records=True)
+    with TrialArchive(filename, dc, row_group_size=4) as archive:
+        archive.extend(records)
+    table = TrialArchive.read_table(filename)
+    assert table.num_rows == 10
+    assert pq.ParquetFile(filename).num_row_groups == 3
+    configs = list(TrialArchive.iter_configs(filename, batch_size=3))
+    assert [config.get_values() for config in configs] == records
+    configs = TrialArchive.load_configs(filename, DynamicConfiguration(spec=SPEC))
+    assert [config.get_values() for config in configs] == records
+
+
+def test_iter_configs_when_optional_missing(tmp_path):
+    dc = DynamicConfiguration(config={"a": 1})
+    dc._raw_schema["b"] = dict(
+        name="b", help="", required=False, default=2, parameter_type="int"
+    )
+    dc._append_parameter_from_dict("b", dc._raw_schema["b"], trusted=True)
+    records = [{"a": 1}, {"a": 2, "b": 5}]
+    filename = str(tmp_path / "trials.parquet")
+    with TrialArchive(filename, dc) as archive:
+        archive.extend(records)
+    configs = TrialArchive.load_configs(filename)
+    assert [config.get_values() for config in configs] == records
+    assert "b" not in configs[0]._values
+    assert configs[0]._schema is configs[1]._schema
+
+
+def test_to_table_when_list_of_dicts(tmp_path):
+    dc = DynamicConfiguration(config={"ints": [1, 2], "dicts": [{"a": 1}]})
+    records = [{"ints": [1, 2], "dicts": [{"a": 1}]}, {"ints": [], "dicts": []}]
+    table = TrialArchive.to_table(dc, records)
+    assert table.column("dicts").type == pa.list_(pa.string())
+    filename = str(tmp_path / "trials.parquet")
+    pq.write_table(table, filename)
+    configs = TrialArchive.load_configs(filename)
+    assert [config.get_values() for config in configs] == records
+
+
+def test_run_sweep_to_archive(tmp_path):
+    output = str(tmp_path / "sweep.parquet")
+    runner = SweepRunner(
+        SPEC, get_int_parameter, num_samples=5, output=output, max_workers=1, seed=0
+    )
+    assert runner.run()["num_trials"] == 5
+    table = TrialArchive.read_table(output).sort_by("trial.index")
+    assert table.column("trial.index").to_pylist() == list(range(5))
+    assert table.column("trial.error").to_pylist() == [None] * 5
+    assert table.column("nested_section.int_parameter_1").to_pylist() == [
+        config["nested_section.int_parameter_1"] for config in runner.get_configs()
+    ]
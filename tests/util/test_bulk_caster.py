@@ -0,0 +1,74 @@
+from dynaparse.parameters.boolean_parameter import BooleanParameter
+from dynaparse.parameters.categorical_parameter import CategoricalParameter
+from dynaparse.parameters.float_parameter import FloatParameter
+from dynaparse.parameters.int_parameter import IntParameter
+from dynaparse.parameters.list_parameter import ListParameter
+from dynaparse.util.bulk_caster import BulkCaster, INVALID
+
+BASE_KWARGS = {"help": "test_help", "required": True}
+
+SCHEMA = {
+    "i1": IntParameter(name="i1", default=1, **BASE_KWARGS),
+    "i2": IntParameter(name="i2", default=1, **BASE_KWARGS),
+    "f": FloatParameter(name="f", default=1.0, **BASE_KWARGS),
+    "b": BooleanParameter(name="b", default=True, **BASE_KWARGS),
+    "c": CategoricalParameter(name="c", default="a", options=["a", "b"], **BASE_KWARGS),
+    "l": ListParameter(name="l", default=[1], value_type="int", **BASE_KWARGS),
+}
+
+
+def test_cast_columns_matches_cast():
+    columns = {
+        "i1": ["1", 2, 3.7, None, "None", True],
+        "i2": [2**70, "4"],
+        "f": ["1.5", 2, None],
+        "b": [0, 1],
+        "c": ["a", "b"],
+        "l": [["1", 2]],
+    }
+    casted_columns, report = BulkCaster.cast_columns(SCHEMA, columns)
+    assert report.is_valid()
+    assert report.num_checked == 16
+    for name, values in columns.items():
+        assert casted_columns[name] == [SCHEMA[name].cast(v) for v in values]
+    assert type(casted_columns["i1"][0]) is int
+    assert type(casted_columns["f"][0]) is float
+
+
+def test_cast_columns_when_big_or_lossy_ints():
+    columns = {
+        "i1": [1e20, 2**60 + 1, 0.5],
+        "i2": [2**63, -1, 2**64],
+    }
+    casted_columns, report = BulkCaster.cast_columns(SCHEMA, columns)
+    assert report.is_valid()
+    assert casted_columns["i1"] == [10**20, 2**60 + 1, 0]
+    for name, values in columns.items():
+        assert casted_columns[name] == [SCHEMA[name].cast(v) for v in values]
+    report = BulkCaster.validate_columns(SCHEMA, {"i1": [1, float("inf")]})
+    assert [(issue.name, issue.value) for issue in report.issues] == [
+        ("i1", float("inf"))
+    ]
+
+
+def test_cast_columns_when_invalid():
+    casted_columns, report = BulkCaster.cast_columns(
+        SCHEMA,
+        {"i1": ["1", "x", "3"], "c": ["z"], "unknown": [1]},
+        indices={"i1": [0, 1, 2], "c": [2], "unknown": [1]},
+    )
+    assert casted_columns["i1"] == [1, INVALID, 3]
+    assert casted_columns["c"] == [INVALID]
+    assert casted_columns["unknown"] == [INVALID]
+    assert report.get_invalid_names() == ["c", "i1", "unknown"]
+    assert report.get_invalid_indices() == [1, 2]
+    assert [issue.value for issue in report.get_issues_by_index()[1]] == [1, "x"]
+
+
+def test_validate_columns():
+    report = BulkCaster.validate_columns(
+        SCHEMA,
+        {"i1": [1, 2, float("nan")], "i2": [1, 2], "f": [1.5, float("nan")]},
+    )
+    assert [(issue.name, issue.index) for issue in report.issues] == [("i1", None)]
+    assert report.num_checked == 7
@@ -0,0 +1,25 @@
+import numpy as np
+
+from dynaparse.util.distributions import normal_ppf
+
+# Standard normal quantiles of 0.001, 0.02, 0.3, 0.5, 0.7, 0.98 and 0.999
+PROBABILITIES = [0.001, 0.02, 0.3, 0.5, 0.7, 0.98, 0.999]
+QUANTILES = [
+    -3.090232306167813,
+    -2.053748910631823,
+    -0.5244005127080407,
+    0.0,
+    0.5244005127080407,
+    2.053748910631823,
+    3.090232306167813,
+]
+
+
+def test_normal_ppf():
+    np.testing.assert_allclose(normal_ppf(PROBABILITIES), QUANTILES, atol=1e-8)
+
+
+def test_normal_ppf_when_bounds():
+    quantiles = normal_ppf([0.0, 1.0])
+    assert np.all(np.isfinite(quantiles))
+    assert quantiles[0] < -7 < 7 < quantiles[1]
@@ -0,0 +1,38 @@
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from dynaparse.util.namespace_builder import FrozenNamespace, NamespaceBuilder
+
+flat_items = [("a", 1), ("b.c", 2), ("b.d.e", [3]), ("b.d.f", {"g": 4})]
+
+
+def test_build():
+    built = NamespaceBuilder.build(flat_items)
+    assert built == {
+        "a": 1,
+        "b": SimpleNamespace(c=2, d=SimpleNamespace(e=[3], f={"g": 4})),
+    }
+
+
+def test_build_when_name_conflict():
+    with pytest.raises(Exception):
+        NamespaceBuilder.build([("a", 1), ("a.b", 2)])
+    with pytest.raises(Exception):
+        NamespaceBuilder.build([("a.b", 2), ("a", 1)])
+
+
+def test_frozen_namespace():
+    namespace = FrozenNamespace(**NamespaceBuilder.build(flat_items, FrozenNamespace))
+    assert namespace.b.d.e == [3] and "a" in namespace
+    assert namespace.to_dict() == {
+        "a": 1,
+        "b": {"c": 2, "d": {"e": [3], "f": {"g": 4}}},
+    }
+    with pytest.raises(AttributeError):
+        namespace.a = 2
+    with pytest.raises(AttributeError):
+        namespace.missing
+    assert not hasattr(namespace, "__dict__")
+    assert pickle.loads(pickle.dumps(namespace)) == namespace
@@ -0,0 +1,98 @@
+import dataclasses
+import json
+
+import pytest
+from unittest.mock import patch
+
+from dynaparse import DynamicConfiguration
+from dynaparse.util.parse_cache import ParseCache
+
+SPEC_FILENAME = "tests/data/spec_example.json"
+CONFIG_FILENAME = "tests/data/config_example.json"
+
+
+def test_get_and_put_when_full():
+    cache = ParseCache(max_size=2)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    assert cache.get(("a",)) == 1
+    cache.put(("c",), 3)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1 and cache.get(("c",)) == 3
+    assert len(cache) == 2
+
+
+def test_get_key_when_file_changes(tmp_path):
+    filename = str(tmp_path / "config.json")
+    with open(filename, "w") as fd:
+        json.dump({"a": 1}, fd)
+    for value, cache in [(12, ParseCache()), (123, ParseCache(use_hash=True))]:
+        key = cache.get_key("config", filename)
+        assert cache.get_key("config", filename) == key
+        with open(filename, "w") as fd:
+            json.dump({"a": value}, fd)
+        assert cache.get_key("config", filename) != key
+
+
+def test_invalidate():
+    cache = ParseCache()
+    cache.put(cache.get_key("spec", SPEC_FILENAME), 1)
+    cache.put(cache.get_key("config", CONFIG_FILENAME), 2)
+    cache.invalidate(SPEC_FILENAME)
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_dynamic_configuration_shares_parameters(tmp_path):
+    DynamicConfiguration.invalidate_cache()
+    kwargs = dict(spec=SPEC_FILENAME, config=CONFIG_FILENAME, cache_dir=str(tmp_path))
+    first = DynamicConfiguration(**kwargs)
+    with patch(
+        "dynaparse.parsers.configuration_file_parser.ConfigurationFileParser.load_flat_config"
+    ) as patched_load:
+        second = DynamicConfiguration(**kwargs)
+        assert not patched_load.called
+    assert second.get_values() == first.get_values()
+    assert second._schema is not first._schema
+    for name, parameter in first._schema.items():
+        assert second._schema[name] is parameter
+    second.set_value("float_parameter_1", 3.5)
+    assert first.get_values()["float_parameter_1"] != 3.5
+
+
+def test_dynamic_configuration_when_config_only():
+    DynamicConfiguration.invalidate_cache(CONFIG_FILENAME)
+    first = DynamicConfiguration(config=CONFIG_FILENAME)
+    second = DynamicConfiguration(config=CONFIG_FILENAME)
+    assert second.get_values() == first.get_values()
+    assert second._raw_schema == first._raw_schema
+    assert all(second._schema[name] is first._schema[name] for name in first._schema)
+    third = DynamicConfiguration(config=CONFIG_FILENAME, use_cache=False)
+    assert (
+        third._schema[next(iter(first._schema))]
+        is not first._schema[next(iter(first._schema))]
+    )
+
+
+def test_memoized_values_when_mutated(tmp_path):
+    filename = str(tmp_path / "config.json")
+    with open(filename, "w") as fd:
+        json.dump({"aug": [{"p": 1}], "sizes": [1, 2]}, fd)
+    values = DynamicConfiguration(config=filename).get_values()
+    values["aug"][0]["p"] = 99
+    values["sizes"].append(3)
+    assert DynamicConfiguration(config=filename).get_values() == {
+        "aug": [{"p": 1}],
+        "sizes": [1, 2],
+    }
+
+
+def test_memoized_parameters_when_mutated():
+    dc = DynamicConfiguration(spec=SPEC_FILENAME)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        dc._schema["float_parameter_1"].default = 5.0
+    dc.get_values()["list_parameter_1"].append(3)
+    assert DynamicConfiguration(spec=SPEC_FILENAME).get_values()[
+        "list_parameter_1"
+    ] == [0, 1, 2]
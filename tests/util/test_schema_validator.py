@@ -0,0 +1,68 @@
+import pytest
+
+from dynaparse import DynamicConfiguration
+from dynaparse.parameters.categorical_parameter import CategoricalParameter
+from dynaparse.parameters.float_parameter import FloatParameter
+from dynaparse.parameters.int_parameter import IntParameter
+from dynaparse.parsers.configuration_file_parser import ConfigurationFileParser
+from dynaparse.util.schema_validator import SchemaValidator
+
+BASE_KWARGS = {"name": "test", "help": "test_help", "required": True}
+
+
+def test_build_parameter_when_valid():
+    parameter = SchemaValidator.build_parameter(
+        dict(parameter_type="int", default=1, p1=0, p2=2, **BASE_KWARGS)
+    )
+    assert parameter == IntParameter(default=1, p1=0, p2=2, **BASE_KWARGS)
+
+
+def test_build_parameter_when_int_for_float():
+    parameter = SchemaValidator.build_parameter(
+        dict(parameter_type="float", default=1, **BASE_KWARGS)
+    )
+    assert isinstance(parameter, FloatParameter)
+
+
+def test_build_parameter_when_invalid_type():
+    with pytest.raises(TypeError):
+        SchemaValidator.build_parameter(
+            dict(parameter_type="int", default="1", **BASE_KWARGS)
+        )
+
+
+def test_build_parameter_when_invalid_base_field():
+    with pytest.raises(TypeError):
+        SchemaValidator.build_parameter(
+            dict(parameter_type="str", default="a", name="a", help="", required=1)
+        )
+
+
+def test_build_parameter_when_unrecognized_type():
+    with pytest.raises(Exception):
+        SchemaValidator.build_parameter(
+            dict(parameter_type="test", default=1, **BASE_KWARGS)
+        )
+
+
+def test_build_parameter_when_default_not_in_options():
+    with pytest.raises(Exception):
+        SchemaValidator.build_parameter(
+            dict(
+                parameter_type="categorical", default="c", options=["a"], **BASE_KWARGS
+            )
+        )
+
+
+def test_build_schema_matches_strict_construction():
+    flat_spec = ConfigurationFileParser.load_flat_spec("tests/data/spec_example.json")
+    strict = DynamicConfiguration(spec="tests/data/spec_example.json", use_cache=False)
+    assert SchemaValidator.build_schema(flat_spec) == strict._schema
+
+
+def test_dynamic_configuration_when_trusted():
+    kwargs = {"spec": "tests/data/spec_example.json", "use_cache": False}
+    trusted = DynamicConfiguration(trusted=True, **kwargs)
+    strict = DynamicConfiguration(**kwargs)
+    assert trusted._schema == strict._schema
+    assert isinstance(trusted._schema["categorical_parameter_1"], CategoricalParameter)
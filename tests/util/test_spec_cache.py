@@ -0,0 +1,89 @@
+import os
+from unittest.mock import patch
+
+from dynaparse import DynamicConfiguration
+from dynaparse.util.spec_cache import SpecCache
+
+SPEC_FILENAME = "tests/data/spec_example.json"
+
+
+def test_get_key_when_same_contents(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    copied_filename = str(tmp_path / "spec.json")
+    with open(SPEC_FILENAME, "r") as fd_in, open(copied_filename, "w") as fd_out:
+        fd_out.write(fd_in.read())
+    assert cache.get_key(SPEC_FILENAME) == cache.get_key(copied_filename)
+
+
+def test_get_key_when_contents_differ(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    changed_filename = str(tmp_path / "spec.json")
+    with open(SPEC_FILENAME, "r") as fd_in, open(changed_filename, "w") as fd_out:
+        fd_out.write(fd_in.read().replace("option3", "option4"))
+    assert cache.get_key(SPEC_FILENAME) != cache.get_key(changed_filename)
+
+
+def test_load_when_missing(tmp_path):
+    assert SpecCache(str(tmp_path)).load("missing") is None
+
+
+def test_save_and_load(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    cache.save("key", {"a": {"name": "a"}}, {"a": 1})
+    assert cache.load("key") == ({"a": {"name": "a"}}, {"a": 1})
+    cache.clear()
+    assert cache.load("key") is None
+
+
+def test_is_enabled():
+    with patch.dict(os.environ, {"DYNAPARSE_DISABLE_SPEC_CACHE": "1"}):
+        assert SpecCache.is_enabled() is False
+    with patch.dict(os.environ, {"DYNAPARSE_DISABLE_SPEC_CACHE": "0"}):
+        assert SpecCache.is_enabled() is True
+
+
+def test_dynamic_configuration_when_warm(tmp_path):
+    DynamicConfiguration.invalidate_cache()  # Exercise the disk cache only
+    cold = DynamicConfiguration(spec=SPEC_FILENAME, cache_dir=str(tmp_path))
+    assert len(os.listdir(str(tmp_path))) == 1
+    DynamicConfiguration.invalidate_cache()
+    with patch(
+        "dynaparse.parsers.configuration_file_parser.ConfigurationFileParser.load_flat_spec"
+    ) as patched_load:
+        warm = DynamicConfiguration(spec=SPEC_FILENAME, cache_dir=str(tmp_path))
+        assert not patched_load.called
+    assert warm._raw_schema == cold._raw_schema
+    assert warm._schema == cold._schema
+    assert warm.get_values() == cold.get_values()
+
+
+def test_dynamic_configuration_when_cache_disabled(tmp_path):
+    DynamicConfiguration(spec=SPEC_FILENAME, use_cache=False, cache_dir=str(tmp_path))
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_get_key_when_trusted_or_format_differs(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    renamed_filename = str(tmp_path / "spec.bin")
+    with open(SPEC_FILENAME, "r") as fd_in, open(renamed_filename, "w") as fd_out:
+        fd_out.write(fd_in.read())
+    keys = {
+        cache.get_key(SPEC_FILENAME),
+        cache.get_key(SPEC_FILENAME, trusted=True),
+        cache.get_key(renamed_filename),
+    }
+    assert len(keys) == 3
+
+
+def test_is_enabled_when_no_cache_dir(tmp_path):
+    with patch.dict(os.environ):
+        os.environ.pop("DYNAPARSE_CACHE_DIR", None)
+        assert SpecCache.is_enabled() is False
+        assert SpecCache.is_enabled(str(tmp_path)) is True
+
+
+def test_load_when_writable_by_others(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    cache.save("key", {"a": {"name": "a"}}, {"a": 1})
+    os.chmod(cache.get_path("key"), 0o666)
+    assert cache.load("key") is None